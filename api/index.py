@@ -3,6 +3,7 @@ import sys
 import os
 import logging
 import io
+import hashlib
 import threading
 from typing import Optional
 
@@ -16,7 +17,7 @@ API_VERSION = "2.0"
 # Ensure backend modules can be imported
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import FastAPI, UploadFile, File, Form
+from fastapi import FastAPI, UploadFile, File, Form, Header
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
@@ -58,7 +59,11 @@ def get_analyzer():
             if _analyzer is None and _analyzer_error is None:
                 try:
                     from backend.resume_analyzer import ResumeAnalyzer
-                    _analyzer = ResumeAnalyzer()
+                    from backend.cache_backends import create_cache_backend
+                    from backend.skill_taxonomy import watch_taxonomy
+                    _analyzer = ResumeAnalyzer(cache=create_cache_backend('analysis'))
+                    # Picks up an edited SKILL_TAXONOMY_PATH without a redeploy
+                    watch_taxonomy(_analyzer.reload_taxonomy)
                     logger.info("ResumeAnalyzer initialized successfully")
                 except ImportError as e:
                     _analyzer_error = f"Analyzer dependencies not available: {e}"
@@ -71,6 +76,26 @@ def get_analyzer():
         raise RuntimeError(_analyzer_error)
     return _analyzer
 
+# Extracted text cache, shared between replicas when CACHE_BACKEND=redis
+_text_cache = None
+_text_cache_ready = False
+_text_cache_lock = threading.Lock()
+
+def get_text_cache():
+    """Lazily create the extracted-text cache; None if caching is disabled or unavailable"""
+    global _text_cache, _text_cache_ready
+    
+    if not _text_cache_ready:
+        with _text_cache_lock:
+            if not _text_cache_ready:
+                try:
+                    from backend.cache_backends import create_cache_backend
+                    _text_cache = create_cache_backend('text')
+                except Exception as e:
+                    logger.warning(f"Text cache unavailable: {e}")
+                _text_cache_ready = True
+    return _text_cache
+
 def extract_text_from_upload(upload: UploadFile) -> str:
     """Extract text from file with proper error handling and validation"""
     try:
@@ -82,38 +107,65 @@ def extract_text_from_upload(upload: UploadFile) -> str:
         
         upload.file.seek(0)
         
-        # Validate file type and extract text
-        if (upload.content_type and "pdf" in upload.content_type) or \
-           (upload.filename and upload.filename.lower().endswith(".pdf")):
-            try:
-                reader = PdfReader(io.BytesIO(content))
-                pages = []
-                for page in reader.pages:
-                    try:
-                        text = page.extract_text() or ""
-                        pages.append(text)
-                    except Exception as e:
-                        logger.warning(f"Failed to extract text from page: {e}")
-                        pages.append("")
-                text = "\n".join(pages).strip()
-                if not text:
-                    raise ValueError("No text could be extracted from PDF")
-                return text
-            except Exception as e:
-                raise ValueError(f"Failed to process PDF: {str(e)}")
+        # Identical uploads skip extraction, which dominates the cost for PDFs
+        text_cache = get_text_cache()
+        cache_key = ':'.join((
+            hashlib.sha256(content).hexdigest(),
+            upload.content_type or '',
+            (upload.filename or '').rsplit('.', 1)[-1].lower()
+        ))
+        if text_cache is not None:
+            cached = text_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        elif upload.filename and upload.filename.lower().endswith(".txt"):
+        text = _extract_text(upload, content)
+        if text_cache is not None:
+            text_cache.set(cache_key, text)
+        return text
+    
+    except Exception as e:
+        logger.error(f"File processing error: {e}")
+        raise
+
+def _extract_text(upload: UploadFile, content: bytes) -> str:
+    """Extract text from the raw bytes of an upload"""
+    from backend.profiling import stage
+    
+    # Validate file type and extract text
+    if (upload.content_type and "pdf" in upload.content_type) or \
+       (upload.filename and upload.filename.lower().endswith(".pdf")):
+        with stage('extract.pdf'):
+            return _extract_pdf_text(content)
+    
+    elif upload.filename and upload.filename.lower().endswith(".txt"):
+        with stage('extract.txt'):
             try:
                 return content.decode("utf-8", errors="ignore").strip()
             except Exception as e:
                 raise ValueError(f"Failed to process text file: {str(e)}")
-        
-        else:
-            raise ValueError("Unsupported file type. Please upload PDF or TXT files only")
     
+    else:
+        raise ValueError("Unsupported file type. Please upload PDF or TXT files only")
+
+def _extract_pdf_text(content: bytes) -> str:
+    """Extract the text of every page of a PDF upload"""
+    try:
+        reader = PdfReader(io.BytesIO(content))
+        pages = []
+        for page in reader.pages:
+            try:
+                text = page.extract_text() or ""
+                pages.append(text)
+            except Exception as e:
+                logger.warning(f"Failed to extract text from page: {e}")
+                pages.append("")
+        text = "\n".join(pages).strip()
+        if not text:
+            raise ValueError("No text could be extracted from PDF")
+        return text
     except Exception as e:
-        logger.error(f"File processing error: {e}")
-        raise
+        raise ValueError(f"Failed to process PDF: {str(e)}")
 
 @app.get("/")
 def root():
@@ -136,6 +188,48 @@ def status():
     """Check if the analyzer is ready. For Vercel, always return ready since we can do lazy loading."""
     return {"ready": True, "message": "API is operational", "version": API_VERSION}
 
+def is_admin(x_admin_token: Optional[str]) -> bool:
+    """Check the X-Admin-Token header against ADMIN_TOKEN; admin endpoints are disabled while it is unset"""
+    import hmac
+    from backend.config import config
+    return bool(config.ADMIN_TOKEN) and hmac.compare_digest(x_admin_token or "", config.ADMIN_TOKEN)
+
+def forbidden():
+    return JSONResponse(status_code=403, content={"ok": False, "error": "Forbidden"})
+
+@app.get("/api/profile")
+def profile(x_admin_token: Optional[str] = Header(None)):
+    """Per-stage timing histograms of this process (requires ENABLE_PROFILING and ADMIN_TOKEN)"""
+    if not is_admin(x_admin_token):
+        return forbidden()
+    from backend import profiling
+    return {"ok": True, "enabled": profiling.is_enabled(), "stages": profiling.snapshot()}
+
+@app.delete("/api/profile")
+def reset_profile(x_admin_token: Optional[str] = Header(None)):
+    """Discard the timings recorded by this process (requires ADMIN_TOKEN)"""
+    if not is_admin(x_admin_token):
+        return forbidden()
+    from backend import profiling
+    profiling.reset()
+    return {"ok": True}
+
+@app.post("/api/admin/reload-taxonomy")
+def reload_taxonomy(x_admin_token: Optional[str] = Header(None)):
+    """Recompile the skill taxonomy from SKILL_TAXONOMY_PATH and swap it in (requires ADMIN_TOKEN)"""
+    if not is_admin(x_admin_token):
+        return forbidden()
+    try:
+        analyzer = get_analyzer()
+    except RuntimeError as e:
+        return JSONResponse(status_code=503, content={"ok": False, "error": f"Service unavailable: {str(e)}"})
+    try:
+        version = analyzer.reload_taxonomy()
+    except (OSError, ValueError) as e:
+        # The previous taxonomy stays in use
+        return JSONResponse(status_code=422, content={"ok": False, "error": f"Could not reload taxonomy: {e}"})
+    return {"ok": True, "taxonomy_version": version}
+
 @app.get("/analyze")
 def analyze_page():
     """Serve upload interface for resume analysis"""
@@ -292,9 +386,17 @@ def analyze_page():
 async def analyze_resume(
     file: UploadFile = File(..., description="Resume file (PDF or TXT, max 5MB)"),
     job_description: Optional[str] = Form(None, description="Optional job description for matching"),
+    profile: str = Form("standard", description="Outputs to compute: scores, standard or full"),
 ):
     """Analyze resume with comprehensive error handling"""
     try:
+        from backend.analysis_profiles import PROFILES
+        if profile not in PROFILES:
+            return JSONResponse(
+                status_code=400,
+                content={"ok": False, "error": f"Unknown profile '{profile}'; expected one of: {', '.join(PROFILES)}"}
+            )
+        
         # Validate file
         if not file.filename:
             return JSONResponse(
@@ -320,7 +422,20 @@ async def analyze_resume(
         # Get analyzer and analyze
         try:
             analyzer = get_analyzer()
-            result = analyzer.analyze(resume_text)
+        except RuntimeError as e:
+            return JSONResponse(
+                status_code=503,
+                content={"ok": False, "error": f"Service unavailable: {str(e)}"}
+            )
+
+        from backend.resume_analyzer import AnalysisTimeoutError
+        try:
+            result = analyzer.analyze(resume_text, profile=profile)
+        except AnalysisTimeoutError as e:
+            return JSONResponse(
+                status_code=422,
+                content={"ok": False, "error": str(e)}
+            )
         except RuntimeError as e:
             return JSONResponse(
                 status_code=503,
@@ -21,7 +21,10 @@ from typing import Dict, List, Any
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
 from resume_analyzer import ResumeAnalyzer
-from pdf_extractor import extract_text_from_pdf, extract_text_from_docx
+from incremental_analysis import IncrementalAnalysis
+from cache_backends import create_cache_backend
+from skill_taxonomy import watch_taxonomy
+from pdf_extractor import extract_text_from_docx, extract_text_from_pdf, iter_pdf_pages
 from keyword_matcher import calculate_match_score, extract_missing_keywords, get_keyword_suggestions
 
 # Next-Gen Configuration
@@ -40,7 +43,10 @@ st.set_page_config(
 
 @st.cache_resource
 def get_analyzer() -> ResumeAnalyzer:
-    return ResumeAnalyzer()
+    analyzer = ResumeAnalyzer(cache=create_cache_backend())
+    # Picks up an edited SKILL_TAXONOMY_PATH without restarting the app
+    watch_taxonomy(analyzer.reload_taxonomy)
+    return analyzer
 
 # Next-Gen Session State Management
 if 'page' not in st.session_state:
@@ -63,6 +69,8 @@ if 'career_simulation' not in st.session_state:
     st.session_state.career_simulation = None
 if 'interview_mode' not in st.session_state:
     st.session_state.interview_mode = False
+if 'incremental_analysis' not in st.session_state:
+    st.session_state.incremental_analysis = None
 if 'collaboration_session' not in st.session_state:
     st.session_state.collaboration_session = None
 
@@ -1200,9 +1208,32 @@ def show_upload_hub():
                 if st.button("🚀 INITIATE NEURAL ANALYSIS", use_container_width=True):
                     with st.spinner("🧠 Neural networks processing..."):
                         try:
+                            analyzer = get_analyzer()
+                            results = None
+                            pdf = None
+                            
                             # File processing logic
                             if uploaded_file.type == "application/pdf":
-                                text = extract_text_from_pdf(uploaded_file)
+                                # Score pages as they are read, showing the provisional score.
+                                # Only the current page is held; the text is extracted again
+                                # from the upload if job matching needs it (get_resume_text)
+                                pages_read = 0
+                                progress = st.empty()
+                                
+                                def read_pages():
+                                    nonlocal pages_read
+                                    for page in iter_pdf_pages(uploaded_file):
+                                        pages_read += 1
+                                        yield page
+                                
+                                for results in analyzer.analyze_stream(read_pages()):
+                                    progress.caption(
+                                        f"📄 Pages read: {pages_read} · provisional score: "
+                                        f"{results['scores']['overall_score']}"
+                                    )
+                                progress.empty()
+                                text = None
+                                pdf = uploaded_file
                             elif uploaded_file.name.lower().endswith('.docx'):
                                 text = extract_text_from_docx(uploaded_file)
                             elif uploaded_file.type == "text/plain":
@@ -1213,13 +1244,14 @@ def show_upload_hub():
                             # Store data and analyze
                             st.session_state.resume_data = {
                                 'text': text,
+                                'pdf': pdf,
                                 'filename': uploaded_file.name,
                                 'file_size': uploaded_file.size
                             }
                             
-                            # Run analysis
-                            analyzer = get_analyzer()
-                            results = analyzer.analyze(text)
+                            # Run analysis (PDFs were analyzed while their pages were read)
+                            if results is None:
+                                results = analyzer.analyze_compact(text)
                             st.session_state.analysis_results = results
                             
                             # Update counter
@@ -1299,8 +1331,12 @@ def show_upload_hub():
                         'file_size': len(text_input.encode('utf-8'))
                     }
                     
+                    # Re-runs after an edit only re-extract the paragraphs that changed
                     analyzer = get_analyzer()
-                    results = analyzer.analyze(text_input)
+                    incremental = st.session_state.incremental_analysis
+                    if incremental is None or incremental.analyzer is not analyzer:
+                        incremental = st.session_state.incremental_analysis = IncrementalAnalysis(analyzer)
+                    results = incremental.analyze(text_input)
                     st.session_state.analysis_results = results
                     st.session_state.analysis_count += 1
                     
@@ -1507,6 +1543,16 @@ def calculate_future_proof_score(scores):
     # Bonus for modern skills, remote work keywords, etc.
     return min(base_score * 1.1, 100)
 
+def get_resume_text() -> str:
+    """Text of the current resume; uploaded PDFs keep only their analysis, so their text is extracted again"""
+    resume_data = st.session_state.resume_data
+    if resume_data.get('text') is None and resume_data.get('pdf') is not None:
+        pdf = resume_data['pdf']
+        pdf.seek(0)
+        return extract_text_from_pdf(pdf)
+    return resume_data.get('text') or ''
+
+
 def show_job_matching_page():
     """Job matching page"""
     st.markdown("<h2 style='color: #1F2937;'>🎯 Job Description Matching</h2>", unsafe_allow_html=True)
@@ -1523,8 +1569,8 @@ def show_job_matching_page():
     
     if st.button("Analyze Match"):
         if job_description:
-            resume_text = st.session_state.resume_data.get('text', '')
             with st.spinner("Analyzing job match..."):
+                resume_text = get_resume_text()
                 match_score = calculate_match_score(resume_text, job_description)
                 missing_keywords = extract_missing_keywords(resume_text, job_description)
                 suggestions = get_keyword_suggestions(job_description)
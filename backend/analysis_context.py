@@ -0,0 +1,244 @@
+"""
+Per-call analysis context for AI Resume Analyzer
+"""
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
+
+try:
+    from .section_segmenter import SectionSpan, segment_sections
+    from .tokenizer import TokenFeatures, TokenStream, scan_tokens
+except ImportError:
+    from section_segmenter import SectionSpan, segment_sections
+    from tokenizer import TokenFeatures, TokenStream, scan_tokens
+
+if TYPE_CHECKING:
+    from .fuzzy_matcher import FuzzyMatch
+    from .resume_analyzer import ResumeAnalyzer, SkillIndex
+
+
+class AnalysisContext:
+    """
+    Lazily computed features of a single resume.
+
+    Every derived feature is computed on first access and memoized, so the
+    scorers and recommenders can read whatever they need without repeating
+    text processing that another stage has already done.
+    """
+
+    def __init__(self, analyzer: 'ResumeAnalyzer', resume_text: str, skill_index: 'SkillIndex' = None,
+                 count_words: bool = True):
+        """
+        Args:
+            analyzer: Analyzer providing the extractors
+            resume_text: The original resume text
+            skill_index: Taxonomy to match against (defaults to the analyzer's
+                current one, read once so a reload cannot change it midway)
+            count_words: Count word frequency in the token pass; when False,
+                word_frequency is empty
+        """
+        self.analyzer = analyzer
+        self.resume_text = resume_text
+        self.skill_index = analyzer.skill_index if skill_index is None else skill_index
+        self.count_words = count_words
+        self._span_features: Dict[int, Dict[str, Any]] = {}
+
+    @cached_property
+    def clean_text(self) -> str:
+        """Cleaned, lower-cased resume text."""
+        return self.analyzer._clean_text(self.resume_text)
+
+    @cached_property
+    def tokens(self) -> TokenStream:
+        """Token stream of the cleaned text, shared by every detector."""
+        return TokenStream(self.clean_text)
+
+    @cached_property
+    def token_features(self) -> TokenFeatures:
+        """Frequency, section, date and quantifier detectors, run in one pass."""
+        return scan_tokens(self.tokens, self.count_words)
+
+    @property
+    def word_count(self) -> int:
+        return self.tokens.word_count
+
+    @cached_property
+    def skill_matches(self):
+        """Tuple of (exact matches by category, fuzzy matches)."""
+        return self.analyzer._find_skills(self.tokens, self.skill_index)
+
+    @cached_property
+    def skills(self):
+        """Tuple of (technical skills, soft skills, action verbs)."""
+        return self.analyzer._format_skills(*self.skill_matches)
+
+    @property
+    def fuzzy_matches(self) -> List['FuzzyMatch']:
+        """Approximate skill matches with their confidence (empty unless fuzzy mode is on)."""
+        return self.skill_matches[1]
+
+    @property
+    def technical_skills(self) -> List[str]:
+        return self.skills[0]
+
+    @property
+    def soft_skills(self) -> List[str]:
+        return self.skills[1]
+
+    @property
+    def action_verbs(self) -> List[str]:
+        return self.skills[2]
+
+    @property
+    def action_verb_count(self) -> int:
+        return len(self.skills[2])
+
+    @property
+    def quantified_count(self) -> int:
+        """Number of quantified achievements (percentages, counts, impact verbs)."""
+        return self.token_features.quantified_count
+
+    @property
+    def has_dates(self) -> bool:
+        return self.token_features.has_dates
+
+    @property
+    def sections(self) -> List[str]:
+        return self.token_features.sections
+
+    @cached_property
+    def contact_info(self) -> Dict[str, bool]:
+        # Contact details are matched against the original text
+        return self.analyzer._extract_contact_info(self.resume_text)
+
+    @cached_property
+    def word_frequency(self) -> Dict[str, int]:
+        """Most frequent words, as many as the analyzer reports."""
+        return self.analyzer._word_frequency(self.tokens, self.token_features)
+
+    @cached_property
+    def section_spans(self) -> List[SectionSpan]:
+        """Section spans of the original text, from a single pass over its lines."""
+        return segment_sections(self.resume_text)
+
+    def section_features(self, sections: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Features of each section span, in document order.
+
+        Only the spans of the requested sections are cleaned and scanned;
+        results are memoized per span.
+
+        Args:
+            sections: Section names to include (defaults to all)
+        """
+        wanted = None if sections is None else set(sections)
+        results = []
+        for index, span in enumerate(self.section_spans):
+            if wanted is not None and span.section not in wanted:
+                continue
+            features = self._span_features.get(index)
+            if features is None:
+                features = self.analyzer._extract_span_features(self.resume_text, span, self.skill_index)
+                self._span_features[index] = features
+            results.append(features)
+        return results
+
+    @cached_property
+    def features(self) -> 'FeatureRecord':
+        """Compact, text-free record of everything scoring depends on."""
+        return FeatureRecord.from_context(self)
+
+
+class FeatureRecord:
+    """
+    Text-free summary of a resume that is sufficient to score it.
+
+    Scores and recommendations depend only on these values, never on the
+    text itself, so a stored record can be re-scored with a new ScoringConfig
+    without repeating text cleaning or extraction.
+    """
+
+    # Bumped whenever the persisted layout changes
+    VERSION = 1
+
+    __slots__ = (
+        'word_count', 'technical_skills', 'soft_skills', 'action_verb_count',
+        'quantified_count', 'sections', 'has_email', 'has_phone', 'has_linkedin',
+        'has_dates'
+    )
+
+    def __init__(self, word_count: int, technical_skills: Iterable[str],
+                 soft_skills: Iterable[str], action_verb_count: int,
+                 quantified_count: int, sections: Iterable[str],
+                 has_email: bool, has_phone: bool, has_linkedin: bool,
+                 has_dates: bool):
+        self.word_count = word_count
+        self.technical_skills = tuple(technical_skills)
+        self.soft_skills = tuple(soft_skills)
+        self.action_verb_count = action_verb_count
+        self.quantified_count = quantified_count
+        self.sections = tuple(sections)
+        self.has_email = has_email
+        self.has_phone = has_phone
+        self.has_linkedin = has_linkedin
+        self.has_dates = has_dates
+
+    @classmethod
+    def from_context(cls, context: AnalysisContext) -> 'FeatureRecord':
+        contact_info = context.contact_info
+        return cls(
+            word_count=context.word_count,
+            technical_skills=context.technical_skills,
+            soft_skills=context.soft_skills,
+            action_verb_count=context.action_verb_count,
+            quantified_count=context.quantified_count,
+            sections=context.sections,
+            has_email=contact_info['has_email'],
+            has_phone=contact_info['has_phone'],
+            has_linkedin=contact_info['has_linkedin'],
+            has_dates=context.has_dates
+        )
+
+    @property
+    def contact_info(self) -> Dict[str, bool]:
+        return {
+            'has_email': self.has_email,
+            'has_phone': self.has_phone,
+            'has_linkedin': self.has_linkedin
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation for storage."""
+        return {
+            'version': self.VERSION,
+            'word_count': self.word_count,
+            'technical_skills': list(self.technical_skills),
+            'soft_skills': list(self.soft_skills),
+            'action_verb_count': self.action_verb_count,
+            'quantified_count': self.quantified_count,
+            'sections': list(self.sections),
+            'has_email': self.has_email,
+            'has_phone': self.has_phone,
+            'has_linkedin': self.has_linkedin,
+            'has_dates': self.has_dates
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FeatureRecord':
+        """
+        Rebuild a record produced by to_dict.
+
+        Raises:
+            ValueError: If the record was written by an incompatible version
+        """
+        if data.get('version') != cls.VERSION:
+            raise ValueError(f"Unsupported feature record version: {data.get('version')}")
+        fields = {name: data[name] for name in cls.__slots__}
+        return cls(**fields)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FeatureRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"FeatureRecord(word_count={self.word_count}, skills={len(self.technical_skills) + len(self.soft_skills)})"
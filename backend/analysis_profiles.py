@@ -0,0 +1,102 @@
+"""
+Analysis profiles for AI Resume Analyzer
+
+A profile names the outputs a caller wants from ResumeAnalyzer.analyze:
+
+- ``scores``: the scores only, e.g. for triage over large applicant volumes
+- ``standard``: the full result dictionary (the default)
+- ``full``: the standard result plus the feature record for rescore()
+
+Each output is produced by one stage of the pipeline, and each stage reads
+the outputs of the stages it depends on. stages_for() walks that graph from
+the requested outputs, so only the stages a profile actually needs run;
+scores, for instance, need skills, sections and contact details but not
+word frequency, recommendations or the result payload.
+"""
+from typing import Dict, Iterable, Tuple
+
+# Stage -> stages whose outputs it reads. Listed in an order that runs every
+# stage after its dependencies.
+STAGE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    'clean': (),
+    'tokenize': ('clean',),
+    # Sections, dates and quantifiers share one token pass with word
+    # frequency, which counts words only when it is needed
+    'sections': ('tokenize',),
+    'word_frequency': ('sections',),
+    'skills': ('tokenize',),
+    'contact': (),
+    'scoring': ('tokenize', 'sections', 'skills', 'contact'),
+    'recommendations': ('scoring',),
+    'features': ('tokenize', 'sections', 'skills', 'contact'),
+}
+
+# Result key -> stage that produces it
+OUTPUT_STAGES: Dict[str, str] = {
+    'scores': 'scoring',
+    'skills': 'skills',
+    'technical_skills': 'skills',
+    'soft_skills': 'skills',
+    'action_verbs': 'skills',
+    'action_verbs_count': 'skills',
+    'fuzzy_matches': 'skills',
+    'word_count': 'tokenize',
+    'word_frequency': 'word_frequency',
+    'sections_detected': 'sections',
+    'contact_info': 'contact',
+    'recommendations': 'recommendations',
+    'features': 'features',
+}
+
+_STANDARD_OUTPUTS = tuple(key for key in OUTPUT_STAGES if key != 'features')
+
+# Profile -> result keys it returns
+PROFILES: Dict[str, Tuple[str, ...]] = {
+    'scores': ('scores',),
+    'standard': _STANDARD_OUTPUTS,
+    'full': _STANDARD_OUTPUTS + ('features',),
+}
+
+DEFAULT_PROFILE = 'standard'
+
+
+def validate_profile(profile: str) -> str:
+    """
+    Return profile if it is known.
+
+    Raises:
+        ValueError: If profile is not one of PROFILES
+    """
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown analysis profile '{profile}'; expected one of: {', '.join(PROFILES)}")
+    return profile
+
+
+def stages_for(outputs: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Stages needed to produce outputs, in execution order.
+
+    Args:
+        outputs: Result keys (see OUTPUT_STAGES)
+
+    Raises:
+        ValueError: If an output is unknown
+    """
+    needed = set()
+    pending = []
+    for output in outputs:
+        if output not in OUTPUT_STAGES:
+            raise ValueError(f"Unknown analysis output '{output}'")
+        pending.append(OUTPUT_STAGES[output])
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(STAGE_DEPENDENCIES[name])
+    return tuple(name for name in STAGE_DEPENDENCIES if name in needed)
+
+
+# Stages of each profile, resolved once
+PROFILE_STAGES: Dict[str, Tuple[str, ...]] = {
+    profile: stages_for(outputs) for profile, outputs in PROFILES.items()
+}
@@ -0,0 +1,362 @@
+"""
+Compact analysis results for AI Resume Analyzer
+
+The dictionary returned by ResumeAnalyzer.analyze holds every skill list
+twice and a fresh string object for each skill, verb and recommendation.
+AnalysisResult stores the same information in a handful of slots: skills as
+integer bitsets over the skill vocabulary of the taxonomy that found them,
+action verbs as small integer IDs, and recommendations and frequent words as shared interned
+strings. It is a read-only Mapping with the same keys as the dictionary, so
+code written against ``result['scores']`` or ``result.get(...)`` keeps
+working, and to_dict() materializes the full dictionary when one is needed.
+"""
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from .analysis_context import FeatureRecord
+    from .fuzzy_matcher import FuzzyMatch
+    from .tokenizer import SECTION_KEYWORDS
+except ImportError:
+    from analysis_context import FeatureRecord
+    from fuzzy_matcher import FuzzyMatch
+    from tokenizer import SECTION_KEYWORDS
+
+SCORE_NAMES = (
+    'overall_score',
+    'content_quality',
+    'keyword_optimization',
+    'ats_compatibility',
+    'structure_score',
+    'completeness',
+)
+
+SECTION_NAMES = tuple(SECTION_KEYWORDS)
+_SECTION_BITS = {name: 1 << index for index, name in enumerate(SECTION_NAMES)}
+
+CONTACT_NAMES = ('has_email', 'has_phone', 'has_linkedin')
+
+# Keys of the dictionary form, in order; optional keys appear only when set
+RESULT_KEYS = (
+    'scores', 'skills', 'technical_skills', 'soft_skills', 'action_verbs',
+    'action_verbs_count', 'word_count', 'word_frequency', 'sections_detected',
+    'contact_info', 'recommendations'
+)
+
+
+class SkillVocabulary:
+    """
+    Mapping between the skill/verb names of one taxonomy and small integer IDs.
+
+    Each compiled taxonomy (resume_analyzer.SkillIndex) has its own
+    vocabulary, so it is bounded by the size of that taxonomy. IDs are
+    assigned on first sight and never change; results keep a reference to
+    the vocabulary that encoded them, which is freed with the last of them
+    once the taxonomy has been reloaded. IDs are not stable across
+    processes; serialized results (to_compact) carry names instead.
+    """
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def id_of(self, name: str) -> int:
+        """Return the ID of name, assigning one if it is new."""
+        ident = self._ids.get(name)
+        if ident is None:
+            with self._lock:
+                ident = self._ids.get(name)
+                if ident is None:
+                    name = sys.intern(name)
+                    ident = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = ident
+        return ident
+
+    def encode_set(self, names: Iterable[str]) -> int:
+        """Encode a set of names as a bitset."""
+        bits = 0
+        for name in names:
+            bits |= 1 << self.id_of(name)
+        return bits
+
+    def decode_set(self, bits: int) -> List[str]:
+        """Decode a bitset into sorted names."""
+        names = []
+        while bits:
+            lowest = bits & -bits
+            names.append(self._names[lowest.bit_length() - 1])
+            bits ^= lowest
+        names.sort()
+        return names
+
+    def encode_sequence(self, names: Iterable[str]) -> Tuple[int, ...]:
+        """Encode an ordered list of names as a tuple of IDs."""
+        return tuple(self.id_of(name) for name in names)
+
+    def decode_sequence(self, ids: Iterable[int]) -> List[str]:
+        """Decode a tuple of IDs back into names, keeping their order."""
+        return [self._names[ident] for ident in ids]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __reduce__(self):
+        # IDs are process-local: another process starts an empty vocabulary
+        return (SkillVocabulary, ())
+
+
+class AnalysisResult(Mapping):
+    """
+    Immutable, compact result of analyzing one resume.
+
+    Behaves as a read-only mapping with the keys of the dictionary returned
+    by ResumeAnalyzer.analyze; values are built on access.
+    """
+
+    # Bumped whenever the to_compact() layout changes
+    VERSION = 2
+
+    __slots__ = (
+        '_scores', '_technical', '_soft', '_verbs', 'word_count', '_frequency_words',
+        '_frequency_counts', '_sections', '_contact', '_recommendations',
+        '_fuzzy_matches', 'features', '_warnings', '_vocabulary'
+    )
+
+    def __init__(self, scores: Dict[str, int], technical_skills: Iterable[str],
+                 soft_skills: Iterable[str], action_verbs: Iterable[str], word_count: int,
+                 word_frequency: Dict[str, int], sections: Iterable[str],
+                 contact_info: Dict[str, bool], recommendations: Iterable[str],
+                 fuzzy_matches: Optional[Iterable[FuzzyMatch]] = None,
+                 features: Optional[FeatureRecord] = None, warnings: Iterable[str] = (),
+                 vocabulary: Optional[SkillVocabulary] = None):
+        """
+        Args:
+            scores: Scores keyed by SCORE_NAMES
+            technical_skills: Technical skill names
+            soft_skills: Soft skill names
+            action_verbs: Action verbs, in order of first occurrence
+            word_count: Number of words in the cleaned text
+            word_frequency: Most frequent words and their counts
+            sections: Detected section names (see tokenizer.SECTION_KEYWORDS)
+            contact_info: Contact flags keyed by CONTACT_NAMES; empty for an empty resume
+            recommendations: Recommendation messages
+            fuzzy_matches: Fuzzy skill matches, or None when fuzzy mode is off
+            features: Feature record, if it was requested
+            warnings: Notes on how the input was degraded (e.g. truncated), if at all
+            vocabulary: Vocabulary of the taxonomy the skills came from
+                (defaults to a new vocabulary used by this result alone)
+        """
+        if vocabulary is None:
+            vocabulary = SkillVocabulary()
+        self._vocabulary = vocabulary
+        self._scores = tuple(scores[name] for name in SCORE_NAMES)
+        self._technical = vocabulary.encode_set(technical_skills)
+        self._soft = vocabulary.encode_set(soft_skills)
+        self._verbs = vocabulary.encode_sequence(action_verbs)
+        self.word_count = word_count
+        self._frequency_words = tuple(sys.intern(word) for word in word_frequency)
+        self._frequency_counts = tuple(word_frequency.values())
+        self._sections = 0
+        for section in sections:
+            self._sections |= _SECTION_BITS[section]
+        if contact_info:
+            self._contact = sum(1 << index for index, name in enumerate(CONTACT_NAMES) if contact_info[name])
+        else:
+            self._contact = -1
+        self._recommendations = tuple(sys.intern(message) for message in recommendations)
+        self._fuzzy_matches = None if fuzzy_matches is None else tuple(fuzzy_matches)
+        self.features = features
+        self._warnings = tuple(warnings)
+
+    # Typed accessors ----------------------------------------------------
+
+    @property
+    def scores(self) -> Dict[str, int]:
+        return dict(zip(SCORE_NAMES, self._scores))
+
+    @property
+    def overall_score(self) -> int:
+        return self._scores[0]
+
+    @property
+    def technical_skills(self) -> List[str]:
+        return self._vocabulary.decode_set(self._technical)
+
+    @property
+    def soft_skills(self) -> List[str]:
+        return self._vocabulary.decode_set(self._soft)
+
+    @property
+    def action_verbs(self) -> List[str]:
+        return self._vocabulary.decode_sequence(self._verbs)
+
+    @property
+    def word_frequency(self) -> Dict[str, int]:
+        return dict(zip(self._frequency_words, self._frequency_counts))
+
+    @property
+    def sections(self) -> List[str]:
+        return [name for name in SECTION_NAMES if self._sections & _SECTION_BITS[name]]
+
+    @property
+    def contact_info(self) -> Dict[str, bool]:
+        if self._contact < 0:
+            return {}
+        return {name: bool(self._contact >> index & 1) for index, name in enumerate(CONTACT_NAMES)}
+
+    @property
+    def recommendations(self) -> List[str]:
+        return list(self._recommendations)
+
+    @property
+    def warnings(self) -> List[str]:
+        return list(self._warnings)
+
+    @property
+    def fuzzy_matches(self) -> Optional[List[Dict[str, Any]]]:
+        if self._fuzzy_matches is None:
+            return None
+        return [match.to_dict() for match in self._fuzzy_matches]
+
+    # Mapping interface --------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'scores':
+            return self.scores
+        if key == 'skills':
+            return {'technical': self.technical_skills, 'soft': self.soft_skills}
+        if key in ('technical_skills', 'soft_skills', 'action_verbs', 'word_frequency',
+                   'contact_info', 'recommendations', 'word_count'):
+            return getattr(self, key)
+        if key == 'action_verbs_count':
+            return len(self._verbs)
+        if key == 'sections_detected':
+            return self.sections
+        if key == 'fuzzy_matches' and self._fuzzy_matches is not None:
+            return self.fuzzy_matches
+        if key == 'features' and self.features is not None:
+            return self.features.to_dict()
+        if key == 'warnings' and self._warnings:
+            return self.warnings
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from RESULT_KEYS
+        if self._fuzzy_matches is not None:
+            yield 'fuzzy_matches'
+        if self.features is not None:
+            yield 'features'
+        if self._warnings:
+            yield 'warnings'
+
+    def __len__(self) -> int:
+        return (len(RESULT_KEYS) + (self._fuzzy_matches is not None) + (self.features is not None)
+                + bool(self._warnings))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the full dictionary returned by ResumeAnalyzer.analyze."""
+        return {key: self[key] for key in self}
+
+    def without_features(self) -> 'AnalysisResult':
+        """Return a copy that does not carry the feature record."""
+        if self.features is None:
+            return self
+        return self._replace(features=None)
+
+    def with_warnings(self, warnings: Iterable[str]) -> 'AnalysisResult':
+        """Return a copy that carries warnings in addition to its own."""
+        warnings = tuple(warnings)
+        if not warnings:
+            return self
+        return self._replace(_warnings=self._warnings + warnings)
+
+    def _replace(self, **changes) -> 'AnalysisResult':
+        clone = object.__new__(AnalysisResult)
+        for name in self.__slots__:
+            setattr(clone, name, changes.get(name, getattr(self, name)))
+        return clone
+
+    # Serialization ------------------------------------------------------
+
+    def to_compact(self) -> list:
+        """
+        Return a JSON-serializable form for caches and inter-process transfer.
+
+        Skill and verb IDs are process-local, so this form carries names.
+        """
+        return [
+            self.VERSION,
+            list(self._scores),
+            self.technical_skills,
+            self.soft_skills,
+            self.action_verbs,
+            self.word_count,
+            list(self._frequency_words),
+            list(self._frequency_counts),
+            self._sections,
+            self._contact,
+            list(self._recommendations),
+            self.fuzzy_matches,
+            None if self.features is None else self.features.to_dict(),
+            list(self._warnings)
+        ]
+
+    @classmethod
+    def from_compact(cls, data: list, vocabulary: Optional[SkillVocabulary] = None) -> 'AnalysisResult':
+        """
+        Rebuild a result produced by to_compact.
+
+        Args:
+            data: The compact form
+            vocabulary: Vocabulary of the taxonomy the result was produced
+                with (defaults to a new vocabulary used by this result alone)
+
+        Raises:
+            ValueError: If the data was written by an incompatible version
+        """
+        if not data or data[0] != cls.VERSION:
+            raise ValueError(f"Unsupported analysis result version: {data[0] if data else None}")
+        (_, scores, technical, soft, verbs, word_count, words, counts, sections,
+         contact, recommendations, fuzzy_matches, features, warnings) = data
+        result = cls(
+            scores=dict(zip(SCORE_NAMES, scores)),
+            technical_skills=technical,
+            soft_skills=soft,
+            action_verbs=verbs,
+            word_count=word_count,
+            word_frequency=dict(zip(words, counts)),
+            sections=(),
+            contact_info={},
+            recommendations=recommendations,
+            fuzzy_matches=None if fuzzy_matches is None else [
+                FuzzyMatch(match['category'], match['skill'], match['text'],
+                           match['distance'], match['confidence'])
+                for match in fuzzy_matches
+            ],
+            features=None if features is None else FeatureRecord.from_dict(features),
+            warnings=warnings,
+            vocabulary=vocabulary
+        )
+        result._sections = sections
+        result._contact = contact
+        return result
+
+    def __reduce__(self):
+        # IDs are process-local; pickles carry names
+        return (AnalysisResult.from_compact, (self.to_compact(),))
+
+    def __copy__(self) -> 'AnalysisResult':
+        return self
+
+    def __deepcopy__(self, memo) -> 'AnalysisResult':
+        # Immutable: sharing is safe
+        return self
+
+    def __repr__(self) -> str:
+        return (f"AnalysisResult(overall_score={self._scores[0]}, "
+                f"skills={bin(self._technical).count('1') + bin(self._soft).count('1')}, "
+                f"word_count={self.word_count})")
@@ -0,0 +1,165 @@
+"""
+Vectorized scoring engine for batches of resumes
+"""
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+try:
+    from .config import scoring_config
+    from .tokenizer import SECTION_KEYWORDS
+except ImportError:
+    from config import scoring_config
+    from tokenizer import SECTION_KEYWORDS
+
+SECTION_NAMES = tuple(SECTION_KEYWORDS)
+
+# Fixed-width numeric description of a resume; one row of the feature matrix
+FEATURE_COLUMNS = (
+    'word_count',
+    'action_verb_count',
+    'quantified_count',
+    'technical_skill_count',
+    'soft_skill_count',
+    'has_email',
+    'has_phone',
+    'has_dates',
+) + tuple(f'has_section_{name.lower()}' for name in SECTION_NAMES)
+
+SCORE_NAMES = (
+    'overall_score',
+    'content_quality',
+    'keyword_optimization',
+    'ats_compatibility',
+    'structure_score',
+    'completeness',
+)
+
+
+def feature_vector(context) -> List[int]:
+    """
+    Build the feature row for one resume.
+
+    Args:
+        context: AnalysisContext or FeatureRecord of the resume
+
+    Returns:
+        List of integers ordered like FEATURE_COLUMNS
+    """
+    contact_info = context.contact_info
+    sections = context.sections
+    return [
+        context.word_count,
+        context.action_verb_count,
+        context.quantified_count,
+        len(context.technical_skills),
+        len(context.soft_skills),
+        int(bool(contact_info.get('has_email'))),
+        int(bool(contact_info.get('has_phone'))),
+        int(context.has_dates),
+    ] + [int(name in sections) for name in SECTION_NAMES]
+
+
+def feature_matrix(contexts: Iterable) -> np.ndarray:
+    """Stack the feature rows of several resumes into an (N, len(FEATURE_COLUMNS)) matrix."""
+    rows = [feature_vector(context) for context in contexts]
+    return np.array(rows, dtype=np.int64).reshape(len(rows), len(FEATURE_COLUMNS))
+
+
+def score_matrix(features: np.ndarray, config=scoring_config) -> np.ndarray:
+    """
+    Compute all six scores for every row of a feature matrix.
+
+    The arithmetic mirrors ResumeAnalyzer._calculate_scores step for step,
+    including the order of the weighted sum, so results are identical to the
+    scalar path.
+
+    Args:
+        features: Matrix built by feature_matrix
+        config: Scoring configuration to apply
+
+    Returns:
+        (N, 6) integer matrix with columns ordered like SCORE_NAMES
+    """
+    features = np.asarray(features, dtype=np.int64)
+    column = {name: features[:, index] for index, name in enumerate(FEATURE_COLUMNS)}
+    has_section = {name: column[f'has_section_{name.lower()}'].astype(bool) for name in SECTION_NAMES}
+
+    word_count = column['word_count']
+    has_email = column['has_email'].astype(bool)
+    has_phone = column['has_phone'].astype(bool)
+
+    # Content quality: word-count band plus capped verb and quantification bonuses
+    content = np.select(
+        [
+            (config.OPTIMAL_WORD_COUNT_MIN <= word_count) & (word_count <= config.OPTIMAL_WORD_COUNT_MAX),
+            ((200 <= word_count) & (word_count < config.OPTIMAL_WORD_COUNT_MIN))
+            | ((config.OPTIMAL_WORD_COUNT_MAX < word_count) & (word_count <= 900)),
+            (100 <= word_count) & (word_count < 200),
+        ],
+        [40, 30, 20],
+        default=10,
+    )
+    content = content + np.minimum(
+        config.MAX_ACTION_VERB_BONUS,
+        column['action_verb_count'] * config.ACTION_VERB_BONUS_POINTS
+    )
+    content = content + np.minimum(
+        config.MAX_QUANTIFIED_BONUS,
+        column['quantified_count'] * config.QUANTIFIED_ACHIEVEMENT_BONUS
+    )
+
+    # Keyword optimization: the first threshold (in config order) that is reached wins
+    total_skills = column['technical_skill_count'] + column['soft_skill_count']
+    keyword = np.maximum(20, total_skills * 10)
+    for threshold, score in reversed(list(config.SKILLS_SCORE_THRESHOLDS.items())):
+        keyword = np.where(total_skills >= threshold, score, keyword)
+
+    # ATS compatibility
+    missing_sections = np.zeros(len(features), dtype=np.int64)
+    for name in config.ESSENTIAL_SECTIONS:
+        if name in SECTION_NAMES:
+            missing_sections += ~has_section[name]
+        else:
+            missing_sections += 1
+    ats = 100 - missing_sections * config.MISSING_SECTION_PENALTY
+    ats = ats - np.where(has_email, 0, config.MISSING_EMAIL_PENALTY)
+    ats = ats - np.where(has_phone, 0, config.MISSING_PHONE_PENALTY)
+    ats = ats - np.where(column['has_dates'].astype(bool), 0, config.MISSING_DATES_PENALTY)
+
+    # Structure
+    section_count = sum(flags.astype(np.int64) for flags in has_section.values())
+    structure = np.select(
+        [section_count >= 5, section_count >= 4, section_count >= 3],
+        [100, 85, 70],
+        default=np.maximum(30, section_count * 20),
+    )
+
+    # Completeness
+    completeness = (
+        100
+        - np.where(has_email, 0, 15)
+        - np.where(has_phone, 0, 15)
+        - np.where(has_section['Experience'], 0, 12)
+        - np.where(has_section['Education'], 0, 12)
+        - np.where(has_section['Skills'], 0, 12)
+    )
+
+    # Element-wise sum in the scalar order; a dot product may reassociate and change rounding
+    weights = config.SCORE_WEIGHTS
+    overall = (
+        content * weights['content_quality'] +
+        keyword * weights['keyword_optimization'] +
+        ats * weights['ats_compatibility'] +
+        structure * weights['structure_score'] +
+        completeness * weights['completeness']
+    )
+    overall = np.trunc(overall).astype(np.int64)
+
+    scores = np.stack([overall, content, keyword, ats, structure, completeness], axis=1)
+    return np.clip(scores, 0, 100).astype(np.int64)
+
+
+def score_dicts(scores: np.ndarray) -> List[Dict[str, int]]:
+    """Convert a score matrix into the per-resume dictionaries returned by analyze()."""
+    return [dict(zip(SCORE_NAMES, map(int, row))) for row in scores]
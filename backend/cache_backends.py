@@ -0,0 +1,326 @@
+"""
+Shared cache backends for AI Resume Analyzer
+
+The in-process AnalysisCache only helps the replica that computed a result.
+RedisCacheBackend stores entries in the Redis service configured by
+Config.REDIS_URL, so every API replica sees every other replica's work.
+FakeRedis implements the small subset of the redis client used here, for
+tests and local development without a server.
+"""
+import fnmatch
+import json
+import logging
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+try:
+    from .config import config
+    from .result_cache import AnalysisCache, CacheBackend
+except ImportError:
+    from config import config
+    from result_cache import AnalysisCache, CacheBackend
+
+logger = logging.getLogger(__name__)
+
+# Leading format byte of a serialized entry
+_FORMAT_JSON = b'j'
+_FORMAT_ZLIB_JSON = b'z'
+
+# Payloads shorter than this are not worth compressing
+COMPRESS_MIN_BYTES = 512
+
+# A slow cache must not stall requests longer than recomputing would
+SOCKET_TIMEOUT_SECONDS = 0.5
+
+# Connection pools shared by every backend pointing at the same URL
+_pools: Dict[str, Any] = {}
+_pools_lock = threading.Lock()
+
+
+def serialize(value: Any) -> bytes:
+    """
+    Encode a cache value as compact JSON, zlib-compressed when large.
+
+    JSON rather than pickle keeps a shared cache from being a code execution
+    vector between replicas.
+    """
+    payload = json.dumps(value, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    if len(payload) >= COMPRESS_MIN_BYTES:
+        return _FORMAT_ZLIB_JSON + zlib.compress(payload, 6)
+    return _FORMAT_JSON + payload
+
+
+def deserialize(data: bytes) -> Any:
+    """
+    Decode a value produced by serialize.
+
+    Raises:
+        ValueError: If the data has an unknown format byte or is corrupt
+    """
+    marker, payload = data[:1], data[1:]
+    if marker == _FORMAT_ZLIB_JSON:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise ValueError(f"Corrupt cache entry: {e}") from e
+    elif marker != _FORMAT_JSON:
+        raise ValueError(f"Unknown cache entry format: {marker!r}")
+    return json.loads(payload.decode('utf-8'))
+
+
+def get_connection_pool(url: str):
+    """Return the process-wide connection pool for url, creating it once."""
+    if redis is None:
+        raise ImportError("The redis package is required for the Redis cache backend")
+    with _pools_lock:
+        pool = _pools.get(url)
+        if pool is None:
+            pool = redis.ConnectionPool.from_url(
+                url,
+                socket_timeout=SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=SOCKET_TIMEOUT_SECONDS
+            )
+            _pools[url] = pool
+        return pool
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend stored in Redis.
+
+    Keys are namespaced so analysis results and extracted text can share a
+    server. Multi-key operations are pipelined into a single round trip.
+    Redis errors are logged and treated as misses: a cache outage degrades
+    to recomputation, never to failed requests.
+    """
+
+    def __init__(self, client=None, url: str = None, namespace: str = 'analysis',
+                 ttl_seconds: int = None, prefix: str = 'resume-analyzer'):
+        """
+        Args:
+            client: Redis client; by default one is built on a shared pool for url
+            url: Redis URL (defaults to Config.REDIS_URL)
+            namespace: Key namespace within the prefix
+            ttl_seconds: Lifetime of an entry (defaults to Config.CACHE_TTL_SECONDS)
+            prefix: Application-wide key prefix
+
+        Raises:
+            ImportError: If no client is given and the redis package is missing
+        """
+        if client is None:
+            pool = get_connection_pool(url or config.REDIS_URL)
+            client = redis.Redis(connection_pool=pool)
+        self.client = client
+        self.namespace = namespace
+        self.ttl_seconds = config.CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._key_prefix = f"{prefix}:{namespace}:"
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return self._key_prefix + key
+
+    def _count(self, hits: int, misses: int, errors: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.errors += errors
+
+    def _decode(self, data: Optional[bytes]) -> Optional[Any]:
+        if data is None:
+            return None
+        try:
+            return deserialize(data)
+        except ValueError as e:
+            logger.warning(f"Discarding unreadable cache entry: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if absent, expired or unreachable."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Fetch several keys with a single MGET."""
+        keys = list(keys)
+        if not keys:
+            return []
+        try:
+            raw = self.client.mget([self._key(key) for key in keys])
+        except Exception as e:
+            logger.warning(f"Redis cache read failed: {e}")
+            self._count(0, len(keys), 1)
+            return [None] * len(keys)
+        values = [self._decode(data) for data in raw]
+        hits = sum(value is not None for value in values)
+        self._count(hits, len(keys) - hits)
+        return values
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value with the configured TTL."""
+        self.set_many({key: value})
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store several entries in one pipelined round trip."""
+        if not items or self.ttl_seconds <= 0:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(self._key(key), serialize(value), ex=int(self.ttl_seconds))
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+            self._count(0, 0, 1)
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        try:
+            self.client.delete(self._key(key))
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+            self._count(0, 0, 1)
+
+    def clear(self) -> None:
+        """Remove every entry in this backend's namespace."""
+        try:
+            batch = []
+            for name in self.client.scan_iter(match=self._key_prefix + '*', count=500):
+                batch.append(name)
+                if len(batch) >= 500:
+                    self.client.delete(*batch)
+                    batch = []
+            if batch:
+                self.client.delete(*batch)
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+            self._count(0, 0, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return this process's hit/miss/error counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'redis',
+                'namespace': self.namespace,
+                'hits': self.hits,
+                'misses': self.misses,
+                'errors': self.errors,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'ttl_seconds': self.ttl_seconds
+            }
+
+
+class _FakePipeline:
+    """Buffered commands for FakeRedis.pipeline()."""
+
+    def __init__(self, client: 'FakeRedis'):
+        self._client = client
+        self._commands = []
+
+    def set(self, name, value, ex=None):
+        self._commands.append(('set', (name, value), {'ex': ex}))
+        return self
+
+    def get(self, name):
+        self._commands.append(('get', (name,), {}))
+        return self
+
+    def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        return [getattr(self._client, method)(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the redis client.
+
+    Implements get/set/mget/delete/scan_iter/pipeline with expiry, which is
+    everything RedisCacheBackend uses. Values are stored as bytes, as Redis
+    would return them.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, name: str) -> Optional[bytes]:
+        entry = self._data.get(name)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[name]
+            return None
+        return value
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            return self._live(name)
+
+    def mget(self, names: List[str]) -> List[Optional[bytes]]:
+        with self._lock:
+            return [self._live(name) for name in names]
+
+    def set(self, name: str, value, ex: int = None) -> bool:
+        if isinstance(value, str):
+            value = value.encode('utf-8')
+        with self._lock:
+            self._data[name] = (bytes(value), self._clock() + ex if ex else None)
+        return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(self._data.pop(name, None) is not None for name in names)
+
+    def scan_iter(self, match: str = None, count: int = None):
+        with self._lock:
+            names = [name for name in self._data if self._live(name) is not None]
+        for name in names:
+            if match is None or fnmatch.fnmatchcase(name, match):
+                yield name
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def flushdb(self) -> bool:
+        with self._lock:
+            self._data.clear()
+        return True
+
+
+def create_cache_backend(namespace: str = 'analysis', backend: str = None) -> Optional[CacheBackend]:
+    """
+    Build the cache backend selected by Config.CACHE_BACKEND.
+
+    Args:
+        namespace: Key namespace, e.g. 'analysis' or 'text'
+        backend: 'memory', 'redis', 'fake' or 'none' (defaults to Config.CACHE_BACKEND)
+
+    Returns:
+        A cache backend, or None when caching is disabled. If Redis is
+        requested but the client library is missing, the in-process cache is
+        used instead.
+    """
+    backend = (backend or config.CACHE_BACKEND).strip().lower()
+    if backend == 'none':
+        return None
+    if backend == 'redis':
+        try:
+            return RedisCacheBackend(namespace=namespace)
+        except ImportError as e:
+            logger.warning(f"{e}; falling back to the in-process cache")
+    elif backend == 'fake':
+        return RedisCacheBackend(client=FakeRedis(), namespace=namespace)
+    elif backend != 'memory':
+        logger.warning(f"Unknown cache backend '{backend}'; using the in-process cache")
+    return AnalysisCache()
@@ -40,7 +40,35 @@ class Config:
     
     # Cache Settings
     CACHE_TTL_SECONDS: int = int(os.getenv('CACHE_TTL_SECONDS', '3600'))
+    CACHE_MAX_ENTRIES: int = int(os.getenv('CACHE_MAX_ENTRIES', '1024'))
     REDIS_URL: str = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    CACHE_BACKEND: str = os.getenv('CACHE_BACKEND', 'memory')  # memory, redis or none
+    
+    # Compiled skill taxonomy artifact (python -m backend.skill_taxonomy build) or JSON source; empty uses SkillsConfig
+    SKILL_TAXONOMY_PATH: str = os.getenv('SKILL_TAXONOMY_PATH', '')
+    # Poll SKILL_TAXONOMY_PATH and hot-reload it when it changes; 0 disables the watcher
+    SKILL_TAXONOMY_RELOAD_SECONDS: float = float(os.getenv('SKILL_TAXONOMY_RELOAD_SECONDS', '0'))
+    # Shared secret for admin API endpoints (X-Admin-Token header); empty disables them
+    ADMIN_TOKEN: str = os.getenv('ADMIN_TOKEN', '')
+    # Alias index mapping variant spellings to canonical skills; empty disables aliases
+    SKILL_ALIASES_PATH: str = os.getenv('SKILL_ALIASES_PATH', 'backend/data/skill_aliases.json')
+    
+    # Fuzzy skill matching for damaged (e.g. PDF-extracted) text
+    ENABLE_FUZZY_MATCHING: bool = os.getenv('ENABLE_FUZZY_MATCHING', 'False').lower() == 'true'
+    FUZZY_MIN_CONFIDENCE: float = float(os.getenv('FUZZY_MIN_CONFIDENCE', '0.85'))
+    
+    # Hard limits per analysis: longer text is truncated, slower analyses are abandoned
+    MAX_RESUME_CHARS: int = int(os.getenv('MAX_RESUME_CHARS', '500000'))
+    ANALYSIS_TIME_BUDGET_SECONDS: float = float(os.getenv('ANALYSIS_TIME_BUDGET_SECONDS', '10'))
+    
+    # Words reported in word_frequency; the count-min sketch bounds the frequency table (see backend.word_frequency)
+    WORD_FREQUENCY_TOP_K: int = int(os.getenv('WORD_FREQUENCY_TOP_K', '10'))
+    WORD_FREQUENCY_SKETCH: bool = os.getenv('WORD_FREQUENCY_SKETCH', 'False').lower() == 'true'
+    WORD_FREQUENCY_SKETCH_WIDTH: int = int(os.getenv('WORD_FREQUENCY_SKETCH_WIDTH', '2048'))
+    WORD_FREQUENCY_SKETCH_DEPTH: int = int(os.getenv('WORD_FREQUENCY_SKETCH_DEPTH', '4'))
+    
+    # Per-stage timing histograms (see backend.profiling)
+    ENABLE_PROFILING: bool = os.getenv('ENABLE_PROFILING', 'False').lower() == 'true'
 
 class SkillsConfig:
     """Configuration for skills detection."""
@@ -51,7 +79,7 @@ class SkillsConfig:
         'react', 'angular', 'vue', 'node.js', 'django', 'flask', 'fastapi', 
         'spring', 'laravel', 'mysql', 'postgresql', 'mongodb', 'redis', 
         'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'git',
-        'machine learning', 'data analysis', 'tensorflow', 'pytorch'
+        'machine learning', 'data analysis', 'tensorflow', 'pytorch', 'scikit-learn'
     }
     
     SOFT_SKILLS = {
@@ -0,0 +1,258 @@
+"""
+Fuzzy skill matching for AI Resume Analyzer
+
+Text extracted from PDFs is often damaged: words are split ("kubernete s",
+"pyth on") or lose and swap characters. FuzzySkillIndex finds taxonomy
+entries within a small edit distance of the words of a resume, and of
+adjacent fragments joined back together, without comparing every word with
+every skill. It precomputes a SymSpell-style deletion index: each skill key
+is stored under every string obtained by deleting up to two characters from
+its prefix, so a lookup only has to generate the deletions of the candidate
+word and verify the few keys that share one.
+"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from .tokenizer import is_word_token
+except ImportError:
+    from tokenizer import is_word_token
+
+# Keys shorter than this are left to exact matching; short words are too
+# close to ordinary vocabulary for edit distance to mean anything
+MIN_KEY_LENGTH = 5
+
+# Keys at least this long tolerate two edits instead of one
+DISTANCE_2_MIN_LENGTH = 9
+
+# Length of the key prefix that is indexed (the SymSpell prefix optimization)
+PREFIX_LENGTH = 7
+
+# Adjacent word fragments joined into one candidate, at most
+MAX_JOINED_TOKENS = 3
+
+# Joining fragments costs this much confidence, in edits
+JOIN_PENALTY = 0.5
+
+# Upper bound on memoized candidate lookups
+_MAX_MEMO_ENTRIES = 100000
+
+
+def compact_key(term: str) -> str:
+    """Reduce a term to its letters and digits, the form fuzzy matching compares."""
+    return ''.join(char for char in term if char.isalnum())
+
+
+def allowed_distance(key: str) -> int:
+    """Maximum number of edits tolerated for a key."""
+    if len(key) < MIN_KEY_LENGTH:
+        return 0
+    return 2 if len(key) >= DISTANCE_2_MIN_LENGTH else 1
+
+
+def _deletions(word: str, distance: int) -> Set[str]:
+    """Every string obtained by deleting up to distance characters from word."""
+    results = {word}
+    frontier = results
+    for _ in range(distance):
+        frontier = {item[:index] + item[index + 1:] for item in frontier for index in range(len(item))}
+        results |= frontier
+    return results
+
+
+def osa_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (edits plus adjacent transpositions).
+
+    Returns:
+        The distance, or max_distance + 1 as soon as it is known to exceed max_distance
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    if source == target:
+        return 0
+
+    previous_previous: Optional[List[int]] = None
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_minimum = i
+        source_char = source[i - 1]
+        for j in range(1, len(target) + 1):
+            cost = 0 if source_char == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1 and source_char == target[j - 2]
+                    and source[i - 2] == target[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            if value < row_minimum:
+                row_minimum = value
+        if row_minimum > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    distance = previous[-1]
+    return distance if distance <= max_distance else max_distance + 1
+
+
+class FuzzyMatch:
+    """A taxonomy entry matched approximately, with its confidence."""
+
+    __slots__ = ('category', 'skill', 'text', 'distance', 'confidence')
+
+    def __init__(self, category: str, skill: str, text: str, distance: int, confidence: float):
+        self.category = category
+        self.skill = skill
+        self.text = text
+        self.distance = distance
+        self.confidence = confidence
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'skill': self.skill,
+            'category': self.category,
+            'text': self.text,
+            'distance': self.distance,
+            'confidence': self.confidence
+        }
+
+    def __repr__(self) -> str:
+        return f"FuzzyMatch({self.skill!r}, text={self.text!r}, confidence={self.confidence})"
+
+
+class FuzzySkillIndex:
+    """
+    Precomputed deletion index over the compact form of taxonomy entries.
+
+    Built once per analyzer. A search costs a handful of set lookups per
+    word of the resume, independent of the size of the taxonomy.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str]],
+                 categories: Iterable[str] = ('technical', 'soft')):
+        """
+        Args:
+            entries: (category, spelling, canonical term) triples, as given by
+                a skill matcher's entries()
+            categories: Categories that take part in fuzzy matching
+        """
+        categories = set(categories)
+        # key -> {(category, canonical): number of words in the spelling}
+        self._keys: Dict[str, Dict[Tuple[str, str], int]] = {}
+        for category, spelling, canonical in entries:
+            if category not in categories:
+                continue
+            key = compact_key(spelling)
+            if allowed_distance(key) == 0:
+                continue
+            targets = self._keys.setdefault(key, {})
+            words = len(spelling.split())
+            targets[(category, canonical)] = min(words, targets.get((category, canonical), words))
+
+        self._deletes: Dict[str, List[str]] = {}
+        for key in self._keys:
+            for deletion in _deletions(key[:PREFIX_LENGTH], allowed_distance(key)):
+                self._deletes.setdefault(deletion, []).append(key)
+
+        # Candidates outside these lengths cannot be within distance of any key
+        self._min_length = min((len(key) - allowed_distance(key) for key in self._keys), default=0)
+        self._max_length = max((len(key) + allowed_distance(key) for key in self._keys), default=0)
+        self._memo: Dict[str, Tuple[Tuple[str, int], ...]] = {}
+
+    @classmethod
+    def from_matcher(cls, matcher, categories: Iterable[str] = ('technical', 'soft')) -> 'FuzzySkillIndex':
+        """Index every spelling (terms and aliases) compiled into a skill matcher."""
+        return cls(matcher.entries(), categories)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def lookup(self, candidate: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Find the keys within their allowed distance of a compact candidate.
+
+        Returns:
+            Tuple of (key, distance) pairs
+        """
+        cached = self._memo.get(candidate)
+        if cached is not None:
+            return cached
+
+        matches = []
+        if self._min_length <= len(candidate) <= self._max_length:
+            query_distance = 2 if len(candidate) >= DISTANCE_2_MIN_LENGTH - 2 else 1
+            deletes = self._deletes
+            shared = _deletions(candidate[:PREFIX_LENGTH], query_distance) & deletes.keys()
+            for key in sorted({key for deletion in shared for key in deletes[deletion]}):
+                limit = allowed_distance(key)
+                distance = osa_distance(candidate, key, limit)
+                if distance <= limit:
+                    matches.append((key, distance))
+
+        result = tuple(matches)
+        if len(self._memo) < _MAX_MEMO_ENTRIES:
+            self._memo[candidate] = result
+        return result
+
+    def search(self, tokens: List[str], found: Optional[Dict[str, Iterable[str]]] = None,
+               first: int = 0, stop: Optional[int] = None) -> List[FuzzyMatch]:
+        """
+        Find approximate occurrences of taxonomy entries in a token stream.
+
+        Candidates are single words and runs of up to MAX_JOINED_TOKENS words
+        separated by single spaces, joined together.
+
+        Args:
+            tokens: Tokens of the cleaned text (see tokenizer.TOKEN_PATTERN)
+            found: Exact matches by category; those skills are not reported again
+            first: Only consider candidates starting at or after this token
+            stop: Only consider candidates starting before this token; later
+                tokens are lookahead (defaults to the end)
+
+        Returns:
+            The best match per skill, most confident first
+        """
+        excluded = {
+            (category, term) for category, terms in (found or {}).items() for term in terms
+        }
+        best: Dict[Tuple[str, str], FuzzyMatch] = {}
+
+        words = [index for index, token in enumerate(tokens) if is_word_token(token)]
+        count = len(tokens)
+        for position, start in enumerate(words):
+            if start < first:
+                continue
+            if stop is not None and start >= stop:
+                break
+            candidate = tokens[start]
+            parts = 1
+            end = start
+            while True:
+                if len(candidate) >= self._min_length:
+                    for key, distance in self.lookup(candidate):
+                        self._record(best, excluded, key, distance, parts, tokens[start:end + 1])
+                # Extend across a single space to the next word
+                following = position + parts
+                if (parts >= MAX_JOINED_TOKENS or following >= len(words)
+                        or words[following] != end + 2 or end + 1 >= count or tokens[end + 1] != ' '):
+                    break
+                end = words[following]
+                candidate += tokens[end]
+                parts += 1
+                if len(candidate) > self._max_length:
+                    break
+
+        return sorted(best.values(), key=lambda match: (-match.confidence, match.category, match.skill))
+
+    def _record(self, best: Dict[Tuple[str, str], FuzzyMatch], excluded: Set[Tuple[str, str]],
+                key: str, distance: int, parts: int, span: List[str]) -> None:
+        for target, words in self._keys[key].items():
+            if target in excluded:
+                continue
+            # Same words, same letters: an exact match the matcher rejected on
+            # word boundaries or punctuation, which is not ours to second-guess
+            joins = abs(parts - words)
+            if distance == 0 and joins == 0:
+                continue
+            confidence = round(max(0.0, 1 - (distance + JOIN_PENALTY * joins) / len(key)), 2)
+            current = best.get(target)
+            if current is None or confidence > current.confidence:
+                best[target] = FuzzyMatch(target[0], target[1], ''.join(span), distance, confidence)
@@ -0,0 +1,169 @@
+"""
+Incremental re-analysis of a resume that is being edited
+
+IncrementalAnalysis keeps the features of every paragraph of the last text
+it analyzed, keyed by the paragraph text. When the text is analyzed again
+only the paragraphs that changed are normalized, tokenized, checked for
+contact details and scanned for skills; the aggregates are then merged
+from the per-paragraph records. A skill term or fuzzy candidate can run
+from the end of one paragraph into the next, so the last few tokens of
+every paragraph are rescanned together with the start of the following
+one (a junction rescan), which is itself cached until either side changes.
+The result equals analyze() on the same text.
+"""
+import time
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from .analysis_result import AnalysisResult
+    from .fuzzy_matcher import FuzzyMatch
+    from .patterns import PARAGRAPH_BREAK
+    from .resume_analyzer import ResumeAnalyzer, SkillIndex, truncate_text
+    from .stream_analysis import AnalysisTotals, Segment, scan_skills, skill_lookahead
+except ImportError:
+    from analysis_result import AnalysisResult
+    from fuzzy_matcher import FuzzyMatch
+    from patterns import PARAGRAPH_BREAK
+    from resume_analyzer import ResumeAnalyzer, SkillIndex, truncate_text
+    from stream_analysis import AnalysisTotals, Segment, scan_skills, skill_lookahead
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """
+    Split text into paragraphs at blank lines.
+
+    Paragraphs keep the whitespace that ends them, so every paragraph but
+    the last ends with whitespace, and joined they give the text back.
+    """
+    paragraphs = []
+    start = 0
+    for match in PARAGRAPH_BREAK.finditer(text):
+        paragraphs.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        paragraphs.append(text[start:])
+    return paragraphs
+
+
+class ParagraphRecord:
+    """Features and skill matches of one paragraph, independent of its neighbours."""
+
+    __slots__ = ('segment', 'stop', 'found', 'fuzzy_matches', 'junction')
+
+    def __init__(self, analyzer: ResumeAnalyzer, skill_index: SkillIndex, text: str, lookahead: int):
+        self.segment = Segment(analyzer, text)
+        tokens = self.segment.tokens
+        # Matches starting before stop never look past the paragraph
+        self.stop = max(len(tokens) - lookahead, 0)
+        self.found, self.fuzzy_matches = scan_skills(skill_index, tokens, 0, self.stop)
+        # (following tokens, found, fuzzy matches) of the last junction rescan
+        self.junction: Optional[Tuple[Tuple[str, ...], Dict[str, List[str]], List[FuzzyMatch]]] = None
+
+
+class IncrementalAnalysis:
+    """
+    Analysis of successive versions of one resume.
+
+    Each call to analyze() re-extracts only the paragraphs that are not in
+    the previous version, so the cost of re-analysis grows with the size of
+    the edit rather than the size of the resume. The result cache is not
+    used.
+    """
+
+    def __init__(self, analyzer: ResumeAnalyzer):
+        """
+        Args:
+            analyzer: Analyzer providing the extractors, scoring and limits
+        """
+        self.analyzer = analyzer
+        self.skill_index: Optional[SkillIndex] = None
+        self._lookahead = 0
+        self._records: Dict[str, ParagraphRecord] = {}
+        self.last_extracted = 0
+        self.last_reused = 0
+
+    def analyze(self, resume_text: str, include_features: bool = False) -> AnalysisResult:
+        """
+        Analyze the current version of the resume.
+
+        Args:
+            resume_text: The full, edited resume text
+            include_features: Keep the feature record on the result
+
+        Returns:
+            AnalysisResult equal to analyzer.analyze_compact(resume_text)
+
+        Raises:
+            ValueError: If resume_text is not a string
+            AnalysisTimeoutError: If re-extraction exceeds the time budget
+        """
+        if not isinstance(resume_text, str):
+            raise ValueError("resume_text must be a string")
+        analyzer = self.analyzer
+        if not resume_text.strip():
+            return analyzer._get_empty_compact_result()
+
+        truncated = len(resume_text) > analyzer.max_chars
+        if truncated:
+            resume_text = truncate_text(resume_text, analyzer.max_chars)
+
+        # Records are only valid for the taxonomy they were matched against
+        skill_index = analyzer.skill_index
+        if skill_index is not self.skill_index:
+            self.skill_index = skill_index
+            self._lookahead = skill_lookahead(skill_index)
+            self._records = {}
+
+        deadline = time.monotonic() + analyzer.time_budget
+        previous = self._records
+        records: Dict[str, ParagraphRecord] = {}
+        sequence = []
+        extracted = 0
+        for paragraph in split_paragraphs(resume_text):
+            record = records.get(paragraph) or previous.get(paragraph)
+            if record is None:
+                record = ParagraphRecord(analyzer, skill_index, paragraph, self._lookahead)
+                extracted += 1
+            records[paragraph] = record
+            sequence.append(record)
+        # Paragraphs no longer in the text are forgotten
+        self._records = records
+        self.last_extracted = extracted
+        self.last_reused = len(sequence) - extracted
+        analyzer._check_deadline(deadline, 'paragraph extraction')
+
+        totals = AnalysisTotals(analyzer, skill_index)
+        # Checked before truncation, like analyze(): a whitespace-only prefix is still analyzed
+        totals.has_text = True
+        with_tokens = [record for record in sequence if record.segment.tokens]
+        for record in sequence:
+            totals.add_segment(record.segment)
+        for index, record in enumerate(with_tokens):
+            totals.add_skills(record.found, record.fuzzy_matches)
+            totals.add_skills(*self._junction(with_tokens, index))
+        return totals.result(truncated, include_features)
+
+    def _junction(self, records: List[ParagraphRecord],
+                  index: int) -> Tuple[Dict[str, List[str]], List[FuzzyMatch]]:
+        """Matches starting in the last tokens of records[index], which may run into the next ones."""
+        record = records[index]
+        tokens = record.segment.tokens
+        lookahead = self._lookahead
+        after: List[str] = []
+        for other in records[index + 1:index + 1 + lookahead]:
+            if len(after) >= lookahead:
+                break
+            after.append(' ')
+            after.extend(other.segment.tokens[:lookahead])
+        key = tuple(after[:lookahead])
+
+        junction = record.junction
+        if junction is None or junction[0] != key:
+            # One token before the first start is kept for the word-boundary check
+            context = 1 if record.stop > 0 else 0
+            window = tokens[record.stop - context:] + list(key)
+            found, fuzzy_matches = scan_skills(
+                self.skill_index, window, context, context + len(tokens) - record.stop
+            )
+            junction = record.junction = (key, found, fuzzy_matches)
+        return junction[1], junction[2]
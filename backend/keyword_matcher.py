@@ -1,7 +1,10 @@
-import re
 from typing import Dict, List, Set, Union
 from collections import Counter
 import logging
+try:
+    from .text_normalizer import normalize_match_text
+except ImportError:
+    from text_normalizer import normalize_match_text
 
 logger = logging.getLogger(__name__)
 
@@ -53,13 +56,7 @@ def calculate_match_score(resume_text: str, job_description: str) -> int:
 
 def _clean_text(text: str) -> str:
     """Clean and normalize text for comparison."""
-    # Convert to lowercase
-    text = text.lower()
-    # Remove special characters except spaces
-    text = re.sub(r'[^a-z0-9\s]', ' ', text)
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip()
+    return normalize_match_text(text)
 
 
 def _keyword_overlap_score(resume_text: str, job_text: str) -> int:
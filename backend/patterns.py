@@ -0,0 +1,120 @@
+"""
+Pattern registry for AI Resume Analyzer
+
+Every regular expression the backend matches against resume text is
+compiled here, once, at import time, so no call site depends on the
+``re`` module's small internal cache and the detectors can be reviewed
+(and tested for worst-case behaviour) in one place.
+
+Detectors that run on the cleaned token stream (dates, quantified
+achievements, sections and word frequency) are not regexes at all: they
+are fused into the single pass of tokenizer.scan_tokens, which documents
+the pattern each one reproduces. The contact detectors below run on the
+raw text, because normalization would alter addresses and numbers.
+"""
+import re
+from typing import Callable, Dict, Pattern
+
+# Maximal runs of word characters and single non-word characters. The tokens
+# cover the text completely, so a regex ``\b...\b`` match always starts and
+# ends on a token edge.
+TOKEN_PATTERN = re.compile(r'\w+|\W')
+
+# A blank line: paragraph boundary for incremental analysis
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+
+# Letter runs of a line, used to recognize section headings
+HEADING_WORD_PATTERN = re.compile(r'[^\W\d_]+')
+
+_ASCII_LETTERS = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz')
+_EMAIL_DOMAIN_CHARS = _ASCII_LETTERS | frozenset('0123456789.-')
+_EMAIL_LOCAL_CHARS = _EMAIL_DOMAIN_CHARS | frozenset('_%+')
+
+# An '@' between an address character and a valid domain. Runs in C and
+# rejects most '@'s before the exact check; domain runs contain no '@', so
+# no character is scanned from two candidates.
+EMAIL_CANDIDATE_PATTERN = re.compile(r'(?<=[A-Za-z0-9._%+-])@[A-Za-z0-9.-]+?\.[A-Za-z]{2,}\b')
+
+# Bounded quantifiers only: each match attempt does constant work
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com', re.IGNORECASE)
+
+# Every compiled pattern, by name
+PATTERNS: Dict[str, Pattern[str]] = {
+    'token': TOKEN_PATTERN,
+    'paragraph_break': PARAGRAPH_BREAK,
+    'heading_word': HEADING_WORD_PATTERN,
+    'email_candidate': EMAIL_CANDIDATE_PATTERN,
+    'phone': PHONE_PATTERN,
+    'linkedin': LINKEDIN_PATTERN,
+}
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by the regex ``\\w`` class."""
+    return char == '_' or char.isalnum()
+
+
+def contains_email(text: str) -> bool:
+    """
+    Return True if text contains an email address.
+
+    Matches what ``\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}\\b``
+    would, in linear time: only the text around each candidate '@' is
+    inspected, and neither a local part nor a domain contains an '@', so no
+    character is scanned from more than two of them. The regex itself
+    backtracks quadratically on long runs of address characters without an
+    '@'.
+    """
+    for candidate in EMAIL_CANDIDATE_PATTERN.finditer(text):
+        if _email_at(text, candidate.start()):
+            return True
+    return False
+
+
+def _email_at(text: str, at: int) -> bool:
+    """Check for an email address around the '@' at index at."""
+    # Local part: a start that is on a word boundary
+    start = at
+    while start > 0 and text[start - 1] in _EMAIL_LOCAL_CHARS:
+        start -= 1
+    for position in range(start, at):
+        before = position > 0 and _is_word_char(text[position - 1])
+        if before != _is_word_char(text[position]):
+            break
+    else:
+        return False
+
+    # Domain: a '.' followed by two or more letters that end on a word boundary
+    end = at + 1
+    while end < len(text) and text[end] in _EMAIL_DOMAIN_CHARS:
+        end += 1
+    dot = text.find('.', at + 2, end)
+    while dot != -1:
+        letters_end = dot + 1
+        while letters_end < end and text[letters_end] in _ASCII_LETTERS:
+            letters_end += 1
+        if letters_end - dot > 2 and (letters_end == len(text) or not _is_word_char(text[letters_end])):
+            return True
+        dot = text.find('.', letters_end, end)
+    return False
+
+
+# Contact signals and their detectors. Each detector stops at its first
+# match; an alternation of all three is slower under ``re``, which loses
+# the per-pattern prefix scans and cannot stop early for one signal.
+CONTACT_DETECTORS: Dict[str, Callable[[str], bool]] = {
+    'has_email': contains_email,
+    'has_phone': lambda text: PHONE_PATTERN.search(text) is not None,
+    'has_linkedin': lambda text: LINKEDIN_PATTERN.search(text) is not None,
+}
+
+
+def detect_contact(text: str) -> Dict[str, bool]:
+    """
+    Check raw text for each contact signal (linear time in its length).
+
+    Returns:
+        Dictionary with has_email, has_phone and has_linkedin
+    """
+    return {signal: detect(text) for signal, detect in CONTACT_DETECTORS.items()}
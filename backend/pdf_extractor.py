@@ -1,24 +1,33 @@
 import PyPDF2
 from io import BytesIO
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Iterator
 import docx
 import logging
 
+try:
+    from .profiling import timed
+except ImportError:
+    from profiling import timed
+
 logger = logging.getLogger(__name__)
 
-def extract_text_from_pdf(pdf_file: Union[BytesIO, bytes]) -> str:
+def iter_pdf_pages(pdf_file: Union[BytesIO, bytes]) -> Iterator[str]:
     """
-    Extract text content from a PDF file with comprehensive error handling.
+    Yield the text of a PDF one page at a time.
+    
+    Pages after the first are prefixed with a newline, so joining the pages
+    gives the text extract_text_from_pdf returns (before stripping). Each
+    page is parsed only when the next one is requested, so analysis can start
+    on the first page while later pages are still unread.
     
     Args:
         pdf_file: PDF file object (from Streamlit file uploader) or bytes
         
-    Returns:
-        Extracted text as a string
+    Yields:
+        Text of each page that has any
         
     Raises:
-        ValueError: If PDF is invalid or corrupted
-        TypeError: If input type is invalid
+        ValueError: If the PDF is invalid or corrupted, or no page has text
     """
     if not pdf_file:
         raise ValueError("PDF file cannot be None or empty")
@@ -32,33 +41,53 @@ def extract_text_from_pdf(pdf_file: Union[BytesIO, bytes]) -> str:
         
         if len(pdf_reader.pages) == 0:
             raise ValueError("PDF has no pages")
-        
-        # Extract text from all pages
-        text_parts = []
-        for i, page in enumerate(pdf_reader.pages):
-            try:
-                page_text = page.extract_text()
-                if page_text:
-                    text_parts.append(page_text)
-            except Exception as e:
-                logger.warning(f"Failed to extract text from page {i+1}: {e}")
-                continue
-        
-        text = "\n".join(text_parts).strip()
-        
-        if not text:
-            raise ValueError("Could not extract any text from PDF. The file might be image-based or corrupted.")
-        
-        logger.info(f"Successfully extracted {len(text)} characters from PDF with {len(pdf_reader.pages)} pages")
-        return text
-        
+        pages = pdf_reader.pages
     except PyPDF2.errors.PdfReadError as e:
         raise ValueError(f"Invalid or corrupted PDF file: {str(e)}")
     except Exception as e:
         logger.error(f"Unexpected error extracting PDF: {e}")
         raise ValueError(f"Error extracting text from PDF: {str(e)}")
+    
+    extracted = 0
+    for i, page in enumerate(pages):
+        try:
+            page_text = page.extract_text()
+        except Exception as e:
+            logger.warning(f"Failed to extract text from page {i+1}: {e}")
+            continue
+        if page_text:
+            yield page_text if extracted == 0 else "\n" + page_text
+            extracted += 1
+    
+    if not extracted:
+        raise ValueError("Could not extract any text from PDF. The file might be image-based or corrupted.")
+
+
+@timed('extract.pdf')
+def extract_text_from_pdf(pdf_file: Union[BytesIO, bytes]) -> str:
+    """
+    Extract text content from a PDF file with comprehensive error handling.
+    
+    Args:
+        pdf_file: PDF file object (from Streamlit file uploader) or bytes
+        
+    Returns:
+        Extracted text as a string
+        
+    Raises:
+        ValueError: If PDF is invalid or corrupted
+        TypeError: If input type is invalid
+    """
+    text = "".join(iter_pdf_pages(pdf_file)).strip()
+    
+    if not text:
+        raise ValueError("Could not extract any text from PDF. The file might be image-based or corrupted.")
+    
+    logger.info(f"Successfully extracted {len(text)} characters from PDF")
+    return text
 
 
+@timed('extract.pdf_metadata')
 def get_pdf_metadata(pdf_file: Union[BytesIO, bytes]) -> Dict[str, Any]:
     """
     Extract metadata from a PDF file with error handling.
@@ -103,6 +132,7 @@ def get_pdf_metadata(pdf_file: Union[BytesIO, bytes]) -> Dict[str, Any]:
         return {'error': str(e), 'num_pages': 0, 'author': 'Unknown', 'title': 'Unknown', 'subject': 'Unknown'}
 
 
+@timed('extract.docx')
 def extract_text_from_docx(docx_file: Union[BytesIO, bytes]) -> str:
     """
     Extract text content from a DOCX file with comprehensive error handling.
@@ -0,0 +1,206 @@
+"""
+Stage timing instrumentation for AI Resume Analyzer
+
+Hot paths wrap each stage in ``with stage('analyze.skills'):`` (or decorate
+an extractor with ``@timed('extract.pdf')``). When profiling is enabled the
+elapsed monotonic time is recorded into a per-process histogram for that
+stage; snapshot() reports counts, totals and percentiles per stage.
+
+Profiling is off unless Config.ENABLE_PROFILING is set or enable() is
+called. Disabled, stage() returns a shared no-op context manager, so the
+instrumentation costs one function call and a flag check per stage.
+"""
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from .config import config
+except ImportError:
+    from config import config
+
+# Each power of two of nanoseconds is split into this many buckets
+# (2 bits of mantissa: relative error of a percentile is at most 25%)
+SUB_BUCKET_BITS = 2
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# Reported percentiles
+PERCENTILES = (50, 90, 99)
+
+_enabled = config.ENABLE_PROFILING
+_histograms: Dict[str, 'LatencyHistogram'] = {}
+_lock = threading.Lock()
+
+
+def bucket_index(nanoseconds: int) -> int:
+    """Log-linear bucket of a duration."""
+    if nanoseconds < SUB_BUCKETS:
+        return max(0, nanoseconds)
+    exponent = nanoseconds.bit_length() - 1
+    mantissa = (nanoseconds >> (exponent - SUB_BUCKET_BITS)) & (SUB_BUCKETS - 1)
+    return (exponent - SUB_BUCKET_BITS + 1) * SUB_BUCKETS + mantissa
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Largest duration, in nanoseconds, that falls into a bucket."""
+    if index < SUB_BUCKETS:
+        return index
+    exponent = index // SUB_BUCKETS + SUB_BUCKET_BITS - 1
+    mantissa = index % SUB_BUCKETS
+    return ((SUB_BUCKETS + mantissa + 1) << (exponent - SUB_BUCKET_BITS)) - 1
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of durations, with exact count, total, min and max."""
+
+    __slots__ = ('count', 'total_ns', 'min_ns', 'max_ns', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets: Dict[int, int] = {}
+
+    def record(self, nanoseconds: int) -> None:
+        if self.count == 0 or nanoseconds < self.min_ns:
+            self.min_ns = nanoseconds
+        if nanoseconds > self.max_ns:
+            self.max_ns = nanoseconds
+        self.count += 1
+        self.total_ns += nanoseconds
+        index = bucket_index(nanoseconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def percentile(self, percent: float) -> int:
+        """
+        Estimate a percentile, in nanoseconds.
+
+        Returns the upper bound of the bucket holding the requested rank,
+        clamped to the observed maximum.
+        """
+        if self.count == 0:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(bucket_upper_bound(index), self.max_ns)
+        return self.max_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary in milliseconds."""
+        summary = {
+            'count': self.count,
+            'total_ms': self.total_ns / 1e6,
+            'mean_ms': self.total_ns / self.count / 1e6 if self.count else 0.0,
+            'min_ms': self.min_ns / 1e6,
+            'max_ms': self.max_ns / 1e6
+        }
+        for percent in PERCENTILES:
+            summary[f'p{percent}_ms'] = self.percentile(percent) / 1e6
+        return summary
+
+
+class _NullTimer:
+    """Shared no-op context manager returned while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class StageTimer:
+    """Context manager recording the time spent in one stage."""
+
+    __slots__ = ('name', '_start')
+
+    def __init__(self, name: str):
+        self.name = name
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, time.perf_counter_ns() - self._start)
+        return False
+
+
+def stage(name: str):
+    """
+    Time a stage of work.
+
+    Usage: ``with stage('analyze.scoring'): ...``. Stages that raise are
+    timed as well.
+    """
+    if not _enabled:
+        return _NULL_TIMER
+    return StageTimer(name)
+
+
+def timed(name: str) -> Callable:
+    """Decorator timing every call of a function as stage name."""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with StageTimer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def record(name: str, nanoseconds: int) -> None:
+    """Add one duration to the histogram of a stage."""
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = LatencyHistogram()
+        histogram.record(nanoseconds)
+
+
+def enable(enabled: bool = True) -> None:
+    """Turn profiling on or off for this process."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def snapshot(prefix: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Summaries of the stage histograms of this process.
+
+    Args:
+        prefix: Only report stages whose name starts with prefix (e.g. 'analyze.')
+
+    Returns:
+        Dictionary of stage name to count, total, mean, min, max and
+        percentiles, in milliseconds, sorted by stage name
+    """
+    with _lock:
+        return {
+            name: histogram.to_dict()
+            for name, histogram in sorted(_histograms.items())
+            if prefix is None or name.startswith(prefix)
+        }
+
+
+def reset() -> None:
+    """Discard every recorded timing."""
+    with _lock:
+        _histograms.clear()
@@ -0,0 +1,303 @@
+"""
+Declarative recommendation rules for AI Resume Analyzer
+
+Each recommendation is a Rule: a message and the conditions under which
+it applies, written as "column operator number" over the feature row of a
+resume (the columns of batch_scoring.FEATURE_COLUMNS, the six scores and a
+few derived columns). DecisionTable compiles the rules once: every distinct
+condition becomes one predicate, evaluated once per resume, and a rule
+fires when all of its predicates hold. Recommendations therefore never
+touch the resume text, and the same table evaluates a whole batch with
+NumPy in one pass per predicate.
+"""
+import operator
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+try:
+    from .tokenizer import SECTION_KEYWORDS
+except ImportError:
+    from tokenizer import SECTION_KEYWORDS
+
+SECTION_NAMES = tuple(SECTION_KEYWORDS)
+
+# Sections every resume is told to have, in the order they are listed
+RECOMMENDED_SECTIONS = ('Experience', 'Education', 'Skills')
+
+# At most this many recommendations are returned, in rule order
+MAX_RECOMMENDATIONS = 6
+
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# Columns computed from the base row; each works on ints and on NumPy arrays alike
+DERIVED_COLUMNS: Dict[str, Callable[[Mapping[str, Any]], Any]] = {
+    'has_complete_contact': lambda row: row['has_email'] & row['has_phone'],
+    'missing_recommended_sections': lambda row: sum(
+        1 - row[f'has_section_{name.lower()}'] for name in RECOMMENDED_SECTIONS
+    ),
+}
+
+# Placeholders that messages may use: the columns each one reads, and how it is rendered from them
+MESSAGE_FIELDS: Dict[str, Tuple[Tuple[str, ...], Callable[[Mapping[str, Any]], str]]] = {
+    'missing_sections': (
+        tuple(f'has_section_{name.lower()}' for name in RECOMMENDED_SECTIONS),
+        lambda row: ', '.join(name for name in RECOMMENDED_SECTIONS if not row[f'has_section_{name.lower()}']),
+    ),
+}
+
+
+class Rule:
+    """A recommendation and the conditions under which it is given."""
+
+    __slots__ = ('name', 'when', 'message')
+
+    def __init__(self, name: str, when: Iterable[str], message: str):
+        """
+        Args:
+            name: Identifier of the rule
+            when: Conditions that must all hold, e.g. 'content_quality < 70'
+            message: Recommendation text; may use the MESSAGE_FIELDS placeholders
+        """
+        self.name = name
+        self.when = tuple(when)
+        self.message = message
+
+    def __repr__(self) -> str:
+        return f"Rule({self.name!r}, when={list(self.when)})"
+
+
+# In output order; the first MAX_RECOMMENDATIONS rules that fire are returned
+RECOMMENDATION_RULES: Tuple[Rule, ...] = (
+    # Content
+    Rule('expand_content', ['content_quality < 70', 'word_count < 200'],
+         "Expand your resume content. Add more details about your achievements and responsibilities (aim for 300-600 words)."),
+    Rule('condense_content', ['content_quality < 70', 'word_count > 900'],
+         "Condense your resume. Focus on the most impactful achievements and keep it concise."),
+    Rule('action_verbs', ['content_quality < 70', 'action_verb_count < 8'],
+         "Use more action verbs. Start bullet points with strong verbs like 'Led', 'Developed', 'Implemented', 'Optimized'."),
+    Rule('quantify', ['content_quality < 70', 'quantified_count < 3'],
+         "Quantify your achievements. Use specific numbers and percentages (e.g., 'Increased sales by 35%')."),
+    # Keywords
+    Rule('technical_skills', ['keyword_optimization < 70', 'technical_skill_count < 5'],
+         "Add more relevant technical skills. Include programming languages, tools, and technologies you've used."),
+    Rule('soft_skills', ['keyword_optimization < 70', 'soft_skill_count < 3'],
+         "Highlight soft skills like leadership, communication, teamwork, and problem-solving."),
+    # ATS
+    Rule('missing_sections', ['ats_compatibility < 70', 'missing_recommended_sections > 0'],
+         "Add required sections: {missing_sections}. These are essential for ATS systems."),
+    Rule('contact_info', ['ats_compatibility < 70', 'has_complete_contact == 0'],
+         "Include complete contact information: email and phone number at the top of your resume."),
+    # Structure
+    Rule('structure', ['structure_score < 70'],
+         "Improve resume structure. Use clear section headings: Contact, Summary, Experience, Education, Skills."),
+    Rule('dates', ['structure_score < 70', 'has_dates == 0'],
+         "Include dates for your work experience and education to show career progression."),
+    # Overall guidance; exactly one of these fires
+    Rule('strong', ['overall_score >= 80'],
+         "Strong resume! Consider tailoring it for specific job descriptions to further improve your match rate."),
+    Rule('good', ['overall_score >= 60', 'overall_score < 80'],
+         "Good foundation. Focus on the specific improvements above to reach the next level."),
+    Rule('essentials', ['overall_score < 60'],
+         "Focus on the essentials first: clear sections, contact info, work experience with achievements, and relevant skills."),
+)
+
+
+def feature_row(context, scores: Mapping[str, int]) -> Dict[str, int]:
+    """
+    Build the row the rules are evaluated on.
+
+    Args:
+        context: AnalysisContext or FeatureRecord of the resume
+        scores: Scores of the resume
+
+    Returns:
+        Dictionary with the batch_scoring.FEATURE_COLUMNS values and the scores
+    """
+    contact_info = context.contact_info
+    sections = context.sections
+    row = {
+        'word_count': context.word_count,
+        'action_verb_count': context.action_verb_count,
+        'quantified_count': context.quantified_count,
+        'technical_skill_count': len(context.technical_skills),
+        'soft_skill_count': len(context.soft_skills),
+        'has_email': int(bool(contact_info.get('has_email'))),
+        'has_phone': int(bool(contact_info.get('has_phone'))),
+        'has_dates': int(context.has_dates),
+    }
+    for name in SECTION_NAMES:
+        row[f'has_section_{name.lower()}'] = int(name in sections)
+    row.update(scores)
+    return row
+
+
+def _parse_condition(condition: str) -> Tuple[str, str, float]:
+    parts = condition.split()
+    if len(parts) != 3 or parts[1] not in OPERATORS:
+        raise ValueError(f"Invalid rule condition '{condition}'; expected 'column operator number'")
+    column, symbol, value = parts
+    try:
+        number = int(value)
+    except ValueError:
+        number = float(value)
+    return column, symbol, number
+
+
+class DecisionTable:
+    """
+    Recommendation rules compiled into predicates and per-rule bitmasks.
+    """
+
+    def __init__(self, rules: Iterable[Rule] = RECOMMENDATION_RULES,
+                 limit: int = MAX_RECOMMENDATIONS):
+        """
+        Compile the rules.
+
+        Args:
+            rules: Rules in output order
+            limit: Maximum number of recommendations per resume
+
+        Raises:
+            ValueError: If a condition cannot be parsed or a message uses an
+                unknown placeholder
+        """
+        self.rules = tuple(rules)
+        self.limit = limit
+        predicates: Dict[Tuple[str, str, float], int] = {}
+        masks = []
+        for rule in self.rules:
+            mask = 0
+            for condition in rule.when:
+                key = _parse_condition(condition)
+                mask |= 1 << predicates.setdefault(key, len(predicates))
+            masks.append(mask)
+            try:
+                rule.message.format(**{field: '' for field in MESSAGE_FIELDS})
+            except (KeyError, IndexError) as e:
+                raise ValueError(f"Rule '{rule.name}' uses an unknown placeholder: {e}") from e
+        self.predicates: Tuple[Tuple[str, str, float], ...] = tuple(predicates)
+        self._masks = tuple(masks)
+        self._compare = tuple((column, OPERATORS[symbol], value) for column, symbol, value in self.predicates)
+        self._templated = tuple('{' in rule.message for rule in self.rules)
+        self._field_columns = tuple(sorted({column for columns, _ in MESSAGE_FIELDS.values() for column in columns}))
+
+    def _render(self, index: int, row: Mapping[str, Any]) -> str:
+        message = self.rules[index].message
+        if not self._templated[index]:
+            return message
+        return message.format(**{field: render(row) for field, (_, render) in MESSAGE_FIELDS.items()})
+
+    def _with_derived(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        row = dict(row)
+        for column, derive in DERIVED_COLUMNS.items():
+            row[column] = derive(row)
+        return row
+
+    def evaluate(self, row: Mapping[str, Any]) -> List[str]:
+        """
+        Return the recommendations for one resume.
+
+        Args:
+            row: Row built by feature_row
+
+        Returns:
+            Messages of the first `limit` rules that fire, in rule order
+
+        Raises:
+            KeyError: If a condition names a column the row does not have
+        """
+        row = self._with_derived(row)
+        truth = 0
+        for bit, (column, compare, value) in enumerate(self._compare):
+            if compare(row[column], value):
+                truth |= 1 << bit
+
+        recommendations = []
+        for index, mask in enumerate(self._masks):
+            if truth & mask == mask:
+                recommendations.append(self._render(index, row))
+                if len(recommendations) == self.limit:
+                    break
+        return recommendations
+
+    def evaluate_batch(self, features, scores) -> List[List[str]]:
+        """
+        Return the recommendations for every row of a batch.
+
+        Args:
+            features: Matrix built by batch_scoring.feature_matrix
+            scores: Matrix returned by batch_scoring.score_matrix for it
+
+        Returns:
+            One list of messages per row, equal to evaluate() on that row
+
+        Raises:
+            ValueError: If the rules and placeholder values are too many to
+                pack into one 62-bit code per row
+        """
+        import numpy as np
+
+        try:
+            from .batch_scoring import FEATURE_COLUMNS, SCORE_NAMES
+        except ImportError:
+            from batch_scoring import FEATURE_COLUMNS, SCORE_NAMES
+
+        features = np.asarray(features, dtype=np.int64)
+        scores = np.asarray(scores, dtype=np.int64)
+        count = len(features)
+        if not count:
+            return []
+        columns = {name: features[:, index] for index, name in enumerate(FEATURE_COLUMNS)}
+        columns.update({name: scores[:, index] for index, name in enumerate(SCORE_NAMES)})
+        columns = self._with_derived(columns)
+
+        # (rows, predicates) truth table, then (rows, rules): a rule fires when all its predicates hold
+        truth = np.zeros((count, len(self._compare)), dtype=np.int64)
+        for bit, (column, compare, value) in enumerate(self._compare):
+            truth[:, bit] = compare(columns[column], value)
+        required = np.array(
+            [[mask >> bit & 1 for bit in range(len(self._compare))] for mask in self._masks], dtype=np.int64
+        ).reshape(len(self._masks), len(self._compare))
+        fired = truth @ required.T == required.sum(axis=1)
+
+        # Messages depend only on which rules fired and on the placeholder
+        # columns, so each distinct combination is rendered once. Both are
+        # packed into one integer code per row (mixed radix), which
+        # np.unique sorts far faster than rows of a matrix.
+        codes = np.zeros(count, dtype=np.int64)
+        radix = 1
+        for index in range(len(self._masks)):
+            codes += fired[:, index].astype(np.int64) * radix
+            radix *= 2
+        field_values = []
+        for name in self._field_columns:
+            values, positions = np.unique(columns[name], return_inverse=True)
+            codes += positions.reshape(-1).astype(np.int64) * radix
+            radix *= len(values)
+            field_values.append(values.tolist())
+        if radix >= 1 << 62:
+            raise ValueError("Too many rules and placeholder values to evaluate as a batch")
+
+        combinations, inverse = np.unique(codes, return_inverse=True)
+        rendered = []
+        for code in combinations.tolist():
+            indices = []
+            for index in range(len(self._masks)):
+                if code & 1 and len(indices) < self.limit:
+                    indices.append(index)
+                code >>= 1
+            row = {}
+            for name, values in zip(self._field_columns, field_values):
+                code, position = divmod(code, len(values))
+                row[name] = values[position]
+            rendered.append([self._render(index, row) for index in indices])
+        return [list(rendered[combination]) for combination in inverse.reshape(-1).tolist()]
+
+
+DEFAULT_TABLE = DecisionTable()
@@ -0,0 +1,167 @@
+"""
+Analysis result cache for AI Resume Analyzer
+"""
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+try:
+    from .config import config
+except ImportError:
+    from config import config
+
+
+def config_fingerprint(*configs) -> str:
+    """
+    Fingerprint the public settings of one or more configuration objects.
+
+    Any change to a setting (including the order of ordered settings such as
+    SKILLS_SCORE_THRESHOLDS) produces a different fingerprint.
+    """
+    digest = hashlib.sha256()
+    for cfg in configs:
+        for name in sorted(dir(cfg)):
+            if not name.isupper():
+                continue
+            value = getattr(cfg, name)
+            if isinstance(value, (set, frozenset)):
+                value = sorted(value)
+            digest.update(f"{name}={value!r};".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def make_cache_key(resume_text: str, fingerprint: str) -> str:
+    """
+    Build a content-addressed cache key for a resume.
+
+    Whitespace is normalized before hashing since no detector distinguishes
+    between runs of whitespace, so trivially re-formatted resumes share a key.
+    """
+    digest = hashlib.sha256(fingerprint.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(' '.join(resume_text.split()).encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class CacheBackend:
+    """
+    Interface shared by the result cache backends.
+
+    Values are plain JSON-compatible structures (analysis result dicts and
+    extracted text). ``get`` returns None on a miss; backends never raise for
+    a missing or expired key. ``get_many``/``set_many`` default to looping
+    over the single-key methods; networked backends override them to batch
+    round trips.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def get_many(self, keys: Iterable[str]) -> List[Optional[Any]]:
+        """Return the cached values for keys, in order, with None for misses."""
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Mapping[str, Any]) -> None:
+        """Store every key/value pair of items."""
+        for key, value in items.items():
+            self.set(key, value)
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class AnalysisCache(CacheBackend):
+    """
+    Thread-safe, size-bounded LRU cache with per-entry expiry.
+
+    This is the in-process backend; see cache_backends for the shared one.
+
+    Values are copied on the way in and out, so callers may freely modify the
+    results they receive.
+    """
+
+    def __init__(self, max_entries: int = None, ttl_seconds: float = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: Maximum number of cached results (defaults to Config.CACHE_MAX_ENTRIES)
+            ttl_seconds: Lifetime of an entry (defaults to Config.CACHE_TTL_SECONDS)
+            clock: Monotonic time source, replaceable for testing
+        """
+        self.max_entries = config.CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.ttl_seconds = config.CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._clock = clock
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a copy of value, evicting the least recently used entries if full."""
+        if self.max_entries <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'backend': 'memory',
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
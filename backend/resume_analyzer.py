@@ -1,85 +1,631 @@
-import re
+import os
+import time
 import logging
-from collections import Counter
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Iterator, Tuple, Union
 try:
-    from .config import skills_config, scoring_config
+    from .config import config, skills_config, scoring_config
+    from .skill_taxonomy import load_skill_matcher, load_taxonomy_file
+    from .fuzzy_matcher import FuzzyMatch, FuzzySkillIndex
+    from .analysis_context import AnalysisContext, FeatureRecord
+    from .analysis_profiles import DEFAULT_PROFILE, PROFILE_STAGES, validate_profile
+    from .analysis_result import AnalysisResult, SkillVocabulary
+    from .recommendation_rules import DEFAULT_TABLE, feature_row
+    from .patterns import contains_email, detect_contact
+    from .profiling import stage
+    from .tokenizer import TokenFeatures, TokenStream, scan_tokens
+    from .section_segmenter import SectionSpan
+    from .stream_analysis import StreamingAnalysis
+    from .text_normalizer import normalize_resume_text
+    from .word_frequency import SketchCounter, WordCounter, WordFrequency, top_k
+    from .result_cache import CacheBackend, config_fingerprint, make_cache_key
 except ImportError:
-    from config import skills_config, scoring_config
+    from config import config, skills_config, scoring_config
+    from skill_taxonomy import load_skill_matcher, load_taxonomy_file
+    from fuzzy_matcher import FuzzyMatch, FuzzySkillIndex
+    from analysis_context import AnalysisContext, FeatureRecord
+    from analysis_profiles import DEFAULT_PROFILE, PROFILE_STAGES, validate_profile
+    from analysis_result import AnalysisResult, SkillVocabulary
+    from recommendation_rules import DEFAULT_TABLE, feature_row
+    from patterns import contains_email, detect_contact
+    from profiling import stage
+    from tokenizer import TokenFeatures, TokenStream, scan_tokens
+    from section_segmenter import SectionSpan
+    from stream_analysis import StreamingAnalysis
+    from text_normalizer import normalize_resume_text
+    from word_frequency import SketchCounter, WordCounter, WordFrequency, top_k
+    from result_cache import CacheBackend, config_fingerprint, make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Pipeline stages that force a feature of the AnalysisContext
+_CONTEXT_STAGES = {
+    'clean': 'clean_text',
+    'tokenize': 'tokens',
+    # Section, date, quantifier and frequency detectors share one pass
+    'sections': 'token_features',
+    'skills': 'skills',
+    'contact': 'contact_info',
+}
+
+# The time budget is checked after these stages, the expensive ones
+_DEADLINE_CHECKS = {
+    'clean': 'cleaning',
+    'sections': 'section detection',
+    'skills': 'skill extraction',
+}
+
+# Analyzer owned by the current batch worker process (see ResumeAnalyzer.analyze_many)
+_worker_analyzer = None
+
+
+class AnalysisTimeoutError(RuntimeError):
+    """Raised when an analysis exceeds its time budget."""
+
+
+def truncate_text(text: str, max_chars: int) -> str:
+    """
+    Cut text to at most max_chars characters, at a whitespace boundary if
+    one is near the limit, so that no word is split.
+    """
+    if len(text) <= max_chars:
+        return text
+    window = max(0, max_chars - 1000)
+    cut = max(text.rfind(' ', window, max_chars + 1), text.rfind('\n', window, max_chars + 1))
+    return text[:cut if cut > 0 else max_chars]
+
+
+class SkillIndex:
+    """
+    The compiled matchers of one taxonomy version.
+
+    An analyzer reads its SkillIndex once per analysis, so replacing it (see
+    ResumeAnalyzer.reload_taxonomy) is atomic: analyses already running
+    finish with the index they started with.
+    """
+    
+    __slots__ = ('matcher', 'fuzzy_index', 'fingerprint', 'vocabulary')
+    
+    def __init__(self, matcher, fuzzy: bool, fuzzy_min_confidence: float):
+        """
+        Args:
+            matcher: SkillMatcher or MappedSkillMatcher
+            fuzzy: Also build the fuzzy index over the matcher's entries
+            fuzzy_min_confidence: Confidence threshold, part of the fingerprint
+        """
+        self.matcher = matcher
+        self.fuzzy_index = FuzzySkillIndex.from_matcher(matcher) if fuzzy else None
+        # Covers the configured terms and aliases, or the checksum of a mapped artifact
+        self.fingerprint = matcher.fingerprint
+        if self.fuzzy_index is not None:
+            self.fingerprint += f"|fuzzy>={fuzzy_min_confidence}"
+        # IDs of the skill names in results; discarded with the taxonomy on reload
+        self.vocabulary = SkillVocabulary()
+    
+    @property
+    def version(self) -> str:
+        """Version label of a mapped artifact, or a short content fingerprint."""
+        return getattr(self.matcher, 'version', '') or self.matcher.fingerprint[:12]
+
+
+def _init_batch_worker(analyzer: 'ResumeAnalyzer') -> None:
+    """Install the analyzer used by this worker process for the rest of the batch."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+
+def _analyze_batch_item(resume_text: str) -> Union[list, Exception]:
+    """Analyze one batch item, returning the exception instead of raising it."""
+    try:
+        # The compact form is small to send back, and the parent decodes it
+        # into its own taxonomy's vocabulary
+        return _worker_analyzer.analyze_compact(resume_text).to_compact()
+    except Exception as e:
+        return e
+
+
 class ResumeAnalyzer:
     """
     Professional resume analyzer with honest, accurate scoring.
     No fake data or inflated scores - provides genuine, actionable feedback.
     """
     
-    def __init__(self):
-        """Initialize the analyzer with comprehensive skill databases from config."""
+    def __init__(self, cache: CacheBackend = None, matcher=None, fuzzy: bool = None,
+                 fuzzy_min_confidence: float = None, max_chars: int = None,
+                 time_budget: float = None, frequency: WordFrequency = None):
+        """
+        Initialize the analyzer with comprehensive skill databases from config.
+        
+        Args:
+            cache: Optional result cache backend consulted before analyzing a resume
+            matcher: Optional skill matcher (SkillMatcher or MappedSkillMatcher);
+                defaults to the configured taxonomy artifact, or SkillsConfig
+            fuzzy: Also match skills within a small edit distance, for damaged
+                text (defaults to Config.ENABLE_FUZZY_MATCHING)
+            fuzzy_min_confidence: Fuzzy matches below this confidence are reported
+                but not counted as skills (defaults to Config.FUZZY_MIN_CONFIDENCE)
+            max_chars: Longer resumes are truncated to this many characters, with
+                a warning in the result (defaults to Config.MAX_RESUME_CHARS)
+            time_budget: Seconds an analysis may take before it is abandoned with
+                AnalysisTimeoutError (defaults to Config.ANALYSIS_TIME_BUDGET_SECONDS)
+            frequency: Word frequency settings: words reported and exact or
+                sketch counting (defaults to the Config.WORD_FREQUENCY_* settings)
+        """
         self.technical_skills = skills_config.TECHNICAL_SKILLS
         self.soft_skills = skills_config.SOFT_SKILLS
         self.action_verbs = skills_config.ACTION_VERBS
+        self.scoring_config = scoring_config
+        # Recommendation rules, compiled once (see backend.recommendation_rules)
+        self.recommendation_table = DEFAULT_TABLE
+        self.cache = cache
+        self.fuzzy = config.ENABLE_FUZZY_MATCHING if fuzzy is None else fuzzy
+        self.fuzzy_min_confidence = (
+            config.FUZZY_MIN_CONFIDENCE if fuzzy_min_confidence is None else fuzzy_min_confidence
+        )
+        self.max_chars = config.MAX_RESUME_CHARS if max_chars is None else max_chars
+        self.time_budget = config.ANALYSIS_TIME_BUDGET_SECONDS if time_budget is None else time_budget
+        self.frequency = frequency if frequency is not None else WordFrequency(
+            config.WORD_FREQUENCY_TOP_K, config.WORD_FREQUENCY_SKETCH,
+            config.WORD_FREQUENCY_SKETCH_WIDTH, config.WORD_FREQUENCY_SKETCH_DEPTH
+        )
+        # Compiled once so extraction is a single scan regardless of taxonomy size
+        self.skill_index = SkillIndex(
+            matcher if matcher is not None else load_skill_matcher(), self.fuzzy, self.fuzzy_min_confidence
+        )
+    
+    @property
+    def matcher(self):
+        """Exact skill matcher of the current taxonomy."""
+        return self.skill_index.matcher
+    
+    @property
+    def fuzzy_index(self):
+        """Fuzzy index of the current taxonomy (None unless fuzzy mode is on)."""
+        return self.skill_index.fuzzy_index
+    
+    @property
+    def taxonomy_version(self) -> str:
+        """Version of the taxonomy new analyses use."""
+        return self.skill_index.version
+    
+    def reload_taxonomy(self, path: str = None, matcher=None) -> str:
+        """
+        Compile a new taxonomy and swap it in atomically.
+        
+        The new matchers are built on the calling thread, so call this from a
+        background thread or admin request rather than the analysis path.
+        Analyses already running finish with the previous taxonomy. The
+        taxonomy is part of cache_fingerprint(), so cached results of the
+        previous version are no longer served.
+        
+        Args:
+            path: Taxonomy artifact or JSON source (defaults to
+                Config.SKILL_TAXONOMY_PATH, or SkillsConfig if that is unset)
+            matcher: Use this compiled matcher instead of loading path
+            
+        Returns:
+            The version of the taxonomy now in use
+            
+        Raises:
+            OSError: If path cannot be read
+            ValueError: If path is not a valid taxonomy
+        """
+        if matcher is None:
+            path = config.SKILL_TAXONOMY_PATH if path is None else path
+            matcher = load_taxonomy_file(path) if path else load_skill_matcher('')
+        # A single attribute assignment: readers see the old index or the new one
+        self.skill_index = SkillIndex(matcher, self.fuzzy, self.fuzzy_min_confidence)
+        return self.skill_index.version
     
-    def analyze(self, resume_text: str) -> Dict[str, Any]:
+    def analyze(self, resume_text: str, include_features: bool = False,
+                profile: str = DEFAULT_PROFILE) -> Dict[str, Any]:
         """
         Perform honest resume analysis with accurate scoring.
         
         Args:
             resume_text: The extracted text from resume
+            include_features: Also return the compact feature record under
+                'features' so the resume can later be re-scored with rescore()
+                (the same as profile='full')
+            profile: Outputs to compute (see analysis_profiles): 'scores'
+                returns only 'scores' and skips every stage they do not
+                depend on, 'standard' the full result, 'full' the full result
+                and 'features'
             
         Returns:
             Dictionary containing genuine analysis results
             
+        Raises:
+            ValueError: If resume_text is invalid or profile is unknown
+            RuntimeError: If analysis fails
+        """
+        validate_profile(profile)
+        include_features = include_features or profile == 'full'
+        if profile == 'scores' and not include_features:
+            return self._analyze_scores(resume_text)
+        
+        result = self.analyze_compact(resume_text, include_features).to_dict()
+        if include_features and 'features' not in result:
+            # Empty input has no feature record
+            result['features'] = None
+        return result
+    
+    def analyze_compact(self, resume_text: str, include_features: bool = False) -> AnalysisResult:
+        """
+        Analyze a resume and return the result as a compact AnalysisResult.
+        
+        The result is a read-only mapping with the same keys as the dictionary
+        returned by analyze(), at a fraction of its memory footprint; use it
+        when many results are held at once (sessions, batches).
+        
+        Args:
+            resume_text: The extracted text from resume
+            include_features: Keep the feature record on the result ('features')
+            
+        Returns:
+            AnalysisResult for the resume
+            
         Raises:
             ValueError: If resume_text is invalid
+            AnalysisTimeoutError: If the analysis exceeds the time budget
             RuntimeError: If analysis fails
         """
+        resume_text, warnings = self._prepare_text(resume_text)
+        if not resume_text:
+            return self._get_empty_compact_result()
+        
+        with stage('analyze.total'):
+            return self._analyze_cached(resume_text, include_features).with_warnings(warnings)
+    
+    def _analyze_scores(self, resume_text: str) -> Dict[str, Any]:
+        """Compute the 'scores' profile: scores only, and any warnings."""
+        resume_text, warnings = self._prepare_text(resume_text)
+        if not resume_text:
+            return {'scores': self._get_empty_result()['scores']}
+        
+        with stage('analyze.total'):
+            scores = None
+            skill_index = self.skill_index
+            if self.cache is not None:
+                # A cached full result has the scores; a scores-only analysis is never cached
+                key = make_cache_key(resume_text, self.cache_fingerprint(skill_index))
+                with stage('analyze.cache_lookup'):
+                    cached = self.cache.get(key)
+                if cached is not None:
+                    scores = AnalysisResult.from_compact(cached, skill_index.vocabulary)['scores']
+            if scores is None:
+                scores = self._score_text(resume_text, skill_index)
+        
+        result: Dict[str, Any] = {'scores': scores}
+        if warnings:
+            result['warnings'] = list(warnings)
+        return result
+    
+    def _prepare_text(self, resume_text: str) -> Tuple[str, Tuple[str, ...]]:
+        """
+        Validate and truncate input text.
+        
+        Returns:
+            The text to analyze ('' if there is nothing to analyze) and the
+            warnings to attach to its result
+            
+        Raises:
+            ValueError: If resume_text is not a string
+        """
         if not isinstance(resume_text, str):
             raise ValueError("resume_text must be a string")
             
         if not resume_text or not resume_text.strip():
-            return self._get_empty_result()
+            return '', ()
         
-        try:
-            clean_text = self._clean_text(resume_text)
-            
-            # Extract genuine features
-            technical_skills = self._extract_technical_skills(clean_text)
-            soft_skills = self._extract_soft_skills(clean_text)
-            action_verbs = self._extract_action_verbs(clean_text)
-            word_freq = self._get_word_frequency(clean_text)
-            sections = self._detect_sections(clean_text)
-            contact_info = self._extract_contact_info(resume_text)
+        warnings = ()
+        if len(resume_text) > self.max_chars:
+            # Degrade instead of pinning a worker on a pasted blob
+            warnings = (f"Resume text is longer than {self.max_chars:,} characters; "
+                        f"only the first {self.max_chars:,} were analyzed.",)
+            resume_text = truncate_text(resume_text, self.max_chars)
+        return resume_text, warnings
+    
+    def analyze_stream(self, chunks: Iterable[str], include_features: bool = False) -> Iterator[AnalysisResult]:
+        """
+        Analyze a resume that arrives as a sequence of text chunks.
+        
+        Chunks are consumed one at a time (e.g. the pages yielded by
+        pdf_extractor.iter_pdf_pages), so the whole text is never held in
+        memory, and a partial result is yielded after each chunk so scores
+        can be shown while later pages are still being read. Terms split
+        across chunk boundaries are matched correctly. The result cache is
+        not consulted, since its key covers the whole text.
+        
+        Args:
+            chunks: Consecutive pieces of the resume text; joined, they form
+                the text analyze() would receive
+            include_features: Keep the feature record on the final result
             
-            # Calculate honest scores
-            scores = self._calculate_scores(clean_text, resume_text, sections, contact_info)
+        Yields:
+            A partial AnalysisResult after every chunk, then the complete
+            result, which equals analyze_compact() of the joined chunks
             
-            # Generate genuine recommendations
-            recommendations = self._generate_recommendations(
-                clean_text, resume_text, scores, technical_skills, 
-                soft_skills, action_verbs, sections, contact_info
-            )
+        Raises:
+            ValueError: If a chunk is not a string
+            AnalysisTimeoutError: If the analysis work exceeds the time budget
+        """
+        stream = StreamingAnalysis(self)
+        for chunk in chunks:
+            with stage('analyze.stream_chunk'):
+                stream.feed(chunk)
+                partial = stream.result()
+            yield partial
+        with stage('analyze.stream_finish'):
+            result = stream.finish(include_features)
+        yield result
+    
+    def _analyze_cached(self, resume_text: str, include_features: bool) -> AnalysisResult:
+        """Serve a result from the cache, analyzing the text on a miss."""
+        # Read once so the cache key and the analysis agree on the taxonomy
+        skill_index = self.skill_index
+        if self.cache is None:
+            return self._analyze_text(resume_text, include_features, skill_index)
+        
+        key = make_cache_key(resume_text, self.cache_fingerprint(skill_index))
+        with stage('analyze.cache_lookup'):
+            cached = self.cache.get(key)
+        if cached is None:
+            # Features are always cached so either kind of request can be served
+            result = self._analyze_text(resume_text, True, skill_index)
+            self.cache.set(key, result.to_compact())
+        else:
+            result = AnalysisResult.from_compact(cached, skill_index.vocabulary)
+        if not include_features:
+            result = result.without_features()
+        return result
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Batch workers get their own copy of the analyzer; the cache and its lock stay here
+        state = self.__dict__.copy()
+        state['cache'] = None
+        return state
+    
+    def cache_fingerprint(self, skill_index: SkillIndex = None) -> str:
+        """Fingerprint of the skill taxonomy and scoring configuration that results depend on."""
+        skill_index = self.skill_index if skill_index is None else skill_index
+        return (skill_index.fingerprint + config_fingerprint(self.scoring_config)
+                + self.frequency.fingerprint + f"|result-v{AnalysisResult.VERSION}")
+    
+    def _analyze_text(self, resume_text: str, include_features: bool,
+                      skill_index: SkillIndex = None) -> AnalysisResult:
+        """Run the analysis pipeline on non-empty text."""
+        profile = 'full' if include_features else 'standard'
+        try:
+            context, outputs = self._run_stages(resume_text, PROFILE_STAGES[profile], skill_index)
             
-            return {
-                'scores': scores,
-                'skills': {
-                    'technical': technical_skills,
-                    'soft': soft_skills
-                },
-                'technical_skills': technical_skills,
-                'soft_skills': soft_skills,
-                'action_verbs': action_verbs,
-                'action_verbs_count': len(action_verbs),
-                'word_count': len(clean_text.split()),
-                'word_frequency': dict(list(word_freq.items())[:10]),
-                'sections_detected': sections,
-                'contact_info': contact_info,
-                'recommendations': recommendations
-            }
+            with stage('analyze.result'):
+                return AnalysisResult(
+                    scores=outputs['scores'],
+                    technical_skills=context.technical_skills,
+                    soft_skills=context.soft_skills,
+                    action_verbs=context.action_verbs,
+                    word_count=context.word_count,
+                    word_frequency=context.word_frequency,
+                    sections=context.sections,
+                    contact_info=context.contact_info,
+                    recommendations=outputs['recommendations'],
+                    fuzzy_matches=context.fuzzy_matches if context.skill_index.fuzzy_index is not None else None,
+                    features=context.features if include_features else None,
+                    vocabulary=context.skill_index.vocabulary
+                )
+        except AnalysisTimeoutError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Analysis failed: {str(e)}") from e
+    
+    def _score_text(self, resume_text: str, skill_index: SkillIndex = None) -> Dict[str, int]:
+        """Run only the stages that scoring depends on."""
+        try:
+            return self._run_stages(resume_text, PROFILE_STAGES['scores'], skill_index)[1]['scores']
+        except AnalysisTimeoutError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Analysis failed: {str(e)}") from e
     
+    def _run_stages(self, resume_text: str, stages: Tuple[str, ...],
+                    skill_index: SkillIndex = None) -> Tuple[AnalysisContext, Dict[str, Any]]:
+        """
+        Run pipeline stages in order (see analysis_profiles.stages_for).
+        
+        Returns:
+            The context holding the extracted features, and the scores and
+            recommendations if those stages ran
+        """
+        deadline = time.monotonic() + self.time_budget
+        # Every feature is computed once and shared by scorers and recommenders
+        context = AnalysisContext(self, resume_text, skill_index,
+                                  count_words='word_frequency' in stages and not self.frequency.sketch)
+        outputs: Dict[str, Any] = {}
+        
+        # Features are forced stage by stage so each one can be timed and
+        # the time budget checked in between; stages without a step here are
+        # read off the context when the result is assembled
+        for name in stages:
+            if name == 'scoring':
+                with stage('analyze.scoring'):
+                    outputs['scores'] = self._calculate_scores(context)
+            elif name == 'recommendations':
+                with stage('analyze.recommendations'):
+                    outputs['recommendations'] = self._generate_recommendations(context, outputs['scores'])
+            elif name in _CONTEXT_STAGES:
+                with stage(f'analyze.{name}'):
+                    getattr(context, _CONTEXT_STAGES[name])
+            if name in _DEADLINE_CHECKS:
+                self._check_deadline(deadline, _DEADLINE_CHECKS[name])
+        return context, outputs
+    
+    def _check_deadline(self, deadline: float, completed: str) -> None:
+        """Abandon the analysis if its time budget is spent."""
+        if time.monotonic() > deadline:
+            raise AnalysisTimeoutError(
+                f"Analysis exceeded its time budget of {self.time_budget:g}s (after {completed})"
+            )
+    
+    def analyze_sections(self, resume_text: str,
+                         sections: Iterable[str] = None) -> List[Dict[str, Any]]:
+        """
+        Segment a resume into sections and extract features per section.
+        
+        Lets callers tell apart, for example, skills listed under Skills from
+        skills demonstrated under Experience. Only the spans of the requested
+        sections are scanned.
+        
+        Args:
+            resume_text: The extracted text from resume
+            sections: Section names to analyze (defaults to all), e.g. ['Experience']
+            
+        Returns:
+            One dictionary per section span, in document order, with the span
+            ('section', 'heading', 'start', 'end' offsets into resume_text),
+            'technical_skills', 'soft_skills', 'action_verbs',
+            'quantified_count' and 'word_count'
+            
+        Raises:
+            ValueError: If resume_text is not a string
+        """
+        if not isinstance(resume_text, str):
+            raise ValueError("Resume text must be a string")
+        return AnalysisContext(self, resume_text).section_features(sections)
+    
+    def rescore(self, features: Union[FeatureRecord, Dict[str, Any], None],
+                scoring_config=None) -> Dict[str, Any]:
+        """
+        Recompute scores and recommendations from a stored feature record.
+        
+        No text processing is involved, so re-scoring an archive after tuning
+        ScoringConfig only costs the scoring arithmetic.
+        
+        Args:
+            features: Record from analyze(..., include_features=True), either as
+                a FeatureRecord or its dictionary form
+            scoring_config: Scoring configuration to apply (defaults to the analyzer's)
+            
+        Returns:
+            Dictionary with 'scores' and 'recommendations'
+        """
+        if features is None:
+            empty = self._get_empty_result()
+            return {'scores': empty['scores'], 'recommendations': empty['recommendations']}
+        if isinstance(features, dict):
+            features = FeatureRecord.from_dict(features)
+        
+        scores = self._calculate_scores(features, scoring_config)
+        return {
+            'scores': scores,
+            'recommendations': self._generate_recommendations(features, scores)
+        }
+    
+    def rescore_many(self, records: Iterable[Union[FeatureRecord, Dict[str, Any], None]],
+                     scoring_config=None) -> List[Dict[str, Any]]:
+        """
+        Re-score many stored feature records at once.
+        
+        Scores for the whole batch are computed with the vectorized engine in
+        backend.batch_scoring, and recommendations with the vectorized decision
+        table; results match calling rescore() on each record.
+        
+        Args:
+            records: Feature records (or their dictionary form)
+            scoring_config: Scoring configuration to apply (defaults to the analyzer's)
+            
+        Returns:
+            List of dictionaries with 'scores' and 'recommendations', in input order
+        """
+        try:
+            from .batch_scoring import feature_matrix, score_dicts, score_matrix
+        except ImportError:
+            from batch_scoring import feature_matrix, score_dicts, score_matrix
+        
+        records = [FeatureRecord.from_dict(r) if isinstance(r, dict) else r for r in records]
+        present = [record for record in records if record is not None]
+        config = scoring_config or self.scoring_config
+        features = feature_matrix(present)
+        scores = score_matrix(features, config)
+        all_scores = iter(score_dicts(scores))
+        all_recommendations = iter(self.recommendation_table.evaluate_batch(features, scores))
+        
+        results = []
+        for record in records:
+            if record is None:
+                results.append(self.rescore(None))
+                continue
+            results.append({
+                'scores': next(all_scores),
+                'recommendations': next(all_recommendations)
+            })
+        return results
+    
+    def analyze_many(self, texts: Iterable[str], workers: int = None, chunksize: int = None,
+                     compact: bool = False) -> List[Union[Dict[str, Any], AnalysisResult, Exception]]:
+        """
+        Analyze a batch of resumes on a pool of worker processes.
+        
+        Each worker receives its own copy of this analyzer once, when the pool
+        starts, and then processes chunks of the batch.
+        
+        Args:
+            texts: Resume texts to analyze
+            workers: Number of worker processes (defaults to the CPU count)
+            chunksize: Number of resumes sent to a worker at a time
+            compact: Return AnalysisResult objects instead of dictionaries,
+                which keeps large batches small in memory
+            
+        Returns:
+            One entry per input, in input order. Items that could not be
+            analyzed hold the exception raised for them instead of a result,
+            so a single bad resume never aborts the batch.
+        """
+        texts = list(texts)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(texts)))
+        
+        if workers == 1:
+            results = []
+            for resume_text in texts:
+                try:
+                    results.append(self.analyze_compact(resume_text))
+                except Exception as e:
+                    results.append(e)
+        else:
+            if chunksize is None:
+                # A few chunks per worker keeps the pool balanced without per-item IPC
+                chunksize = max(1, -(-len(texts) // (workers * 4)))
+            
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                     initargs=(self,)) as executor:
+                vocabulary = self.skill_index.vocabulary
+                results = [
+                    item if isinstance(item, Exception) else AnalysisResult.from_compact(item, vocabulary)
+                    for item in executor.map(_analyze_batch_item, texts, chunksize=chunksize)
+                ]
+        
+        if compact:
+            return results
+        return [item if isinstance(item, Exception) else item.to_dict() for item in results]
+    
+    def _get_empty_compact_result(self) -> AnalysisResult:
+        """Return the compact result for empty input."""
+        empty = self._get_empty_result()
+        return AnalysisResult(
+            scores=empty['scores'],
+            technical_skills=(),
+            soft_skills=(),
+            action_verbs=(),
+            word_count=0,
+            word_frequency={},
+            sections=(),
+            contact_info={},
+            recommendations=empty['recommendations'],
+            vocabulary=self.skill_index.vocabulary
+        )
+    
     def _get_empty_result(self) -> Dict[str, Any]:
         """Return result for empty input."""
         return {
@@ -108,111 +654,152 @@ class ResumeAnalyzer:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s.,@()\-+#&/:]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip().lower()
+        return normalize_resume_text(text)
+    
+    def _extract_skills(self, text: Union[str, TokenStream]) -> Tuple[List[str], List[str], List[str]]:
+        """Extract technical skills, soft skills and action verbs in one scan."""
+        if isinstance(text, str):
+            text = TokenStream(text)
+        return self._format_skills(*self._find_skills(text))
+    
+    def _find_skills(self, stream: TokenStream,
+                     skill_index: SkillIndex = None) -> Tuple[Dict[str, List[str]], List[FuzzyMatch]]:
+        """Run the exact matcher and, in fuzzy mode, the fuzzy index over a token stream."""
+        skill_index = self.skill_index if skill_index is None else skill_index
+        found = skill_index.matcher.scan(stream.tokens)
+        if skill_index.fuzzy_index is None:
+            return found, []
+        return found, skill_index.fuzzy_index.search(stream.tokens, found)
+    
+    def _format_skills(self, found: Dict[str, List[str]],
+                       fuzzy_matches: List[FuzzyMatch]) -> Tuple[List[str], List[str], List[str]]:
+        """Turn raw matches into the sorted, title-cased skill lists of a result."""
+        technical = {skill.title() for skill in found['technical']}
+        soft = {skill.title() for skill in found['soft']}
+        for match in fuzzy_matches:
+            if match.confidence < self.fuzzy_min_confidence:
+                continue
+            if match.category == 'technical':
+                technical.add(match.skill.title())
+            elif match.category == 'soft':
+                soft.add(match.skill.title())
+        return sorted(technical), sorted(soft), found['action_verbs']
     
     def _extract_technical_skills(self, text: str) -> List[str]:
         """Extract technical skills found in text."""
-        found_skills = set()
-        for skill in self.technical_skills:
-            if re.search(rf'\b{re.escape(skill)}\b', text):
-                found_skills.add(skill.title())
-        return sorted(list(found_skills))
+        return self._extract_skills(text)[0]
     
     def _extract_soft_skills(self, text: str) -> List[str]:
         """Extract soft skills found in text."""
-        found_skills = set()
-        for skill in self.soft_skills:
-            if re.search(rf'\b{re.escape(skill)}\b', text):
-                found_skills.add(skill.title())
-        return sorted(list(found_skills))
+        return self._extract_skills(text)[1]
     
     def _extract_action_verbs(self, text: str) -> List[str]:
         """Extract action verbs found in text."""
-        found_verbs = []
-        for verb in self.action_verbs:
-            if re.search(rf'\b{verb}\b', text):
-                found_verbs.append(verb)
-        return found_verbs
+        return self._extract_skills(text)[2]
     
-    def _get_word_frequency(self, text: str) -> Dict[str, int]:
+    def _extract_span_features(self, resume_text: str, span: SectionSpan,
+                               skill_index: SkillIndex = None) -> Dict[str, Any]:
+        """Extract skills, action verbs and quantified achievements from one section."""
+        stream = TokenStream(self._clean_text(span.body(resume_text)))
+        technical_skills, soft_skills, action_verbs = self._format_skills(*self._find_skills(stream, skill_index))
+        features = span.to_dict()
+        features.update({
+            'technical_skills': technical_skills,
+            'soft_skills': soft_skills,
+            'action_verbs': action_verbs,
+            'quantified_count': scan_tokens(stream).quantified_count,
+            'word_count': stream.word_count
+        })
+        return features
+    
+    def _get_word_frequency(self, text: Union[str, TokenStream]) -> Dict[str, int]:
         """Get word frequency for common important words."""
-        stopwords = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
-            'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'resume', 'cv', 'name', 'address', 'phone', 'email'
-        }
-        
-        words = re.findall(r'\b[a-z]{3,}\b', text)
-        filtered_words = [w for w in words if w not in stopwords and len(w) > 3]
-        return dict(Counter(filtered_words).most_common(20))
+        if isinstance(text, str):
+            text = TokenStream(text)
+        return top_k(scan_tokens(text).word_counts, 20)
     
-    def _detect_sections(self, text: str) -> List[str]:
-        """Detect standard resume sections."""
-        sections = []
-        section_patterns = {
-            'Contact': r'\b(contact|phone|email|address|linkedin)\b',
-            'Summary': r'\b(summary|profile|objective|about)\b',
-            'Experience': r'\b(experience|work|employment|career)\b',
-            'Education': r'\b(education|degree|university|college)\b',
-            'Skills': r'\b(skills|technical|competencies)\b',
-            'Projects': r'\b(projects|portfolio)\b',
-            'Certifications': r'\b(certification|certificate|license)\b',
-            'Achievements': r'\b(achievement|award|accomplishment)\b'
-        }
+    def _word_frequency(self, stream: TokenStream, features: TokenFeatures) -> Dict[str, int]:
+        """Frequency stage: the top words of one text, counted as configured."""
+        frequency = self.frequency
+        if not frequency.sketch:
+            # Counted exactly by the token pass
+            return frequency.top(features.word_counts)
+        counter = frequency.new_counter()
+        counter.add_tokens(stream.tokens)
+        return frequency.top(counter)
+    
+    def count_corpus_words(self, texts: Iterable[str],
+                           counter: Union[WordCounter, SketchCounter] = None) -> Union[WordCounter, SketchCounter]:
+        """
+        Count word frequency over a corpus of resumes.
         
-        for section, pattern in section_patterns.items():
-            if re.search(pattern, text):
-                sections.append(section)
+        Uses the same frequency stage as analyze(): the same words are
+        counted, exactly or in a count-min sketch as configured. Only the
+        counter is kept, so a corpus can be counted batch by batch by
+        passing the returned counter back in, and counters from separate
+        workers can be combined with merge().
         
-        return sections
+        Args:
+            texts: Resume texts
+            counter: Counter to add to (defaults to a new one)
+            
+        Returns:
+            The counter; counter.top(k) gives the most frequent words
+            
+        Raises:
+            ValueError: If a text is not a string
+        """
+        counter = self.frequency.new_counter() if counter is None else counter
+        for resume_text in texts:
+            resume_text, _ = self._prepare_text(resume_text)
+            if resume_text:
+                counter.add_tokens(TokenStream(self._clean_text(resume_text)).tokens)
+        return counter
+    
+    def _detect_sections(self, text: Union[str, TokenStream]) -> List[str]:
+        """Detect standard resume sections."""
+        if isinstance(text, str):
+            text = TokenStream(text)
+        return scan_tokens(text).sections
     
     def _extract_contact_info(self, text: str) -> Dict[str, bool]:
-        """Check for contact information."""
-        return {
-            'has_email': bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)),
-            'has_phone': bool(re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text)),
-            'has_linkedin': bool(re.search(r'linkedin\.com', text, re.IGNORECASE))
-        }
+        """Check for contact information (linear time in the length of text)."""
+        return detect_contact(text)
     
-    def _calculate_scores(self, clean_text: str, original_text: str, 
-                         sections: List[str], contact_info: Dict[str, bool]) -> Dict[str, int]:
+    def _calculate_scores(self, context: Union[AnalysisContext, FeatureRecord],
+                          scoring_config=None) -> Dict[str, int]:
         """Calculate honest, accurate scores using configuration constants."""
-        word_count = len(clean_text.split())
+        config = scoring_config or self.scoring_config
+        word_count = context.word_count
+        sections = context.sections
+        contact_info = context.contact_info
         
         # Content Quality Score (0-100) using config
         content_score = 0
-        if scoring_config.OPTIMAL_WORD_COUNT_MIN <= word_count <= scoring_config.OPTIMAL_WORD_COUNT_MAX:
+        if config.OPTIMAL_WORD_COUNT_MIN <= word_count <= config.OPTIMAL_WORD_COUNT_MAX:
             content_score += 40
-        elif (200 <= word_count < scoring_config.OPTIMAL_WORD_COUNT_MIN or 
-              scoring_config.OPTIMAL_WORD_COUNT_MAX < word_count <= 900):
+        elif (200 <= word_count < config.OPTIMAL_WORD_COUNT_MIN or 
+              config.OPTIMAL_WORD_COUNT_MAX < word_count <= 900):
             content_score += 30
         elif 100 <= word_count < 200:
             content_score += 20
         else:
             content_score += 10
         
-        action_verbs = self._extract_action_verbs(clean_text)
         content_score += min(
-            scoring_config.MAX_ACTION_VERB_BONUS, 
-            len(action_verbs) * scoring_config.ACTION_VERB_BONUS_POINTS
+            config.MAX_ACTION_VERB_BONUS, 
+            context.action_verb_count * config.ACTION_VERB_BONUS_POINTS
         )
         
-        quantified = len(re.findall(r'\d+%|\d+\+|increased|improved|reduced', clean_text))
         content_score += min(
-            scoring_config.MAX_QUANTIFIED_BONUS, 
-            quantified * scoring_config.QUANTIFIED_ACHIEVEMENT_BONUS
+            config.MAX_QUANTIFIED_BONUS, 
+            context.quantified_count * config.QUANTIFIED_ACHIEVEMENT_BONUS
         )
         # Keyword Optimization Score (0-100) using config
-        tech_skills = self._extract_technical_skills(clean_text)
-        soft_skills = self._extract_soft_skills(clean_text)
-        total_skills = len(tech_skills) + len(soft_skills)
+        total_skills = len(context.technical_skills) + len(context.soft_skills)
         
         keyword_score = 20  # Base score
-        for threshold, score in scoring_config.SKILLS_SCORE_THRESHOLDS.items():
+        for threshold, score in config.SKILLS_SCORE_THRESHOLDS.items():
             if total_skills >= threshold:
                 keyword_score = score
                 break
@@ -222,16 +809,16 @@ class ResumeAnalyzer:
         # ATS Compatibility Score (0-100) using config
         ats_score = 100
         
-        missing_sections = [s for s in scoring_config.ESSENTIAL_SECTIONS if s not in sections]
-        ats_score -= len(missing_sections) * scoring_config.MISSING_SECTION_PENALTY
+        missing_sections = [s for s in config.ESSENTIAL_SECTIONS if s not in sections]
+        ats_score -= len(missing_sections) * config.MISSING_SECTION_PENALTY
         
         if not contact_info.get('has_email'):
-            ats_score -= scoring_config.MISSING_EMAIL_PENALTY
+            ats_score -= config.MISSING_EMAIL_PENALTY
         if not contact_info.get('has_phone'):
-            ats_score -= scoring_config.MISSING_PHONE_PENALTY
+            ats_score -= config.MISSING_PHONE_PENALTY
         
-        if not re.search(r'\b(19|20)\d{2}\b', clean_text):
-            ats_score -= scoring_config.MISSING_DATES_PENALTY
+        if not context.has_dates:
+            ats_score -= config.MISSING_DATES_PENALTY
         
         # Structure Score (0-100)
         structure_score = 30  # Base score
@@ -263,7 +850,7 @@ class ResumeAnalyzer:
                     completeness_score -= 12
         
         # Calculate overall score using config weights
-        weights = scoring_config.SCORE_WEIGHTS
+        weights = config.SCORE_WEIGHTS
         overall_score = int(
             content_score * weights['content_quality'] +
             keyword_score * weights['keyword_optimization'] +
@@ -281,99 +868,19 @@ class ResumeAnalyzer:
             'completeness': max(0, min(100, completeness_score))
         }
     
-    def _generate_recommendations(self, clean_text: str, original_text: str,
-                                 scores: Dict[str, int], technical_skills: List[str],
-                                 soft_skills: List[str], action_verbs: List[str],
-                                 sections: List[str], contact_info: Dict[str, bool]) -> List[str]:
+    def _generate_recommendations(self, context: Union[AnalysisContext, FeatureRecord],
+                                 scores: Dict[str, int]) -> List[str]:
         """
         Generate honest, actionable recommendations based on analysis results.
         
+        The rules live in backend.recommendation_rules and only read the
+        extracted features and the scores, never the text.
+        
         Args:
-            clean_text: Cleaned resume text
-            original_text: Original resume text
+            context: Analysis context or stored feature record of the resume
             scores: Dictionary of calculated scores
-            technical_skills: List of detected technical skills
-            soft_skills: List of detected soft skills
-            action_verbs: List of detected action verbs
-            sections: List of detected resume sections
-            contact_info: Dictionary of contact information flags
             
         Returns:
             List of recommendation strings
         """
-        recommendations = []
-        word_count = len(clean_text.split())
-        
-        # Content recommendations
-        if scores['content_quality'] < 70:
-            if word_count < 200:
-                recommendations.append(
-                    "Expand your resume content. Add more details about your achievements and responsibilities (aim for 300-600 words)."
-                )
-            elif word_count > 900:
-                recommendations.append(
-                    "Condense your resume. Focus on the most impactful achievements and keep it concise."
-                )
-            
-            if len(action_verbs) < 8:
-                recommendations.append(
-                    "Use more action verbs. Start bullet points with strong verbs like 'Led', 'Developed', 'Implemented', 'Optimized'."
-                )
-            
-            quantified = len(re.findall(r'\d+%|\d+\+|increased|improved|reduced', clean_text))
-            if quantified < 3:
-                recommendations.append(
-                    "Quantify your achievements. Use specific numbers and percentages (e.g., 'Increased sales by 35%')."
-                )
-        
-        # Keyword recommendations
-        if scores['keyword_optimization'] < 70:
-            if len(technical_skills) < 5:
-                recommendations.append(
-                    "Add more relevant technical skills. Include programming languages, tools, and technologies you've used."
-                )
-            if len(soft_skills) < 3:
-                recommendations.append(
-                    "Highlight soft skills like leadership, communication, teamwork, and problem-solving."
-                )
-        
-        # ATS recommendations
-        if scores['ats_compatibility'] < 70:
-            essential_sections = ['Experience', 'Education', 'Skills']
-            missing = [s for s in essential_sections if s not in sections]
-            if missing:
-                recommendations.append(
-                    f"Add required sections: {', '.join(missing)}. These are essential for ATS systems."
-                )
-            
-            if not contact_info.get('has_email') or not contact_info.get('has_phone'):
-                recommendations.append(
-                    "Include complete contact information: email and phone number at the top of your resume."
-                )
-        
-        # Structure recommendations
-        if scores['structure_score'] < 70:
-            recommendations.append(
-                "Improve resume structure. Use clear section headings: Contact, Summary, Experience, Education, Skills."
-            )
-            
-            if not re.search(r'\b(19|20)\d{2}\b', clean_text):
-                recommendations.append(
-                    "Include dates for your work experience and education to show career progression."
-                )
-        
-        # Overall guidance
-        if scores['overall_score'] >= 80:
-            recommendations.append(
-                "Strong resume! Consider tailoring it for specific job descriptions to further improve your match rate."
-            )
-        elif scores['overall_score'] >= 60:
-            recommendations.append(
-                "Good foundation. Focus on the specific improvements above to reach the next level."
-            )
-        else:
-            recommendations.append(
-                "Focus on the essentials first: clear sections, contact info, work experience with achievements, and relevant skills."
-            )
-        
-        return recommendations[:6]
+        return self.recommendation_table.evaluate(feature_row(context, scores))
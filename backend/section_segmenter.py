@@ -0,0 +1,144 @@
+"""
+Section segmentation for AI Resume Analyzer
+
+The tokenizer's section detector only reports which section keywords occur
+somewhere in a resume. The segmenter here finds where each section starts
+and ends: it walks the original text line by line, once, recognizes heading
+lines with a few layout heuristics, and returns character spans so that
+later stages can analyze only the part of the resume they care about.
+"""
+from typing import Dict, Iterator, List, Optional
+
+try:
+    from .patterns import HEADING_WORD_PATTERN
+except ImportError:
+    from patterns import HEADING_WORD_PATTERN
+
+# Section assigned to text that precedes the first heading (name, contact block)
+HEADER_SECTION = 'Header'
+
+# Words that make a short line a heading of the given section. Section names
+# match tokenizer.SECTION_KEYWORDS.
+HEADING_KEYWORDS = {
+    'Contact': ('contact', 'contacts'),
+    'Summary': ('summary', 'profile', 'objective', 'about'),
+    'Experience': ('experience', 'experiences', 'employment', 'work', 'career'),
+    'Education': ('education', 'academic', 'academics'),
+    'Skills': ('skills', 'competencies', 'technologies', 'expertise'),
+    'Projects': ('projects', 'portfolio'),
+    'Certifications': ('certifications', 'certification', 'certificates', 'licenses'),
+    'Achievements': ('achievements', 'awards', 'honors', 'accomplishments')
+}
+
+# Headings are short; longer lines are content that mentions a keyword
+MAX_HEADING_WORDS = 5
+MAX_HEADING_LENGTH = 60
+
+_SECTION_BY_WORD = {
+    word: section
+    for section, words in HEADING_KEYWORDS.items()
+    for word in words
+}
+
+_BULLETS = ('•', '-', '*', '–', '·', '▪', '◦')
+
+
+class SectionSpan:
+    """
+    A section of a resume, as character offsets into the original text.
+
+    Unpacks as ``(section, start, end)``. ``start`` is the start of the
+    heading line and ``body_start`` the first character after it; the header
+    span has no heading, so both are 0.
+    """
+
+    __slots__ = ('section', 'start', 'end', 'body_start', 'heading')
+
+    def __init__(self, section: str, start: int, end: int, body_start: int, heading: str = ''):
+        self.section = section
+        self.start = start
+        self.end = end
+        self.body_start = body_start
+        self.heading = heading
+
+    def __iter__(self) -> Iterator:
+        return iter((self.section, self.start, self.end))
+
+    def body(self, text: str) -> str:
+        """Return the content of the section, without its heading."""
+        return text[self.body_start:self.end]
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            'section': self.section,
+            'heading': self.heading,
+            'start': self.start,
+            'end': self.end
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SectionSpan):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"SectionSpan({self.section!r}, {self.start}, {self.end})"
+
+
+def classify_heading(line: str) -> Optional[str]:
+    """
+    Return the section a line is a heading for, or None for content lines.
+
+    A heading is a short line that is not a bullet, does not read like a
+    sentence, and names a section. It must also look like a heading: written
+    in capitals, ending with a colon, or at most three words long.
+    """
+    stripped = line.strip()
+    if not stripped or len(stripped) > MAX_HEADING_LENGTH or stripped.startswith(_BULLETS):
+        return None
+    if stripped[-1] in '.,;' or '@' in stripped:
+        return None
+
+    words = HEADING_WORD_PATTERN.findall(stripped.lower())
+    if not words or len(words) > MAX_HEADING_WORDS:
+        return None
+
+    section = None
+    for word in words:
+        section = _SECTION_BY_WORD.get(word)
+        if section is not None:
+            break
+    if section is None:
+        return None
+
+    letters = ''.join(char for char in stripped if char.isalpha())
+    if letters.isupper() or stripped.endswith(':') or len(words) <= 3:
+        return section
+    return None
+
+
+def segment_sections(text: str) -> List[SectionSpan]:
+    """
+    Split a resume into section spans in a single pass over its lines.
+
+    Args:
+        text: Original resume text (offsets refer to this string)
+
+    Returns:
+        Spans in document order, covering the whole text. Text before the
+        first heading forms a HEADER_SECTION span, if it is not blank.
+    """
+    spans: List[SectionSpan] = []
+    current = SectionSpan(HEADER_SECTION, 0, len(text), 0)
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        section = classify_heading(line)
+        if section is not None:
+            current.end = offset
+            if current.section != HEADER_SECTION or text[:offset].strip():
+                spans.append(current)
+            current = SectionSpan(section, offset, len(text), offset + len(line), line.strip().rstrip(':').strip())
+        offset += len(line)
+    if current.section != HEADER_SECTION or text.strip():
+        spans.append(current)
+    return spans
@@ -0,0 +1,234 @@
+"""
+Compiled multi-pattern skill matcher for AI Resume Analyzer
+"""
+import hashlib
+import json
+from itertools import islice
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    from .tokenizer import TOKEN_PATTERN, is_word_token
+except ImportError:
+    from tokenizer import TOKEN_PATTERN, is_word_token
+
+
+class SkillMatcher:
+    """
+    Token-trie matcher that finds every configured term in a single scan.
+
+    Terms are grouped by category (technical skills, soft skills, action verbs).
+    Matching follows the ``re.search(rf'\\b{re.escape(term)}\\b', text)`` semantics
+    the analyzer has always used, but the cost of a scan depends on the length of
+    the text and not on the number of configured terms.
+
+    Aliases are compiled into the same trie with their canonical term as the
+    hit, so "k8s" is reported as "kubernetes" without any extra pass.
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]],
+                 aliases: Optional[Mapping[str, Mapping[str, Iterable[str]]]] = None):
+        """
+        Compile the matcher.
+
+        Args:
+            categories: Mapping of category name to the terms in that category
+            aliases: Optional mapping of category name to {canonical term: aliases}
+
+        Raises:
+            ValueError: If aliases name a category that is not in categories, or
+                a canonical term that is not among its category's terms
+        """
+        # Each node is [children, hits] where hits is a tuple of (category, term)
+        self._root: Dict[str, list] = {}
+        self._entries: List[Tuple[str, str, str]] = []
+        self._fingerprint: Optional[str] = None
+        self.categories: Tuple[str, ...] = tuple(categories)
+        self.term_count = 0
+        # Longest compiled spelling, in tokens
+        self.max_term_tokens = 0
+        known: Dict[str, set] = {}
+        for category, terms in categories.items():
+            known[category] = set()
+            for term in terms:
+                known[category].add(term)
+                self.add_term(term, category)
+        for category, canonical_terms in (aliases or {}).items():
+            if category not in known:
+                raise ValueError(f"Aliases given for unknown skill category '{category}'")
+            for canonical, variants in canonical_terms.items():
+                # Aliases only add spellings; the skills themselves come from the taxonomy
+                if canonical not in known[category]:
+                    raise ValueError(f"Aliases given for unknown {category} skill '{canonical}'")
+                for variant in variants:
+                    self.add_term(variant, category, canonical=canonical)
+
+    @classmethod
+    def from_config(cls, skills_config,
+                    aliases: Optional[Mapping[str, Mapping[str, Iterable[str]]]] = None) -> 'SkillMatcher':
+        """Build a matcher for the technical, soft and action verb sets of a SkillsConfig."""
+        return cls({
+            'technical': skills_config.TECHNICAL_SKILLS,
+            'soft': skills_config.SOFT_SKILLS,
+            'action_verbs': skills_config.ACTION_VERBS,
+        }, aliases)
+
+    def add_term(self, term: str, category: str, canonical: str = None) -> None:
+        """
+        Add a single term to the trie.
+
+        Args:
+            term: Spelling to match
+            category: Category the term belongs to
+            canonical: Term to report when this spelling matches (defaults to term)
+        """
+        tokens = TOKEN_PATTERN.findall(term)
+        if not tokens:
+            return
+
+        self.max_term_tokens = max(self.max_term_tokens, len(tokens))
+        children = self._root
+        node = None
+        for token in tokens:
+            node = children.get(token)
+            if node is None:
+                node = [{}, ()]
+                children[token] = node
+            children = node[0]
+
+        hit = (category, canonical or term)
+        if hit not in node[1]:
+            node[1] = node[1] + (hit,)
+            self.term_count += 1
+            self._entries.append((category, term, hit[1]))
+            self._fingerprint = None
+
+    def entries(self) -> List[Tuple[str, str, str]]:
+        """Return every compiled (category, spelling, reported term) entry."""
+        return list(self._entries)
+
+    @property
+    def fingerprint(self) -> str:
+        """Digest of every compiled (category, spelling, reported term) entry."""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for entry in sorted(self._entries):
+                digest.update(repr(entry).encode('utf-8', 'surrogatepass'))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def trie(self) -> list:
+        """Return the root trie node as ``[children, hits]``, e.g. for compiling to an artifact."""
+        return [self._root, ()]
+
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find all terms that occur in text.
+
+        Args:
+            text: Cleaned resume text
+
+        Returns:
+            Dictionary mapping every category to the terms found, in order of first occurrence
+        """
+        return self.scan(TOKEN_PATTERN.findall(text))
+
+    def scan(self, tokens: List[str], first: int = 0, stop: Optional[int] = None) -> Dict[str, List[str]]:
+        """
+        Find all terms in an already tokenized text (see ``TOKEN_PATTERN``).
+
+        Args:
+            tokens: Tokens of the cleaned text
+            first: Only report terms starting at or after this token; earlier
+                tokens are context for the word-boundary check
+            stop: Only report terms starting before this token; later tokens
+                are lookahead (defaults to the end)
+        """
+        found: Dict[str, Dict[str, None]] = {category: {} for category in self.categories}
+        root = self._root
+        count = len(tokens)
+        starts = enumerate(tokens) if first == 0 and stop is None else enumerate(islice(tokens, first, stop), first)
+
+        for start, token in starts:
+            node = root.get(token)
+            if node is None:
+                continue
+
+            # A \b must separate the term from the preceding character
+            first_is_word = is_word_token(token)
+            prev_is_word = start > 0 and is_word_token(tokens[start - 1])
+            if prev_is_word == first_is_word:
+                continue
+
+            end = start
+            while True:
+                if node[1]:
+                    next_is_word = end + 1 < count and is_word_token(tokens[end + 1])
+                    if is_word_token(tokens[end]) != next_is_word:
+                        for category, term in node[1]:
+                            found[category][term] = None
+                end += 1
+                if end >= count:
+                    break
+                node = node[0].get(tokens[end])
+                if node is None:
+                    break
+
+        return {category: list(terms) for category, terms in found.items()}
+
+    def __len__(self) -> int:
+        return self.term_count
+
+
+def aliases_within(categories: Mapping[str, Iterable[str]],
+                   aliases: Optional[Mapping[str, Mapping[str, Iterable[str]]]]
+                   ) -> Optional[Dict[str, Dict[str, List[str]]]]:
+    """
+    Keep the aliases of skills that categories contain.
+
+    For applying a shared alias index to a custom taxonomy, which need not
+    have every skill the index covers.
+    """
+    if aliases is None:
+        return None
+    kept: Dict[str, Dict[str, List[str]]] = {}
+    for category, canonical_terms in aliases.items():
+        terms = set(categories.get(category, ()))
+        kept[category] = {canonical: list(variants) for canonical, variants in canonical_terms.items()
+                          if canonical in terms}
+    return kept
+
+
+def load_aliases(path: str) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Load a skill alias index from a JSON data file.
+
+    The file holds ``{"aliases": {category: {canonical term: [aliases]}}}``.
+    Spellings are lower-cased, since matching runs on normalized text.
+
+    Args:
+        path: Path of the alias file
+
+    Returns:
+        Mapping of category to {canonical term: aliases}
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a valid alias index
+    """
+    with open(path, 'r', encoding='utf-8') as handle:
+        data = json.load(handle)
+
+    categories = data.get('aliases') if isinstance(data, dict) else None
+    if not isinstance(categories, dict):
+        raise ValueError(f"{path} has no 'aliases' mapping")
+
+    index: Dict[str, Dict[str, List[str]]] = {}
+    for category, canonical_terms in categories.items():
+        if not isinstance(canonical_terms, dict):
+            raise ValueError(f"Aliases for '{category}' in {path} must map canonical terms to lists")
+        index[category] = {}
+        for canonical, variants in canonical_terms.items():
+            if isinstance(variants, str) or not all(isinstance(variant, str) for variant in variants):
+                raise ValueError(f"Aliases of '{canonical}' in {path} must be a list of strings")
+            index[category][canonical.lower()] = [variant.lower() for variant in variants]
+    return index
@@ -0,0 +1,584 @@
+"""
+Compiled skill taxonomy artifact for AI Resume Analyzer
+
+Building a SkillMatcher means tokenizing every term and growing a trie of
+Python dicts, which is cheap for the built-in vocabulary but takes seconds
+for a taxonomy of tens of thousands of skills and aliases. This module
+compiles the trie once, at build time, into a versioned binary file, and
+MappedSkillMatcher memory-maps that file read-only. Loading only validates
+the header, so cold start costs milliseconds, and every worker process that
+maps the same file shares its pages through the OS page cache.
+
+File layout (little-endian)::
+
+    header      HEADER (magic, format version, section sizes, SHA-256 of the body)
+    categories  category_count x (string offset, string length)
+    nodes       node_count x (first edge, edge count, first hit, hit count); node 0 is the root
+    edges       edge_count x (token offset, token length, child node), sorted by token bytes per node
+    hits        hit_count x (category index, term offset, term length)
+    strings     UTF-8 string pool
+
+Build an artifact from the configured vocabulary with::
+
+    python -m backend.skill_taxonomy build --output backend/data/skill_taxonomy.bin
+
+Config.SKILL_TAXONOMY_PATH may also name a JSON source file (category to
+terms), compiled in memory when loaded. TaxonomyWatcher polls that file so
+running processes pick up an edited taxonomy without a redeploy.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+from functools import cached_property
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .config import config, skills_config
+    from .skill_matcher import SkillMatcher, aliases_within, load_aliases
+    from .tokenizer import TOKEN_PATTERN, is_word_token
+except ImportError:
+    from config import config, skills_config
+    from skill_matcher import SkillMatcher, aliases_within, load_aliases
+    from tokenizer import TOKEN_PATTERN, is_word_token
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'RSKT'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4sHHIIIIIIII32s')
+STRING_REF = struct.Struct('<II')
+NODE = struct.Struct('<IIII')
+EDGE = struct.Struct('<III')
+HIT = struct.Struct('<III')
+
+# Upper bound on memoized edge lookups per matcher
+_MAX_MEMO_ENTRIES = 1 << 18
+
+# Categories every taxonomy must define; the analyzer reads all three
+REQUIRED_CATEGORIES = ('technical', 'soft', 'action_verbs')
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class _StringPool:
+    """Deduplicating UTF-8 string pool."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self._offsets: Dict[bytes, int] = {}
+
+    def add(self, value: str) -> Tuple[int, int]:
+        encoded = value.encode('utf-8', 'surrogatepass')
+        offset = self._offsets.get(encoded)
+        if offset is None:
+            offset = len(self.data)
+            self.data += encoded
+            self._offsets[encoded] = offset
+        return offset, len(encoded)
+
+
+def compile_taxonomy(categories: Dict[str, Iterable[str]], version: str = '',
+                     aliases: Optional[Dict[str, Dict[str, Iterable[str]]]] = None) -> bytes:
+    """
+    Compile a skill taxonomy into the binary artifact format.
+
+    Args:
+        categories: Mapping of category name to the terms in that category
+        version: Free-form taxonomy version label stored in the artifact
+        aliases: Optional alias index (see skill_matcher.load_aliases)
+
+    Returns:
+        The artifact bytes
+    """
+    matcher = SkillMatcher(categories, aliases)
+    category_index = {category: index for index, category in enumerate(matcher.categories)}
+    pool = _StringPool()
+
+    # Breadth-first numbering keeps the upper levels of the trie close together
+    nodes = [matcher.trie()]
+    node_records, edge_records, hit_records = [], [], []
+    position = 0
+    while position < len(nodes):
+        children, hits = nodes[position]
+        position += 1
+        edges = sorted(
+            (token.encode('utf-8', 'surrogatepass'), token, child) for token, child in children.items()
+        )
+        node_records.append((len(edge_records), len(edges), len(hit_records), len(hits)))
+        for _, token, child in edges:
+            edge_records.append(pool.add(token) + (len(nodes),))
+            nodes.append(child)
+        for category, term in hits:
+            hit_records.append((category_index[category],) + pool.add(term))
+
+    category_refs = [pool.add(category) for category in matcher.categories]
+    version_ref = pool.add(version)
+
+    body = bytearray()
+    for ref in category_refs:
+        body += STRING_REF.pack(*ref)
+    for record in node_records:
+        body += NODE.pack(*record)
+    for record in edge_records:
+        body += EDGE.pack(*record)
+    for record in hit_records:
+        body += HIT.pack(*record)
+    body += pool.data
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0,
+        len(category_refs), len(node_records), len(edge_records), len(hit_records),
+        matcher.term_count, len(pool.data), version_ref[0], version_ref[1],
+        hashlib.sha256(body).digest()
+    )
+    return header + bytes(body)
+
+
+def write_taxonomy(categories: Dict[str, Iterable[str]], path: str, version: str = '',
+                   aliases: Optional[Dict[str, Dict[str, Iterable[str]]]] = None) -> str:
+    """
+    Compile a taxonomy and write it atomically to path.
+
+    Returns:
+        The SHA-256 checksum of the artifact body, as hex
+    """
+    data = compile_taxonomy(categories, version, aliases)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, 'wb') as handle:
+        handle.write(data)
+    # Replacing rather than rewriting keeps already mapped copies intact
+    os.replace(temporary, path)
+    return HEADER.unpack_from(data)[-1].hex()
+
+
+class MappedSkillMatcher:
+    """
+    SkillMatcher backed by a memory-mapped taxonomy artifact.
+
+    Matches exactly what a SkillMatcher built from the same categories
+    matches. Edge lookups binary-search the mapped arrays and are memoized,
+    so steady-state scans run at dictionary speed while untouched parts of
+    the taxonomy are never read.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map an artifact.
+
+        Args:
+            path: Path of a file produced by write_taxonomy
+
+        Raises:
+            ValueError: If the file is not a taxonomy artifact of a supported version
+        """
+        self.path = path
+        with open(path, 'rb') as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._load_header()
+        except ValueError:
+            self._map.close()
+            raise
+        self._memo: Dict[int, Dict[str, int]] = {0: {}}
+        self._memo_entries = 0
+        self._hits: Dict[int, tuple] = {}
+
+    def _load_header(self) -> None:
+        if len(self._map) < HEADER.size:
+            raise ValueError(f"{self.path} is too small to be a skill taxonomy")
+        (magic, version, _, category_count, node_count, edge_count, hit_count,
+         term_count, pool_size, version_offset, version_length, checksum) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a skill taxonomy artifact")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported skill taxonomy format {version} in {self.path} (expected {FORMAT_VERSION}); rebuild it"
+            )
+
+        self._categories_at = HEADER.size
+        self._nodes_at = self._categories_at + category_count * STRING_REF.size
+        self._edges_at = self._nodes_at + node_count * NODE.size
+        self._hits_at = self._edges_at + edge_count * EDGE.size
+        self._pool_at = self._hits_at + hit_count * HIT.size
+        if self._pool_at + pool_size != len(self._map):
+            raise ValueError(f"{self.path} is truncated or corrupt")
+
+        self.node_count = node_count
+        self.term_count = term_count
+        self.checksum = checksum.hex()
+        self.fingerprint = self.checksum
+        self.version = self._string(version_offset, version_length)
+        self.categories: Tuple[str, ...] = tuple(
+            self._string(*STRING_REF.unpack_from(self._map, self._categories_at + index * STRING_REF.size))
+            for index in range(category_count)
+        )
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._pool_at + offset
+        return self._map[start:start + length].decode('utf-8', 'surrogatepass')
+
+    def _search(self, node: int, token: str) -> int:
+        """Binary-search node's edges for token; -1 if absent."""
+        first, count, _, _ = NODE.unpack_from(self._map, self._nodes_at + node * NODE.size)
+        key = token.encode('utf-8', 'surrogatepass')
+        data, edges_at, pool_at = self._map, self._edges_at, self._pool_at
+        low, high = first, first + count
+        while low < high:
+            middle = (low + high) // 2
+            offset, length, child = EDGE.unpack_from(data, edges_at + middle * EDGE.size)
+            candidate = data[pool_at + offset:pool_at + offset + length]
+            if candidate == key:
+                return child
+            if candidate < key:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def _child(self, node: int, token: str) -> int:
+        memo = self._memo.get(node)
+        if memo is None:
+            memo = self._memo[node] = {}
+        child = memo.get(token)
+        if child is None:
+            child = self._search(node, token)
+            if self._memo_entries < _MAX_MEMO_ENTRIES:
+                memo[token] = child
+                self._memo_entries += 1
+        return child
+
+    def _node_hits(self, node: int) -> tuple:
+        hits = self._hits.get(node)
+        if hits is None:
+            _, _, first, count = NODE.unpack_from(self._map, self._nodes_at + node * NODE.size)
+            hits = tuple(
+                (self.categories[category], self._string(offset, length))
+                for category, offset, length in (
+                    HIT.unpack_from(self._map, self._hits_at + index * HIT.size)
+                    for index in range(first, first + count)
+                )
+            )
+            self._hits[node] = hits
+        return hits
+
+    def entries(self) -> List[Tuple[str, str, str]]:
+        """Return every (category, spelling, reported term) entry, walking the whole trie."""
+        entries = []
+        stack = [(0, '')]
+        while stack:
+            node, spelling = stack.pop()
+            first_edge, edge_count, _, _ = NODE.unpack_from(self._map, self._nodes_at + node * NODE.size)
+            for category, term in self._node_hits(node):
+                entries.append((category, spelling, term))
+            for index in range(first_edge, first_edge + edge_count):
+                offset, length, child = EDGE.unpack_from(self._map, self._edges_at + index * EDGE.size)
+                stack.append((child, spelling + self._string(offset, length)))
+        return entries
+
+    def verify(self) -> bool:
+        """Return True if the artifact body matches the checksum in its header."""
+        return hashlib.sha256(self._map[HEADER.size:]).hexdigest() == self.checksum
+
+    def find(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find all terms that occur in text.
+
+        Args:
+            text: Cleaned resume text
+
+        Returns:
+            Dictionary mapping every category to the terms found, in order of first occurrence
+        """
+        return self.scan(TOKEN_PATTERN.findall(text))
+
+    @cached_property
+    def max_term_tokens(self) -> int:
+        """Longest compiled spelling, in tokens (walks the trie once)."""
+        deepest = 0
+        stack = [(0, 0)]
+        while stack:
+            node, depth = stack.pop()
+            deepest = max(deepest, depth)
+            first_edge, edge_count, _, _ = NODE.unpack_from(self._map, self._nodes_at + node * NODE.size)
+            for index in range(first_edge, first_edge + edge_count):
+                stack.append((EDGE.unpack_from(self._map, self._edges_at + index * EDGE.size)[2], depth + 1))
+        return deepest
+
+    def scan(self, tokens: List[str], first: int = 0, stop: Optional[int] = None) -> Dict[str, List[str]]:
+        """
+        Find all terms in an already tokenized text (see ``TOKEN_PATTERN``).
+
+        Args:
+            tokens: Tokens of the cleaned text
+            first: Only report terms starting at or after this token
+            stop: Only report terms starting before this token (defaults to the end)
+        """
+        found: Dict[str, Dict[str, None]] = {category: {} for category in self.categories}
+        root = self._memo[0]
+        child_of = self._child
+        hits_of = self._node_hits
+        count = len(tokens)
+        starts = enumerate(tokens) if first == 0 and stop is None else enumerate(islice(tokens, first, stop), first)
+
+        for start, token in starts:
+            node = root.get(token)
+            if node is None:
+                node = child_of(0, token)
+            if node < 0:
+                continue
+
+            # A \b must separate the term from the preceding character
+            first_is_word = is_word_token(token)
+            prev_is_word = start > 0 and is_word_token(tokens[start - 1])
+            if prev_is_word == first_is_word:
+                continue
+
+            end = start
+            while True:
+                hits = hits_of(node)
+                if hits:
+                    next_is_word = end + 1 < count and is_word_token(tokens[end + 1])
+                    if is_word_token(tokens[end]) != next_is_word:
+                        for category, term in hits:
+                            found[category][term] = None
+                end += 1
+                if end >= count:
+                    break
+                node = child_of(node, tokens[end])
+                if node < 0:
+                    break
+
+        return {category: list(terms) for category, terms in found.items()}
+
+    def close(self) -> None:
+        """Unmap the artifact."""
+        self._map.close()
+
+    def __getstate__(self):
+        # Worker processes re-map the file instead of copying it
+        return {'path': self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+
+    def __len__(self) -> int:
+        return self.term_count
+
+
+def resolve_taxonomy_path(path: str) -> str:
+    """Resolve a configured artifact path relative to the project root."""
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def load_taxonomy_file(path: str):
+    """
+    Load the taxonomy at path: a compiled artifact is mapped, a JSON source
+    file (see ``build --source``) is compiled with the configured aliases of
+    the skills it contains.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is neither a valid artifact nor a JSON
+            source with the technical, soft and action_verbs categories
+    """
+    path = resolve_taxonomy_path(path)
+    with open(path, 'rb') as handle:
+        magic = handle.read(len(MAGIC))
+    if magic == MAGIC:
+        return MappedSkillMatcher(path)
+
+    categories = _read_source(path)
+    if not isinstance(categories, dict):
+        raise ValueError(f"{path} must map category names to lists of terms")
+    missing = [category for category in REQUIRED_CATEGORIES if category not in categories]
+    if missing:
+        raise ValueError(f"{path} has no {', '.join(missing)} category")
+    return SkillMatcher(categories, aliases_within(categories, load_configured_aliases()))
+
+
+def load_skill_matcher(path: Optional[str] = None):
+    """
+    Return the matcher for the configured skill taxonomy.
+
+    Loads the artifact or JSON source at path (defaults to
+    Config.SKILL_TAXONOMY_PATH). If no taxonomy is configured, or it cannot be
+    loaded, a SkillMatcher is built from SkillsConfig and the alias index at
+    Config.SKILL_ALIASES_PATH instead.
+    """
+    path = config.SKILL_TAXONOMY_PATH if path is None else path
+    if path:
+        try:
+            return load_taxonomy_file(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load skill taxonomy: {e}; compiling from config")
+    return SkillMatcher.from_config(skills_config, load_configured_aliases())
+
+
+class TaxonomyWatcher:
+    """
+    Background thread that reloads the skill taxonomy when its file changes.
+
+    The file is polled with os.stat; a change in modification time, size or
+    inode (os.replace, as write_taxonomy does, gives a new inode) triggers the
+    reload callback on the watcher thread, off the request path. A reload
+    that fails is logged and not retried until the file changes again.
+    """
+
+    def __init__(self, path: str, reload: Callable[[str], Any], interval: float = 5.0):
+        """
+        Args:
+            path: Taxonomy file to watch (relative paths are resolved against the project root)
+            reload: Called with the resolved path after every change, e.g.
+                ResumeAnalyzer.reload_taxonomy
+            interval: Seconds between polls
+        """
+        self.path = resolve_taxonomy_path(path)
+        self.reload = reload
+        self.interval = interval
+        self._signature = self._stat()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            info = os.stat(self.path)
+        except OSError:
+            return None
+        return info.st_mtime_ns, info.st_size, info.st_ino
+
+    def check(self) -> bool:
+        """
+        Poll the file once, reloading if it changed.
+
+        Returns:
+            True if the taxonomy was reloaded
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return False
+        self._signature = signature
+        try:
+            self.reload(self.path)
+        except Exception as e:
+            logger.error(f"Could not reload skill taxonomy from {self.path}: {e}; keeping the current one")
+            return False
+        logger.info(f"Reloaded skill taxonomy from {self.path}")
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.check()
+
+    def start(self) -> 'TaxonomyWatcher':
+        """Start polling in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='taxonomy-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop polling and wait for the thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def load_configured_aliases(path: Optional[str] = None) -> Optional[Dict[str, Dict[str, List[str]]]]:
+    """Load the alias index at path (defaults to Config.SKILL_ALIASES_PATH); None if unset or unreadable."""
+    path = config.SKILL_ALIASES_PATH if path is None else path
+    if not path:
+        return None
+    try:
+        return load_aliases(resolve_taxonomy_path(path))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not load skill aliases: {e}; matching literal spellings only")
+        return None
+
+
+def watch_taxonomy(reload: Callable[[str], Any], path: Optional[str] = None,
+                   interval: Optional[float] = None) -> Optional[TaxonomyWatcher]:
+    """
+    Start a TaxonomyWatcher for the configured taxonomy.
+
+    Args:
+        reload: Called with the path whenever the file changes
+        path: Taxonomy file (defaults to Config.SKILL_TAXONOMY_PATH)
+        interval: Poll interval in seconds (defaults to Config.SKILL_TAXONOMY_RELOAD_SECONDS)
+
+    Returns:
+        The running watcher, or None if no path is configured or the interval is 0
+    """
+    path = config.SKILL_TAXONOMY_PATH if path is None else path
+    interval = config.SKILL_TAXONOMY_RELOAD_SECONDS if interval is None else interval
+    if not path or interval <= 0:
+        return None
+    return TaxonomyWatcher(path, reload, interval).start()
+
+
+def _read_source(path: Optional[str]) -> Dict[str, Iterable[str]]:
+    if path is None:
+        return {
+            'technical': skills_config.TECHNICAL_SKILLS,
+            'soft': skills_config.SOFT_SKILLS,
+            'action_verbs': skills_config.ACTION_VERBS,
+        }
+    with open(path, 'r', encoding='utf-8') as handle:
+        return json.load(handle)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: build or inspect a taxonomy artifact."""
+    parser = argparse.ArgumentParser(prog='python -m backend.skill_taxonomy', description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='compile a taxonomy artifact')
+    build.add_argument('--source', help='JSON file mapping category to terms (defaults to SkillsConfig)')
+    build.add_argument('--output', default=config.SKILL_TAXONOMY_PATH or 'backend/data/skill_taxonomy.bin')
+    build.add_argument('--aliases', help='alias index JSON file (defaults to Config.SKILL_ALIASES_PATH)')
+    build.add_argument('--version', default='', help='taxonomy version label')
+
+    inspect = commands.add_parser('inspect', help='print artifact metadata and verify its checksum')
+    inspect.add_argument('path')
+
+    args = parser.parse_args(argv)
+    if args.command == 'build':
+        output = resolve_taxonomy_path(args.output)
+        categories = _read_source(args.source)
+        aliases = load_configured_aliases(args.aliases)
+        if args.source:
+            # A custom taxonomy takes the aliases of the skills it has
+            aliases = aliases_within(categories, aliases)
+        checksum = write_taxonomy(categories, output, args.version, aliases)
+        print(f"Wrote {output} ({os.path.getsize(output)} bytes, sha256 {checksum})")
+        return 0
+
+    matcher = MappedSkillMatcher(args.path)
+    try:
+        print(json.dumps({
+            'path': matcher.path,
+            'format_version': FORMAT_VERSION,
+            'version': matcher.version,
+            'categories': list(matcher.categories),
+            'terms': matcher.term_count,
+            'nodes': matcher.node_count,
+            'checksum': matcher.checksum,
+            'valid': matcher.verify()
+        }, indent=2))
+    finally:
+        matcher.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
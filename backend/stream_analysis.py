@@ -0,0 +1,345 @@
+"""
+Incremental resume analysis over a stream of text chunks
+
+StreamingAnalysis consumes text a chunk at a time (for example the pages
+yielded by pdf_extractor.iter_pdf_pages) and keeps only what the final
+result needs: merged token features, contact flags, skills found so far
+and a short window of tokens that skill matching has not settled yet.
+
+Raw text is only processed up to the last space or newline seen, so no
+word is ever split. Normalization, tokenization and the contact checks
+never look across whitespace, which makes each such segment independent;
+spaces and newlines are also the only places where truncate_text() cuts
+text that is too long, so the stream can cut where analyze() does. Skill terms
+and fuzzy candidates can span several words, so the last few tokens are
+kept as lookahead until the next chunk arrives. The final result equals
+analyze() on the concatenated chunks.
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+try:
+    from .analysis_context import FeatureRecord
+    from .analysis_result import AnalysisResult
+    from .fuzzy_matcher import MAX_JOINED_TOKENS, FuzzyMatch
+    from .text_normalizer import normalize_resume_text
+    from .tokenizer import TokenFeatures, TokenStream, scan_tokens
+except ImportError:
+    from analysis_context import FeatureRecord
+    from analysis_result import AnalysisResult
+    from fuzzy_matcher import MAX_JOINED_TOKENS, FuzzyMatch
+    from text_normalizer import normalize_resume_text
+    from tokenizer import TokenFeatures, TokenStream, scan_tokens
+
+if TYPE_CHECKING:
+    from .resume_analyzer import ResumeAnalyzer, SkillIndex
+
+
+def _last_break(text: str, start: int = 0, end: Optional[int] = None) -> int:
+    """Index of the last space or newline in text[start:end], or -1."""
+    end = len(text) if end is None else end
+    return max(text.rfind(' ', start, end), text.rfind('\n', start, end))
+
+
+class Segment:
+    """
+    Features of one piece of raw text that ends at whitespace.
+
+    Such a piece is normalized, tokenized and checked for contact details
+    independently of the text around it; only skill matching needs to look
+    past its ends.
+    """
+
+    __slots__ = ('has_text', 'contact', 'tokens', 'features')
+
+    def __init__(self, analyzer: 'ResumeAnalyzer', text: str):
+        self.has_text = bool(text.strip())
+        self.contact = analyzer._extract_contact_info(text) if self.has_text else {}
+        cleaned = normalize_resume_text(text) if self.has_text else ''
+        if cleaned:
+            stream = TokenStream(cleaned)
+            self.tokens = stream.tokens
+            # Sketch mode counts words in AnalysisTotals instead
+            self.features = scan_tokens(stream, not analyzer.frequency.sketch)
+        else:
+            self.tokens = []
+            self.features = None
+
+
+class AnalysisTotals:
+    """
+    Aggregates of consecutive segments, in text order, and the result built from them.
+    """
+
+    def __init__(self, analyzer: 'ResumeAnalyzer', skill_index: 'SkillIndex'):
+        self.analyzer = analyzer
+        self.skill_index = skill_index
+        self.has_text = False
+        self.has_tokens = False
+        self.spaces = 0
+        self.features = TokenFeatures({}, [], False, 0)
+        self.contact = {'has_email': False, 'has_phone': False, 'has_linkedin': False}
+        self.found: Dict[str, Dict[str, None]] = {category: {} for category in skill_index.matcher.categories}
+        self.fuzzy: Dict[Tuple[str, str], FuzzyMatch] = {}
+        self.words = analyzer.frequency.new_counter() if analyzer.frequency.sketch else None
+
+    def add_segment(self, segment: Segment) -> bool:
+        """
+        Merge the features of the next segment.
+
+        Returns:
+            True if a joining space token precedes the segment's tokens
+        """
+        if segment.has_text:
+            self.has_text = True
+            contact = self.contact
+            for key, present in segment.contact.items():
+                contact[key] = contact[key] or present
+        if not segment.tokens:
+            return False
+        # Segments are joined by a single space in the cleaned text
+        joined = self.has_tokens
+        self.has_tokens = True
+        self.spaces += joined + segment.tokens.count(' ')
+        self.features.update(segment.features)
+        if self.words is not None:
+            self.words.add_tokens(segment.tokens)
+        return joined
+
+    def add_skills(self, found: Dict[str, List[str]], fuzzy_matches: Iterable[FuzzyMatch] = ()) -> None:
+        """Merge skills found in the next stretch of tokens."""
+        for category, terms in found.items():
+            self.found[category].update(dict.fromkeys(terms))
+        best = self.fuzzy
+        # Exact matches are excluded at the end: exclusion is per skill
+        for match in fuzzy_matches:
+            key = (match.category, match.skill)
+            current = best.get(key)
+            if current is None or match.confidence > current.confidence:
+                best[key] = match
+
+    def _fuzzy_matches(self) -> List[FuzzyMatch]:
+        excluded = {(category, term) for category, terms in self.found.items() for term in terms}
+        matches = [match for key, match in self.fuzzy.items() if key not in excluded]
+        return sorted(matches, key=lambda match: (-match.confidence, match.category, match.skill))
+
+    def result(self, truncated: bool = False, include_features: bool = False) -> AnalysisResult:
+        """
+        Build the analysis result of everything merged so far.
+
+        Args:
+            truncated: The text was cut at the analyzer's max_chars
+            include_features: Keep the feature record on the result
+        """
+        analyzer = self.analyzer
+        if not self.has_text:
+            return analyzer._get_empty_compact_result()
+
+        found = {category: list(terms) for category, terms in self.found.items()}
+        fuzzy_matches = self._fuzzy_matches()
+        technical, soft, action_verbs = analyzer._format_skills(found, fuzzy_matches)
+        features = self.features
+        record = FeatureRecord(
+            word_count=self.spaces + 1 if self.has_tokens else 0,
+            technical_skills=technical,
+            soft_skills=soft,
+            action_verb_count=len(action_verbs),
+            quantified_count=features.quantified_count,
+            sections=features.sections,
+            has_email=self.contact['has_email'],
+            has_phone=self.contact['has_phone'],
+            has_linkedin=self.contact['has_linkedin'],
+            has_dates=features.has_dates
+        )
+        scores = analyzer._calculate_scores(record)
+        warnings = ()
+        if truncated:
+            warnings = (f"Resume text is longer than {analyzer.max_chars:,} characters; "
+                        f"only the first {analyzer.max_chars:,} were analyzed.",)
+        return AnalysisResult(
+            scores=scores,
+            technical_skills=technical,
+            soft_skills=soft,
+            action_verbs=action_verbs,
+            word_count=record.word_count,
+            word_frequency=analyzer.frequency.top(self.words if self.words is not None else features.word_counts),
+            sections=record.sections,
+            contact_info=record.contact_info,
+            recommendations=analyzer._generate_recommendations(record, scores),
+            fuzzy_matches=fuzzy_matches if self.skill_index.fuzzy_index is not None else None,
+            features=record if include_features else None,
+            warnings=warnings,
+            vocabulary=self.skill_index.vocabulary
+        )
+
+
+def skill_lookahead(skill_index: 'SkillIndex') -> int:
+    """Tokens a skill match starting at some token may need to look at after it."""
+    return max(skill_index.matcher.max_term_tokens, 2 * MAX_JOINED_TOKENS) + 1
+
+
+def scan_skills(skill_index: 'SkillIndex', tokens: List[str], first: int = 0,
+                stop: Optional[int] = None) -> Tuple[Dict[str, List[str]], List[FuzzyMatch]]:
+    """
+    Exact and fuzzy skill matches starting in tokens[first:stop].
+
+    Fuzzy matches are not filtered against the exact ones; AnalysisTotals
+    does that once all matches are merged.
+    """
+    found = skill_index.matcher.scan(tokens, first, stop)
+    fuzzy_index = skill_index.fuzzy_index
+    fuzzy_matches = fuzzy_index.search(tokens, None, first, stop) if fuzzy_index is not None else []
+    return found, fuzzy_matches
+
+
+class StreamingAnalysis:
+    """
+    Analysis state of one resume that is still being read.
+
+    Call feed() with each chunk in order, result() for partial results in
+    between, and finish() once the input is exhausted.
+    """
+
+    def __init__(self, analyzer: 'ResumeAnalyzer', skill_index: 'SkillIndex' = None):
+        """
+        Args:
+            analyzer: Analyzer providing the extractors, scoring and limits
+            skill_index: Taxonomy to match against (defaults to the analyzer's
+                current one, read once so a reload cannot change it midway)
+        """
+        self.analyzer = analyzer
+        self.skill_index = analyzer.skill_index if skill_index is None else skill_index
+        self._lookahead = skill_lookahead(self.skill_index)
+        self._totals = AnalysisTotals(analyzer, self.skill_index)
+
+        self._carry = ''
+        self._chars = 0
+        self._finished = False
+        self._truncated = False
+        self._elapsed = 0.0
+
+        # Tokens not yet scanned for skills; the first _pending_first are context only
+        self._pending: List[str] = []
+        self._pending_first = 0
+
+    @property
+    def chars(self) -> int:
+        """Characters consumed so far."""
+        return self._chars
+
+    def feed(self, chunk: str) -> None:
+        """
+        Consume the next chunk of text.
+
+        Raises:
+            ValueError: If chunk is not a string, or the stream is finished
+            AnalysisTimeoutError: If the analysis work exceeds the time budget
+        """
+        if not isinstance(chunk, str):
+            raise ValueError("Chunks must be strings")
+        if self._finished:
+            raise ValueError("Cannot feed a finished stream")
+        if not self._totals.has_text and chunk and not chunk.isspace():
+            # analyze() checks for text before truncating, so text past the cut counts
+            self._totals.has_text = True
+        if self._truncated or not chunk:
+            return
+
+        started = time.monotonic()
+        limit = self.analyzer.max_chars - self._chars
+        if len(chunk) > limit:
+            # Cut like analyze() does; everything after the cut is ignored
+            self._truncated = True
+            text = self._carry + chunk
+            self._settle(text[:self._truncation_cut(text, self._chars - len(self._carry))])
+            self._chars += limit
+            self._carry = ''
+        else:
+            self._chars += len(chunk)
+            cut = _last_break(chunk)
+            if cut < 0:
+                self._carry += chunk
+            else:
+                self._settle(self._carry + chunk[:cut + 1])
+                self._carry = chunk[cut + 1:]
+        self._scan_pending(final=False)
+        self._spend(started, 'streamed chunk')
+
+    def _truncation_cut(self, text: str, settled: int) -> int:
+        """
+        Where truncate_text() cuts the whole input, as an index into text.
+
+        Args:
+            text: The unsettled rest of the input, which runs past max_chars
+            settled: Characters settled before text; they end at a space or
+                newline, so a cut that falls inside them leaves nothing of text
+        """
+        max_chars = self.analyzer.max_chars
+        window = max(0, max_chars - 1000)
+        cut = _last_break(text, max(window - settled, 0), max_chars - settled + 1)
+        if cut >= 0 and settled + cut > 0:
+            return cut
+        if 0 < settled - 1 and window <= settled - 1:
+            # The last break before the limit ends the settled text
+            return 0
+        return max_chars - settled
+
+    def _spend(self, started: float, completed: str) -> None:
+        self._elapsed += time.monotonic() - started
+        if self._elapsed > self.analyzer.time_budget:
+            try:
+                from .resume_analyzer import AnalysisTimeoutError
+            except ImportError:
+                from resume_analyzer import AnalysisTimeoutError
+            raise AnalysisTimeoutError(
+                f"Analysis exceeded its time budget of {self.analyzer.time_budget:g}s (after {completed})"
+            )
+
+    def _settle(self, text: str) -> None:
+        """Process raw text that ends at whitespace (or the end of input)."""
+        if not text:
+            return
+        segment = Segment(self.analyzer, text)
+        if self._totals.add_segment(segment):
+            self._pending.append(' ')
+        self._pending.extend(segment.tokens)
+
+    def _scan_pending(self, final: bool) -> None:
+        """Scan pending tokens for skills, as far as the lookahead allows."""
+        pending = self._pending
+        stop = len(pending) if final else len(pending) - self._lookahead
+        first = self._pending_first
+        if stop <= first:
+            return
+
+        self._totals.add_skills(*scan_skills(self.skill_index, pending, first, stop))
+
+        # Keep one token of context for the word-boundary check
+        keep = max(stop - 1, 0)
+        del pending[:keep]
+        self._pending_first = stop - keep
+
+    def result(self, include_features: bool = False) -> AnalysisResult:
+        """
+        Result for the text consumed so far.
+
+        Before finish() this is a partial result: the last word and the
+        lookahead tokens have not been matched against skills yet.
+        """
+        return self._totals.result(self._truncated, include_features)
+
+    def finish(self, include_features: bool = False) -> AnalysisResult:
+        """
+        Process the rest of the input and return the complete result.
+
+        Raises:
+            AnalysisTimeoutError: If the analysis work exceeds the time budget
+        """
+        if not self._finished:
+            started = time.monotonic()
+            self._finished = True
+            self._settle(self._carry)
+            self._carry = ''
+            self._scan_pending(final=True)
+            self._spend(started, 'final chunk')
+        return self.result(include_features)
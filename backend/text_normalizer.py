@@ -0,0 +1,97 @@
+"""
+Text normalization for AI Resume Analyzer
+
+Both the resume analyzer and the keyword matcher normalize text before
+matching. The normalizers here produce exactly the same output as the regex
+substitution chains they replace, but use precomputed ``translate`` tables
+and a single whitespace-collapse pass. Pure ASCII input, the common case,
+is handled entirely with byte tables and never touches Unicode lookups.
+"""
+
+# Punctuation kept by the resume normalizer in addition to word characters
+RESUME_PUNCTUATION = '.,@()-+#&/:'
+
+# Upper bound on cached non-ASCII character decisions
+_MAX_CACHED_CHARACTERS = 65536
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters matched by the regex ``\\w`` class."""
+    return char == '_' or char.isalnum()
+
+
+def _resume_char(char: str) -> str:
+    """Map one character the way the resume normalizer does (before lower-casing)."""
+    if _is_word_char(char) or char in RESUME_PUNCTUATION:
+        return char
+    return ' '
+
+
+def _build_ascii_table(mapper) -> bytes:
+    return bytes(ord(mapper(chr(code))) for code in range(128)) + b' ' * 128
+
+
+class _ResumeTable(dict):
+    """str.translate table that decides non-ASCII characters on first sight."""
+
+    def __missing__(self, code: int) -> int:
+        value = ord(_resume_char(chr(code)))
+        if len(self) < _MAX_CACHED_CHARACTERS:
+            self[code] = value
+        return value
+
+
+class _MatchTable(dict):
+    """str.translate table for the keyword matcher; anything outside [a-z0-9] is a space."""
+
+    def __missing__(self, code: int) -> int:
+        return 32
+
+
+# ASCII tables fold lower-casing into the translation
+_RESUME_ASCII_TABLE = _build_ascii_table(lambda char: _resume_char(char).lower())
+_MATCH_ASCII_TABLE = _build_ascii_table(
+    lambda char: char.lower() if char.lower() in 'abcdefghijklmnopqrstuvwxyz0123456789' else ' '
+)
+
+_RESUME_TABLE = _ResumeTable({code: ord(_resume_char(chr(code))) for code in range(128)})
+_MATCH_TABLE = _MatchTable({code: _MATCH_ASCII_TABLE[code] for code in range(128)})
+
+
+def normalize_resume_text(text: str) -> str:
+    """
+    Normalize resume text for analysis.
+
+    Equivalent to collapsing whitespace, replacing every character other than
+    word characters, whitespace and ``.,@()-+#&/:`` with a space, collapsing
+    whitespace again, stripping and lower-casing.
+
+    Args:
+        text: Raw resume text
+
+    Returns:
+        Normalized text
+    """
+    if text.isascii():
+        return b' '.join(text.encode('ascii').translate(_RESUME_ASCII_TABLE).split()).decode('ascii')
+    # Lower-casing happens last, as some characters expand when lower-cased
+    return ' '.join(text.translate(_RESUME_TABLE).split()).lower()
+
+
+def normalize_match_text(text: str) -> str:
+    """
+    Normalize text for keyword comparison.
+
+    Equivalent to lower-casing, replacing everything outside ``[a-z0-9\\s]``
+    with a space, collapsing whitespace and stripping.
+
+    Args:
+        text: Resume or job description text
+
+    Returns:
+        Normalized text
+    """
+    if text.isascii():
+        return b' '.join(text.encode('ascii').translate(_MATCH_ASCII_TABLE).split()).decode('ascii')
+    # Lower-casing first can turn non-ASCII characters into ASCII letters
+    return ' '.join(text.lower().translate(_MATCH_TABLE).split())
@@ -0,0 +1,157 @@
+"""
+Tokenizer stage for AI Resume Analyzer
+
+Cleaned resume text is split once into a token stream, and every token-level
+detector (word frequency, sections, dates, quantified achievements and the
+skill matcher) consumes that stream instead of rescanning the string.
+"""
+from functools import cached_property
+from itertools import accumulate
+from typing import Dict, Iterable, Iterator, List
+
+try:
+    from .patterns import TOKEN_PATTERN
+except ImportError:
+    from patterns import TOKEN_PATTERN
+
+# Standard resume sections and the keywords that indicate them
+SECTION_KEYWORDS = {
+    'Contact': ('contact', 'phone', 'email', 'address', 'linkedin'),
+    'Summary': ('summary', 'profile', 'objective', 'about'),
+    'Experience': ('experience', 'work', 'employment', 'career'),
+    'Education': ('education', 'degree', 'university', 'college'),
+    'Skills': ('skills', 'technical', 'competencies'),
+    'Projects': ('projects', 'portfolio'),
+    'Certifications': ('certification', 'certificate', 'license'),
+    'Achievements': ('achievement', 'award', 'accomplishment')
+}
+
+# Words ignored when counting word frequency
+FREQUENCY_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'been',
+    'be', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'resume', 'cv', 'name', 'address', 'phone', 'email'
+})
+
+# Words that count as a quantified achievement wherever they appear
+QUANTIFIER_WORDS = ('increased', 'improved', 'reduced')
+
+_SECTION_BY_KEYWORD = {
+    keyword: section
+    for section, keywords in SECTION_KEYWORDS.items()
+    for keyword in keywords
+}
+
+
+def is_word_token(token: str) -> bool:
+    """Return True if the token is made of word characters (regex ``\\w``)."""
+    first = token[0]
+    return first == '_' or first.isalnum()
+
+
+class TokenStream:
+    """Tokens of a cleaned text, with their character offsets."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens: List[str] = TOKEN_PATTERN.findall(text)
+
+    @cached_property
+    def offsets(self) -> List[int]:
+        """Start offset of every token in the text."""
+        return [0] + list(accumulate(len(token) for token in self.tokens))[:-1]
+
+    @cached_property
+    def word_count(self) -> int:
+        """Number of whitespace separated words (cleaned text has single spaces only)."""
+        return self.tokens.count(' ') + 1 if self.tokens else 0
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+
+class TokenFeatures:
+    """Features collected by the single detector pass over a token stream."""
+
+    __slots__ = ('word_counts', 'sections', 'has_dates', 'quantified_count')
+
+    def __init__(self, word_counts: Dict[str, int], sections: List[str],
+                 has_dates: bool, quantified_count: int):
+        self.word_counts = word_counts
+        self.sections = sections
+        self.has_dates = has_dates
+        self.quantified_count = quantified_count
+
+    def update(self, other: 'TokenFeatures') -> None:
+        """
+        Merge in the features of the text that follows this one.
+
+        Valid when the two texts are joined by whitespace, so no token spans
+        the join; word counts keep their order of first occurrence.
+        """
+        word_counts = self.word_counts
+        for word, count in other.word_counts.items():
+            word_counts[word] = word_counts.get(word, 0) + count
+        found = set(self.sections).union(other.sections)
+        self.sections = [section for section in SECTION_KEYWORDS if section in found]
+        self.has_dates = self.has_dates or other.has_dates
+        self.quantified_count += other.quantified_count
+
+
+def scan_tokens(stream: TokenStream, count_words: bool = True) -> TokenFeatures:
+    """
+    Run all token-level detectors in one pass over the stream.
+
+    Each detector keeps the semantics of the regex it replaces:
+    ``\\b[a-z]{3,}\\b`` for word frequency, ``\\b(keyword|...)\\b`` for sections,
+    ``\\b(19|20)\\d{2}\\b`` for dates and ``\\d+%|\\d+\\+|increased|improved|reduced``
+    for quantified achievements.
+
+    Args:
+        stream: Token stream of the cleaned text
+        count_words: Count word frequency; when False, word_counts is left
+            empty and the other detectors run alone
+
+    Returns:
+        TokenFeatures for the stream
+    """
+    tokens = stream.tokens
+    last = len(tokens) - 1
+    word_counts: Dict[str, int] = {}
+    found_sections = set()
+    has_dates = False
+    quantified = 0
+
+    for index, token in enumerate(tokens):
+        if len(token) < 4:
+            # Spaces, punctuation and short words only matter before a '%' or '+'
+            if token[-1].isdecimal() and index < last and tokens[index + 1] in ('%', '+'):
+                quantified += 1
+            continue
+
+        if token.isascii() and token.isalpha():
+            if count_words and token not in FREQUENCY_STOPWORDS:
+                word_counts[token] = word_counts.get(token, 0) + 1
+            section = _SECTION_BY_KEYWORD.get(token)
+            if section is not None:
+                found_sections.add(section)
+        else:
+            if not has_dates and len(token) == 4 and token[:2] in ('19', '20') and token[2:].isdecimal():
+                has_dates = True
+            if token[-1].isdecimal() and index < last and tokens[index + 1] in ('%', '+'):
+                quantified += 1
+
+        if 'ed' in token:
+            for word in QUANTIFIER_WORDS:
+                quantified += token.count(word)
+
+    sections = [section for section in SECTION_KEYWORDS if section in found_sections]
+    return TokenFeatures(word_counts, sections, has_dates, quantified)
+
+
+def frequency_words(tokens: Iterable[str]) -> Iterator[str]:
+    """Yield the tokens that scan_tokens counts for word frequency, in order."""
+    for token in tokens:
+        if len(token) >= 4 and token.isascii() and token.isalpha() and token not in FREQUENCY_STOPWORDS:
+            yield token
@@ -0,0 +1,219 @@
+"""
+Word frequency stage for AI Resume Analyzer
+
+The token pass (tokenizer.scan_tokens) counts frequency words into a
+dictionary as it goes; top_k() then selects the most frequent ones with a
+bounded heap instead of sorting the whole vocabulary.
+
+For corpora and very long documents the vocabulary itself can grow without
+bound. In sketch mode counts go into a fixed-size count-min sketch, and only
+a bounded set of heavy-hitter candidates is kept by name; reported counts
+are then upper-bound estimates. Both counters take tokens, merge with other
+counters of the same kind, and report their top k, so a corpus can be
+counted batch by batch, or in separate processes whose counters are merged.
+"""
+import heapq
+from hashlib import blake2b
+from operator import itemgetter
+from typing import Dict, Iterable, List, Mapping, Union
+
+try:
+    from .tokenizer import frequency_words
+except ImportError:
+    from tokenizer import frequency_words
+
+# Words reported per resume
+DEFAULT_TOP_K = 10
+
+# Sketch size: the estimate of a word exceeds its count by at most
+# e/width of all counted words, with probability 1 - e**-depth
+DEFAULT_SKETCH_WIDTH = 2048
+DEFAULT_SKETCH_DEPTH = 4
+
+_MASK_32 = (1 << 32) - 1
+
+
+def top_k(counts: Mapping[str, int], k: int) -> Dict[str, int]:
+    """
+    Return the k most frequent words, most frequent first.
+
+    Equal counts keep their order of first occurrence, as with
+    Counter.most_common(k); selection uses a heap of k entries.
+    """
+    if k <= 0:
+        return {}
+    return dict(heapq.nlargest(k, counts.items(), key=itemgetter(1)))
+
+
+class WordCounter:
+    """Exact word counts."""
+
+    __slots__ = ('counts',)
+
+    def __init__(self, counts: Dict[str, int] = None):
+        """
+        Args:
+            counts: Counts to start from; the dictionary is adopted, not copied
+        """
+        self.counts: Dict[str, int] = {} if counts is None else counts
+
+    def add_tokens(self, tokens: Iterable[str]) -> None:
+        """Count the frequency words among tokens."""
+        counts = self.counts
+        for word in frequency_words(tokens):
+            counts[word] = counts.get(word, 0) + 1
+
+    def merge(self, other: 'WordCounter') -> None:
+        """Add the counts of another counter."""
+        if not isinstance(other, WordCounter):
+            raise ValueError("Only exact word counters can be merged into an exact counter")
+        counts = self.counts
+        for word, count in other.counts.items():
+            counts[word] = counts.get(word, 0) + count
+
+    def top(self, k: int) -> Dict[str, int]:
+        return top_k(self.counts, k)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+
+class SketchCounter:
+    """
+    Approximate word counts in bounded memory.
+
+    A count-min sketch holds the counts, and the words with the highest
+    estimates so far are kept as candidates for top(). Words are hashed
+    with BLAKE2b, so sketches agree across processes and can be merged.
+    """
+
+    __slots__ = ('width', 'depth', 'capacity', 'table', 'candidates', '_floor')
+
+    def __init__(self, width: int = DEFAULT_SKETCH_WIDTH, depth: int = DEFAULT_SKETCH_DEPTH,
+                 capacity: int = 4 * DEFAULT_TOP_K):
+        """
+        Args:
+            width: Cells per row; more cells give smaller overestimates
+            depth: Rows, each with its own hash; more rows make a large
+                overestimate less likely
+            capacity: Candidate words kept by name; top(k) is reliable for
+                k well below capacity
+
+        Raises:
+            ValueError: If a size is not positive
+        """
+        if width <= 0 or depth <= 0 or capacity <= 0:
+            raise ValueError("Sketch width, depth and capacity must be positive")
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.table: List[List[int]] = [[0] * width for _ in range(depth)]
+        self.candidates: Dict[str, int] = {}
+        self._floor = 0
+
+    def _cells(self, word: str) -> List[int]:
+        # Two 32-bit hashes combined per row (Kirsch-Mitzenmacher)
+        value = int.from_bytes(blake2b(word.encode('utf-8'), digest_size=8).digest(), 'little')
+        first, step = value & _MASK_32, (value >> 32) | 1
+        return [(first + row * step) % self.width for row in range(self.depth)]
+
+    def add(self, word: str, count: int = 1) -> int:
+        """Count word and return its new estimate."""
+        estimate = None
+        for row, cell in zip(self.table, self._cells(word)):
+            row[cell] += count
+            if estimate is None or row[cell] < estimate:
+                estimate = row[cell]
+        self._offer(word, estimate)
+        return estimate
+
+    def estimate(self, word: str) -> int:
+        """Upper bound on the count of word."""
+        return min(row[cell] for row, cell in zip(self.table, self._cells(word)))
+
+    def _offer(self, word: str, estimate: int) -> None:
+        candidates = self.candidates
+        if word in candidates or len(candidates) < self.capacity:
+            candidates[word] = estimate
+        elif estimate > self._floor:
+            victim = min(candidates, key=candidates.get)
+            if estimate > candidates[victim]:
+                del candidates[victim]
+                candidates[word] = estimate
+            self._floor = min(candidates.values())
+
+    def add_tokens(self, tokens: Iterable[str]) -> None:
+        """Count the frequency words among tokens."""
+        for word in frequency_words(tokens):
+            self.add(word)
+
+    def merge(self, other: 'SketchCounter') -> None:
+        """
+        Add the counts of another sketch of the same size.
+
+        Raises:
+            ValueError: If other is not a sketch with the same width and depth
+        """
+        if not isinstance(other, SketchCounter) or (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Only sketches of the same width and depth can be merged")
+        for row, other_row in zip(self.table, other.table):
+            for cell, count in enumerate(other_row):
+                if count:
+                    row[cell] += count
+        words = dict.fromkeys(self.candidates)
+        words.update(dict.fromkeys(other.candidates))
+        estimates = {word: self.estimate(word) for word in words}
+        self.candidates = top_k(estimates, self.capacity)
+        self._floor = min(self.candidates.values(), default=0)
+
+    def top(self, k: int) -> Dict[str, int]:
+        return top_k(self.candidates, k)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+
+class WordFrequency:
+    """
+    Settings of the word frequency stage: how many words, counted how.
+    """
+
+    __slots__ = ('top_k', 'sketch', 'sketch_width', 'sketch_depth')
+
+    def __init__(self, top_k: int = DEFAULT_TOP_K, sketch: bool = False,
+                 sketch_width: int = DEFAULT_SKETCH_WIDTH, sketch_depth: int = DEFAULT_SKETCH_DEPTH):
+        """
+        Args:
+            top_k: Number of words reported
+            sketch: Count in a count-min sketch instead of a dictionary
+            sketch_width: Cells per sketch row
+            sketch_depth: Sketch rows
+
+        Raises:
+            ValueError: If top_k is negative
+        """
+        if top_k < 0:
+            raise ValueError("top_k must not be negative")
+        self.top_k = top_k
+        self.sketch = sketch
+        self.sketch_width = sketch_width
+        self.sketch_depth = sketch_depth
+
+    def new_counter(self) -> Union[WordCounter, SketchCounter]:
+        """Return an empty counter of the configured kind."""
+        if self.sketch:
+            return SketchCounter(self.sketch_width, self.sketch_depth, max(4 * self.top_k, 1))
+        return WordCounter()
+
+    def top(self, source: Union[Mapping[str, int], WordCounter, SketchCounter]) -> Dict[str, int]:
+        """Top words of a counter, or of exact counts from the token pass."""
+        if isinstance(source, Mapping):
+            return top_k(source, self.top_k)
+        return source.top(self.top_k)
+
+    @property
+    def fingerprint(self) -> str:
+        """Part of the result cache key: reported words depend on these settings."""
+        if self.sketch:
+            return f"|freq{self.top_k}:cms{self.sketch_width}x{self.sketch_depth}"
+        return f"|freq{self.top_k}"
@@ -0,0 +1,9 @@
+"""
+Benchmarks for AI Resume Analyzer
+
+corpus generates seeded synthetic resumes and job descriptions in TXT, PDF
+and DOCX form; run measures the throughput, latency and memory of the
+analysis entry points on that corpus:
+
+    python -m benchmarks.run --pages 0.5 5 50 --output results.json
+"""
@@ -0,0 +1,262 @@
+"""
+Seeded synthetic resume and job description corpus
+
+Documents are assembled from a fixed vocabulary of titles, companies,
+skills and bullet templates, so the same seed always produces the same
+text. Sizes are given in pages of roughly WORDS_PER_PAGE words; each text
+can be rendered as TXT, PDF (a minimal hand-written PDF with a base-14
+font, so no PDF library is needed) or DOCX.
+"""
+import random
+from io import BytesIO
+from typing import Dict, Iterator, List
+
+try:
+    from backend.config import skills_config
+except ImportError:
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from backend.config import skills_config
+
+WORDS_PER_PAGE = 450
+LINES_PER_PDF_PAGE = 54
+PDF_LINE_WIDTH = 95
+
+FORMATS = ('txt', 'pdf', 'docx')
+
+FIRST_NAMES = ('Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Sam', 'Jamie', 'Avery', 'Quinn')
+LAST_NAMES = ('Smith', 'Garcia', 'Chen', 'Okafor', 'Novak', 'Silva', 'Kowalski', 'Haddad', 'Tanaka', 'Moreau')
+TITLES = ('Software Engineer', 'Data Scientist', 'Backend Developer', 'DevOps Engineer',
+          'Frontend Developer', 'Machine Learning Engineer', 'Product Engineer', 'Site Reliability Engineer')
+SENIORITY = ('Junior', '', 'Senior', 'Lead', 'Staff', 'Principal')
+COMPANIES = ('Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries',
+             'Wayne Analytics', 'Soylent Systems', 'Cyberdyne', 'Tyrell Data')
+SCHOOLS = ('State University', 'Institute of Technology', 'City College', 'Polytechnic University')
+DEGREES = ('Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+           'Bachelor of Engineering in Software Engineering', 'Master of Computer Applications')
+CERTIFICATIONS = ('AWS Certified Solutions Architect', 'Certified Kubernetes Administrator',
+                  'Google Professional Data Engineer', 'Scrum Master Certification')
+OBJECTS = ('the payments platform', 'a customer analytics pipeline', 'internal developer tooling',
+           'the recommendation service', 'a real-time monitoring system', 'the mobile backend',
+           'an event-driven billing system', 'the data warehouse')
+OUTCOMES = ('reducing latency by {n}%', 'increasing conversion by {n}%', 'cutting costs by ${n}K per year',
+            'serving {n}M requests per day', 'reducing incident volume by {n}%', 'for {n}+ customers')
+FILLER = ('across multiple teams', 'in an agile environment', 'with a focus on reliability',
+          'working closely with product and design', 'under tight deadlines')
+
+
+ACRONYMS = frozenset({'sql', 'aws', 'gcp', 'css', 'html', 'php'})
+
+
+def _display(skill: str) -> str:
+    """Spell a taxonomy term the way resumes usually do."""
+    return skill.upper() if skill in ACRONYMS else skill.title()
+
+
+def _pick(rng: random.Random, items, count: int) -> List[str]:
+    return [_display(item) for item in rng.sample(sorted(items), min(count, len(items)))]
+
+
+def _bullet(rng: random.Random, technical: List[str]) -> str:
+    verb = rng.choice(sorted(skills_config.ACTION_VERBS)).capitalize()
+    skills = ' and '.join(rng.sample(technical, 2))
+    outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+    return f"• {verb} {rng.choice(OBJECTS)} using {skills}, {outcome} {rng.choice(FILLER)}"
+
+
+def generate_resume(seed: int, pages: float = 1.0) -> str:
+    """
+    Generate a resume of about pages pages.
+
+    Args:
+        seed: Seed for the generator; equal seeds give equal text
+        pages: Target length, in pages of WORDS_PER_PAGE words
+    """
+    rng = random.Random(seed)
+    target_words = max(60, int(pages * WORDS_PER_PAGE))
+    technical = _pick(rng, skills_config.TECHNICAL_SKILLS, 12)
+    soft = _pick(rng, skills_config.SOFT_SKILLS, 5)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    title = f"{rng.choice(SENIORITY)} {rng.choice(TITLES)}".strip()
+
+    lines = [
+        f"{first} {last}",
+        title,
+        f"{first.lower()}.{last.lower()}@example.com | {rng.randint(200, 989)}-{rng.randint(200, 989)}-{rng.randint(1000, 9999)} "
+        f"| linkedin.com/in/{first.lower()}{last.lower()}",
+        "",
+        "PROFESSIONAL SUMMARY",
+        f"{title} with {rng.randint(2, 15)}+ years of experience building software with "
+        f"{', '.join(technical[:4])}. Known for {soft[0].lower()} and {soft[1].lower()}.",
+        "",
+        "EXPERIENCE",
+    ]
+    experience_end = len(lines)
+    tail = [
+        "",
+        "EDUCATION",
+        f"{rng.choice(DEGREES)} | {rng.choice(SCHOOLS)} | {rng.randint(2000, 2020)}",
+        "",
+        "TECHNICAL SKILLS",
+        ', '.join(technical),
+        "",
+        "SOFT SKILLS",
+        ', '.join(soft),
+        "",
+        "CERTIFICATIONS",
+        rng.choice(CERTIFICATIONS),
+    ]
+
+    words = sum(len(line.split()) for line in lines + tail)
+    year = 2024
+    while words < target_words:
+        start = year - rng.randint(1, 4)
+        role = [f"{rng.choice(SENIORITY)} {rng.choice(TITLES)}".strip()
+                + f" | {rng.choice(COMPANIES)} | {start}-{year}"]
+        role += [_bullet(rng, technical) for _ in range(rng.randint(3, 6))]
+        role.append("")
+        lines[experience_end:experience_end] = role
+        experience_end += len(role)
+        words += sum(len(line.split()) for line in role)
+        year = start
+    return '\n'.join(lines + tail) + '\n'
+
+
+def generate_job_description(seed: int, pages: float = 0.5) -> str:
+    """
+    Generate a job description of about pages pages.
+
+    Args:
+        seed: Seed for the generator; equal seeds give equal text
+        pages: Target length, in pages of WORDS_PER_PAGE words
+    """
+    rng = random.Random(seed)
+    target_words = max(40, int(pages * WORDS_PER_PAGE))
+    technical = _pick(rng, skills_config.TECHNICAL_SKILLS, 10)
+    soft = _pick(rng, skills_config.SOFT_SKILLS, 4)
+    title = f"{rng.choice(SENIORITY)} {rng.choice(TITLES)}".strip()
+
+    lines = [
+        f"{title} at {rng.choice(COMPANIES)}",
+        "",
+        f"We are looking for a {title} to join our team and help build {rng.choice(OBJECTS)}.",
+        "",
+        "Requirements:",
+        f"- {rng.randint(2, 10)}+ years of experience with {technical[0]} and {technical[1]}",
+    ]
+    lines += [f"- Experience with {skill}" for skill in technical[2:6]]
+    lines += [f"- Strong {skill.lower()} skills" for skill in soft]
+    lines += ["", "Responsibilities:"]
+    words = sum(len(line.split()) for line in lines)
+    while words < target_words:
+        line = (f"- {rng.choice(sorted(skills_config.ACTION_VERBS)).capitalize()} {rng.choice(OBJECTS)} "
+                f"with {rng.choice(technical)} {rng.choice(FILLER)}")
+        lines.append(line)
+        words += len(line.split())
+    lines += ["", f"Nice to have: {', '.join(technical[6:])}"]
+    return '\n'.join(lines) + '\n'
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.replace('•', '-').encode('latin-1', 'replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def _wrap(line: str, width: int) -> Iterator[str]:
+    while len(line) > width:
+        cut = line.rfind(' ', 0, width)
+        if cut <= 0:
+            cut = width
+        yield line[:cut]
+        line = line[cut:].lstrip()
+    yield line
+
+
+def render_pdf(text: str) -> bytes:
+    """
+    Render text as a PDF with one text object per page (Helvetica, 10pt).
+
+    Lines are wrapped at PDF_LINE_WIDTH characters and paginated at
+    LINES_PER_PDF_PAGE lines.
+    """
+    lines = [wrapped for line in text.splitlines() for wrapped in _wrap(line, PDF_LINE_WIDTH)]
+    pages = [lines[i:i + LINES_PER_PDF_PAGE] for i in range(0, len(lines), LINES_PER_PDF_PAGE)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a (page, content) pair per page
+    objects: Dict[int, bytes] = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    kids = []
+    for index, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * index, 5 + 2 * index
+        kids.append(f"{page_id} 0 R")
+        stream = "BT /F1 10 Tf 12 TL 50 760 Td\n" + ''.join(
+            f"({_pdf_escape(line)}) Tj T*\n" for line in page_lines
+        ) + "ET"
+        data = stream.encode('latin-1')
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode('latin-1')
+        objects[content_id] = b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode('latin-1')
+
+    output = BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = {}
+    for number in sorted(objects):
+        offsets[number] = output.tell()
+        output.write(b"%d 0 obj\n" % number + objects[number] + b"\nendobj\n")
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for number in sorted(objects):
+        output.write(b"%010d 00000 n \n" % offsets[number])
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+
+def render_docx(text: str) -> bytes:
+    """Render text as a DOCX document with one paragraph per line."""
+    import docx
+
+    document = docx.Document()
+    for line in text.splitlines():
+        document.add_paragraph(line)
+    output = BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def render(text: str, file_format: str) -> bytes:
+    """
+    Render text in one of FORMATS.
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if file_format == 'txt':
+        return text.encode('utf-8')
+    if file_format == 'pdf':
+        return render_pdf(text)
+    if file_format == 'docx':
+        return render_docx(text)
+    raise ValueError(f"Unsupported format: {file_format}")
+
+
+def generate_corpus(seed: int, count: int, pages: float = 1.0) -> List[Dict[str, str]]:
+    """
+    Generate count (resume, job description) pairs of the given size.
+
+    Returns:
+        List of dictionaries with 'resume' and 'job_description' texts
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            'resume': generate_resume(rng.getrandbits(32), pages),
+            'job_description': generate_job_description(rng.getrandbits(32), min(pages, 2.0))
+        }
+        for _ in range(count)
+    ]
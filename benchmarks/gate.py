@@ -0,0 +1,216 @@
+"""
+Performance regression gate
+
+Runs a fixed subset of the benchmark cases and compares their median
+latency with the committed baseline (benchmarks/baseline.json). Latencies
+are divided by the time of a fixed calibration workload interleaved with
+the operations, so a baseline recorded on one machine can be checked on
+another: what is compared is how many calibration units an operation costs.
+
+    python -m benchmarks.gate                  # check against the baseline
+    python -m benchmarks.gate --rebaseline     # record a new baseline
+    pytest --perf                              # the same check, as a test
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.suite import ENTRY_POINTS, case_name
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+BASELINE_VERSION = 1
+
+# (entry point, pages) pairs tracked by the gate
+TRACKED_CASES: Tuple[Tuple[str, float], ...] = (
+    ('analyze', 0.5),
+    ('analyze', 5.0),
+    ('match_score', 0.5),
+    ('match_score', 5.0),
+    ('extract_pdf', 1.0),
+)
+
+# Latency statistic compared; the median is the least noisy
+METRIC = 'p50_ms'
+
+# A case fails when it is this many times slower than its baseline
+DEFAULT_THRESHOLD = 2.0
+
+_CALIBRATION_TEXT = ' '.join(
+    f"engineer{i % 97} developed python services, reducing latency by {i % 50}%" for i in range(400)
+)
+
+
+def _calibration_workload() -> int:
+    # String splitting, hashing and dict updates: the same kind of work as the analyzer
+    counts = Counter()
+    for word in _CALIBRATION_TEXT.lower().split():
+        counts[word.strip('.,%')] += 1
+    return len(counts)
+
+
+def measure_normalized(entry_point: str, pages: float, seed: int = 0, min_seconds: float = 0.5,
+                       min_iterations: int = 20) -> Dict[str, float]:
+    """
+    Time one case with the calibration workload interleaved.
+
+    Every operation is followed by a run of the calibration workload, so
+    both sample the same moments of machine load; the median of one
+    divided by the median of the other is stable even on a busy machine.
+
+    Returns:
+        Dictionary with the case's median 'latency_ms', the median
+        'calibration_ms' and their ratio, 'normalized'
+    """
+    _, factory = ENTRY_POINTS[entry_point]
+    func, inputs = factory(seed, pages)
+    for args in inputs:
+        func(*args)
+
+    clock = time.perf_counter
+    latencies, calibrations = [], []
+    started = clock()
+    index = 0
+    while len(latencies) < min_iterations or clock() - started < min_seconds:
+        args = inputs[index % len(inputs)]
+        index += 1
+        before = clock()
+        func(*args)
+        latencies.append(clock() - before)
+        before = clock()
+        _calibration_workload()
+        calibrations.append(clock() - before)
+
+    latency_ms = statistics.median(latencies) * 1000
+    calibration_ms = statistics.median(calibrations) * 1000
+    return {'latency_ms': latency_ms, 'calibration_ms': calibration_ms, 'normalized': latency_ms / calibration_ms}
+
+
+def collect(cases=TRACKED_CASES, min_seconds: float = 0.5, seed: int = 0) -> Dict[str, Any]:
+    """
+    Measure the tracked cases, normalized by the calibration workload.
+
+    Returns:
+        Dictionary with raw median 'latencies_ms', median 'calibration_ms'
+        and normalized 'cases' (latency in calibration units), each keyed by
+        case name
+    """
+    latencies, calibrations, normalized = {}, {}, {}
+    for entry_point, pages in cases:
+        name = case_name(entry_point, pages)
+        result = measure_normalized(entry_point, pages, seed, min_seconds)
+        latencies[name] = result['latency_ms']
+        calibrations[name] = result['calibration_ms']
+        normalized[name] = result['normalized']
+    return {'calibration_ms': calibrations, 'latencies_ms': latencies, 'cases': normalized}
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Dict[str, Any]:
+    """
+    Read a baseline file.
+
+    Raises:
+        FileNotFoundError: If there is no baseline yet
+        ValueError: If the file was written by an incompatible version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION or baseline.get('metric') != METRIC:
+        raise ValueError(f"Incompatible baseline file {path}; re-baseline with python -m benchmarks.gate --rebaseline")
+    return baseline
+
+
+def write_baseline(measurement: Dict[str, Any], path: str = BASELINE_PATH) -> Dict[str, Any]:
+    """Record a measurement from collect() as the new baseline."""
+    baseline = {
+        'version': BASELINE_VERSION,
+        'metric': METRIC,
+        'recorded': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'calibration_ms': {name: round(value, 4) for name, value in measurement['calibration_ms'].items()},
+        'latencies_ms': {name: round(value, 4) for name, value in measurement['latencies_ms'].items()},
+        'cases': {name: round(value, 3) for name, value in measurement['cases'].items()},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return baseline
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare normalized latencies with the baseline.
+
+    Args:
+        current: Normalized latency per case name
+        baseline: Normalized baseline latency per case name
+        threshold: Slowdown ratio at which a case counts as a regression
+
+    Returns:
+        One dictionary per case present in both, with 'name', 'baseline',
+        'current', 'ratio' and 'regressed'
+    """
+    rows = []
+    for name, value in current.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = value / reference
+        rows.append({
+            'name': name,
+            'baseline': reference,
+            'current': value,
+            'ratio': ratio,
+            'regressed': ratio > threshold,
+        })
+    return rows
+
+
+def check(threshold: float = DEFAULT_THRESHOLD, path: str = BASELINE_PATH,
+          min_seconds: float = 0.5) -> List[Dict[str, Any]]:
+    """Measure the tracked cases and compare them with the baseline at path."""
+    baseline = load_baseline(path)
+    tracked = {case_name(entry_point, pages) for entry_point, pages in TRACKED_CASES}
+    missing = tracked - set(baseline['cases'])
+    if missing:
+        raise ValueError(f"Baseline has no entry for {', '.join(sorted(missing))}; re-baseline first")
+    return compare(collect(min_seconds=min_seconds)['cases'], baseline['cases'], threshold)
+
+
+def format_rows(rows: List[Dict[str, Any]], threshold: float) -> str:
+    lines = [f"{'case':<24}{'baseline':>10}{'current':>10}{'ratio':>8}"]
+    for row in rows:
+        flag = f'  REGRESSION (> {threshold:g}x)' if row['regressed'] else ''
+        lines.append(f"{row['name']:<24}{row['baseline']:>10.2f}{row['current']:>10.2f}{row['ratio']:>7.2f}x{flag}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.gate',
+                                     description='Check benchmark latencies against the committed baseline.')
+    parser.add_argument('--rebaseline', action='store_true', help='Record a new baseline instead of checking')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'Slowdown ratio that fails the check (default {DEFAULT_THRESHOLD:g})')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Baseline file')
+    parser.add_argument('--min-seconds', type=float, default=0.5, help='Time spent per case')
+    args = parser.parse_args(argv)
+
+    if args.rebaseline:
+        baseline = write_baseline(collect(min_seconds=args.min_seconds), args.baseline)
+        print(f"Wrote {args.baseline} ({len(baseline['cases'])} cases)")
+        return 0
+
+    rows = check(args.threshold, args.baseline, args.min_seconds)
+    print(format_rows(rows, args.threshold))
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
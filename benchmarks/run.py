@@ -0,0 +1,92 @@
+"""
+Command line for the benchmark suite
+
+    python -m benchmarks.run                                # all entry points, 0.5/5/50 pages
+    python -m benchmarks.run --entry analyze --pages 1 10 --output results.json
+    python -m benchmarks.run --corpus out/ --pages 2 --count 20   # write the corpus files only
+"""
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from benchmarks.corpus import FORMATS, generate_corpus, render
+from benchmarks.suite import CASE_TIMEOUT, ENTRY_POINTS, run_suite
+
+DEFAULT_PAGES = (0.5, 5.0, 50.0)
+
+
+def write_corpus(directory: str, seed: int, count: int, pages: float, formats=FORMATS) -> List[str]:
+    """
+    Write a corpus to disk as resume_NNN.<format> and job_NNN.txt files.
+
+    Returns:
+        Paths of the files written
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, pair in enumerate(generate_corpus(seed, count, pages)):
+        for file_format in formats:
+            path = os.path.join(directory, f"resume_{index:03d}.{file_format}")
+            with open(path, 'wb') as f:
+                f.write(render(pair['resume'], file_format))
+            paths.append(path)
+        path = os.path.join(directory, f"job_{index:03d}.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(pair['job_description'])
+        paths.append(path)
+    return paths
+
+
+def format_table(report: dict) -> str:
+    """Human-readable summary of a report."""
+    lines = [f"{'case':<24}{'ops/sec':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak RSS MB':>13}"]
+    for result in report['results']:
+        if 'error' in result:
+            lines.append(f"{result['name']:<24}  error: {result['error']}")
+            continue
+        rss = result['peak_rss_mb']
+        lines.append(
+            f"{result['name']:<24}{result['ops_per_sec']:>12.1f}{result['p50_ms']:>10.3f}"
+            f"{result['p99_ms']:>10.3f}{'-' if rss is None else f'{rss:.1f}':>13}"
+        )
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.run', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--entry', nargs='+', choices=sorted(ENTRY_POINTS), default=list(ENTRY_POINTS),
+                        help='Entry points to benchmark (default: all)')
+    parser.add_argument('--pages', nargs='+', type=float, default=list(DEFAULT_PAGES),
+                        help='Document sizes, in pages (default: 0.5 5 50)')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed')
+    parser.add_argument('--min-iterations', type=int, default=20)
+    parser.add_argument('--min-seconds', type=float, default=1.0)
+    parser.add_argument('--no-isolate', action='store_true',
+                        help='Run cases in this process (peak RSS then covers all cases so far)')
+    parser.add_argument('--timeout', type=float, default=CASE_TIMEOUT,
+                        help='Seconds an isolated case may run before it is reported as failed')
+    parser.add_argument('--output', help='Write the JSON report to this file')
+    parser.add_argument('--corpus', metavar='DIR', help='Only write the corpus files to DIR')
+    parser.add_argument('--count', type=int, default=10, help='Documents written with --corpus')
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        for size in args.pages:
+            write_corpus(os.path.join(args.corpus, f"{size:g}p"), args.seed, args.count, size)
+        print(f"Wrote corpus to {args.corpus}")
+        return 0
+
+    report = run_suite(args.entry, args.pages, seed=args.seed, isolate=not args.no_isolate,
+                       timeout=args.timeout, min_iterations=args.min_iterations, min_seconds=args.min_seconds)
+    print(format_table(report))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}")
+    return 1 if any('error' in result for result in report['results']) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Benchmark cases for the analysis entry points
+
+Each case runs one entry point on a seeded corpus of documents of a given
+size, cycling through the documents until both a minimum number of
+operations and a minimum time have been reached, and reports throughput,
+latency percentiles and the peak resident set size of the process.
+
+Cases run in a fresh process by default so that peak RSS is attributable
+to the case alone.
+"""
+import multiprocessing
+import platform
+import queue
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from benchmarks.corpus import generate_corpus, render
+
+# Distinct documents per case, so caches and branch predictors see variety
+DOCUMENTS_PER_CASE = 8
+
+# Seconds an isolated case may run before it is stopped and reported as failed
+CASE_TIMEOUT = 600.0
+
+
+def _analyze_case(seed: int, pages: float) -> Tuple[Callable, List[Any]]:
+    from backend.resume_analyzer import ResumeAnalyzer
+
+    analyzer = ResumeAnalyzer()
+    texts = [pair['resume'] for pair in generate_corpus(seed, DOCUMENTS_PER_CASE, pages)]
+    return analyzer.analyze, [(text,) for text in texts]
+
+
+def _match_score_case(seed: int, pages: float) -> Tuple[Callable, List[Any]]:
+    from backend.keyword_matcher import calculate_match_score
+
+    pairs = generate_corpus(seed, DOCUMENTS_PER_CASE, pages)
+    return calculate_match_score, [(pair['resume'], pair['job_description']) for pair in pairs]
+
+
+def _extract_pdf_case(seed: int, pages: float) -> Tuple[Callable, List[Any]]:
+    from backend.pdf_extractor import extract_text_from_pdf
+
+    pairs = generate_corpus(seed, DOCUMENTS_PER_CASE, pages)
+    return extract_text_from_pdf, [(render(pair['resume'], 'pdf'),) for pair in pairs]
+
+
+def _extract_docx_case(seed: int, pages: float) -> Tuple[Callable, List[Any]]:
+    from backend.pdf_extractor import extract_text_from_docx
+
+    pairs = generate_corpus(seed, DOCUMENTS_PER_CASE, pages)
+    return extract_text_from_docx, [(render(pair['resume'], 'docx'),) for pair in pairs]
+
+
+# Entry point name -> (input format, factory returning the function and its argument tuples)
+ENTRY_POINTS: Dict[str, Tuple[str, Callable[[int, float], Tuple[Callable, List[Any]]]]] = {
+    'analyze': ('txt', _analyze_case),
+    'match_score': ('txt', _match_score_case),
+    'extract_pdf': ('pdf', _extract_pdf_case),
+    'extract_docx': ('docx', _extract_docx_case),
+}
+
+
+def case_name(entry_point: str, pages: float) -> str:
+    return f"{entry_point}[{pages:g}p]"
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process, in MiB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def measure(func: Callable, inputs: List[tuple], min_iterations: int = 20,
+            min_seconds: float = 1.0, warmup: int = 2) -> Dict[str, Any]:
+    """
+    Time func over inputs, cycling through them.
+
+    Args:
+        func: Function under test
+        inputs: Argument tuples, used round-robin
+        min_iterations: Run at least this many timed operations
+        min_seconds: And keep going until this much time has been spent
+        warmup: Untimed passes over the inputs first
+
+    Returns:
+        Dictionary with 'iterations', 'ops_per_sec', 'mean_ms', 'p50_ms' and 'p99_ms'
+    """
+    for _ in range(warmup):
+        for args in inputs:
+            func(*args)
+
+    durations = []
+    clock = time.perf_counter
+    started = clock()
+    index = 0
+    while len(durations) < min_iterations or clock() - started < min_seconds:
+        args = inputs[index % len(inputs)]
+        index += 1
+        before = clock()
+        func(*args)
+        durations.append(clock() - before)
+    elapsed = sum(durations)
+
+    durations.sort()
+    return {
+        'iterations': len(durations),
+        'ops_per_sec': len(durations) / elapsed if elapsed else 0.0,
+        'mean_ms': elapsed / len(durations) * 1000,
+        'p50_ms': percentile(durations, 50) * 1000,
+        'p99_ms': percentile(durations, 99) * 1000,
+    }
+
+
+def run_case(entry_point: str, pages: float, seed: int = 0, **measure_options) -> Dict[str, Any]:
+    """
+    Run one benchmark case in this process.
+
+    Raises:
+        KeyError: If the entry point is unknown
+    """
+    file_format, factory = ENTRY_POINTS[entry_point]
+    func, inputs = factory(seed, pages)
+    result = {
+        'name': case_name(entry_point, pages),
+        'entry_point': entry_point,
+        'format': file_format,
+        'pages': pages,
+        'seed': seed,
+    }
+    result.update(measure(func, inputs, **measure_options))
+    result['peak_rss_mb'] = peak_rss_mb()
+    return result
+
+
+def _run_case_in_child(queue, entry_point, pages, seed, measure_options):
+    try:
+        queue.put(run_case(entry_point, pages, seed, **measure_options))
+    except Exception as e:
+        queue.put({'name': case_name(entry_point, pages), 'error': f"{type(e).__name__}: {e}"})
+
+
+def run_isolated(entry_point: str, pages: float, seed: int = 0, timeout: float = CASE_TIMEOUT,
+                 **measure_options) -> Dict[str, Any]:
+    """
+    Run one benchmark case in a fresh process, so its peak RSS is its own.
+
+    A process that dies without reporting (a crash or an OOM kill) or runs
+    for more than timeout seconds gives a result with 'error' instead of
+    blocking the suite.
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_run_case_in_child,
+                              args=(results, entry_point, pages, seed, measure_options))
+    process.start()
+    deadline = time.monotonic() + timeout
+    result = None
+    error = None
+    while result is None and error is None:
+        try:
+            # Read before joining: a child blocks on exit until its result is consumed
+            result = results.get(timeout=max(0.0, min(1.0, deadline - time.monotonic())))
+        except queue.Empty:
+            if not process.is_alive():
+                try:
+                    result = results.get(timeout=1.0)
+                except queue.Empty:
+                    error = f"benchmark process exited with code {process.exitcode} without a result"
+            elif time.monotonic() >= deadline:
+                process.terminate()
+                error = f"benchmark process did not finish within {timeout:g}s"
+    process.join()
+    if error is None and process.exitcode != 0:
+        error = f"benchmark process exited with code {process.exitcode}"
+    if error is not None:
+        return {'name': case_name(entry_point, pages), 'error': error}
+    return result
+
+
+def run_suite(entry_points: Iterable[str], pages: Iterable[float], seed: int = 0,
+              isolate: bool = True, timeout: float = CASE_TIMEOUT, **measure_options) -> Dict[str, Any]:
+    """
+    Run every combination of entry point and size.
+
+    timeout limits each case when isolate is set; cases run in this process
+    cannot be stopped.
+
+    Returns:
+        Report with 'meta' (environment and options) and 'results' (one
+        dictionary per case, or one with 'error' if the case failed)
+    """
+    pages = list(pages)
+    results = []
+    for entry_point in entry_points:
+        for size in pages:
+            if isolate:
+                results.append(run_isolated(entry_point, size, seed, timeout, **measure_options))
+            else:
+                results.append(run_case(entry_point, size, seed, **measure_options))
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'seed': seed,
+            'isolated': isolate,
+            'options': measure_options,
+        },
+        'results': results,
+    }
@@ -18,12 +18,16 @@ rm -rf tests/ .git/ .github/ docs/ scripts/ .vscode/ .idea/ 2>/dev/null || true
 rm -f app.py check_deployment.py verify_project.py test_local.py 2>/dev/null || true
 rm -f *.md 2>/dev/null || true
 
-# Step 3: Verify final size
+# Step 3: Compile the skill taxonomy (mapped at cold start via SKILL_TAXONOMY_PATH)
+echo "🧠 Compiling skill taxonomy..."
+python3 -m backend.skill_taxonomy build --output backend/data/skill_taxonomy.bin
+
+# Step 4: Verify final size
 echo "📊 Checking package size..."
 TOTAL_SIZE=$(du -sh . | cut -f1)
 echo "✅ Final package size: $TOTAL_SIZE"
 
-# Step 4: Download minimal NLTK data
+# Step 5: Download minimal NLTK data
 echo "📥 Downloading minimal NLTK data..."
 python3 -c "
 import nltk
@@ -10,6 +10,28 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).parent.parent
 sys.path.insert(0, str(ROOT_DIR))
 
+
+def pytest_addoption(parser):
+    """Performance regression gate options."""
+    parser.addoption("--perf", action="store_true", default=False,
+                     help="Run the performance regression gate against benchmarks/baseline.json")
+    parser.addoption("--perf-threshold", type=float, default=None,
+                     help="Slowdown ratio that fails the performance gate (default 2.0)")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "perf: performance regression test (run with --perf)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip performance tests unless --perf is given."""
+    if config.getoption("--perf"):
+        return
+    skip_perf = pytest.mark.skip(reason="performance gate runs only with --perf")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
 @pytest.fixture
 def sample_resume_text():
     """Sample resume text for testing."""
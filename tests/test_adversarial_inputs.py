@@ -0,0 +1,120 @@
+"""
+Worst-case input tests: adversarial text must be processed in linear time.
+"""
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend.keyword_matcher import calculate_match_score
+from backend.resume_analyzer import AnalysisTimeoutError, ResumeAnalyzer, contains_email, truncate_text
+
+# The email regex contains_email replaces, with its TLD class fixed
+REFERENCE_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# Repeated units that make backtracking regexes quadratic or worse
+ADVERSARIAL_UNITS = {
+    'dotted_words': 'a.',
+    'at_signs': 'a@',
+    'dangling_domains': '@a.',
+    'long_local_parts': 'a' * 63 + '@',
+    'digit_runs': '1',
+    'near_phone_numbers': '555-123-',
+    'symbols': '!@#$%^&*()',
+    'unicode': 'é.ß@',
+    'near_emails': 'éa@x.yz ',
+}
+
+BLOB_CHARS = 1_000_000
+
+
+def _elapsed(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+class TestEmailDetection:
+    """Test suite for the linear-time email detector."""
+
+    def test_agrees_with_reference_regex(self):
+        """Random short strings are classified exactly as the regex would."""
+        rng = random.Random(11)
+        alphabet = 'aZ9._%+-@| é1\n'
+        for _ in range(50000):
+            text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            assert contains_email(text) == bool(REFERENCE_EMAIL.search(text)), repr(text)
+
+    def test_long_parts_agree_with_reference_regex(self):
+        """Local parts and domains far past the RFC limits are matched as the regex would."""
+        rng = random.Random(12)
+        for _ in range(300):
+            text = ''.join(rng.choice('ab.é@ ') if rng.random() < 0.02 else rng.choice('ab.')
+                           for _ in range(rng.randint(100, 600)))
+            assert contains_email(text) == bool(REFERENCE_EMAIL.search(text)), repr(text)
+
+    def test_edge_cases(self):
+        """Long parts, TLD characters and word boundaries."""
+        assert contains_email('reach me at jane.doe+cv@mail.example.com.')
+        # No length limits, as in the regex this detector replaces
+        assert contains_email('x' * 65 + '@b.co')
+        assert contains_email('x@' + 'b' * 300 + '.co')
+        assert contains_email('x' * 5000 + '@' + 'b.' * 5000 + 'co')
+        assert not contains_email('x@y.c0m')
+        assert not contains_email('x@y.c|m')
+        assert not contains_email('x@.co')
+        assert not contains_email('éa@x.yz')
+
+    @pytest.mark.parametrize('name', sorted(ADVERSARIAL_UNITS))
+    def test_linear_time(self, name):
+        """A megabyte of adversarial text is scanned well within budget."""
+        unit = ADVERSARIAL_UNITS[name]
+        blob = unit * (BLOB_CHARS // len(unit))
+
+        assert _elapsed(contains_email, blob) < 1.0
+
+
+class TestAnalyzeLimits:
+    """Test suite for the input-size cap and time budget of analyze()."""
+
+    @pytest.mark.parametrize('name', sorted(ADVERSARIAL_UNITS))
+    def test_uncapped_analysis_within_budget(self, name):
+        """Even without the size cap, adversarial text is analyzed in linear time."""
+        analyzer = ResumeAnalyzer(max_chars=10 ** 9, time_budget=60)
+        unit = ADVERSARIAL_UNITS[name]
+
+        assert _elapsed(analyzer.analyze, unit * (BLOB_CHARS // len(unit))) < 5.0
+
+    def test_oversized_input_is_truncated_with_warning(self, sample_resume_text):
+        """Text past the cap is cut at a word boundary and the result says so."""
+        analyzer = ResumeAnalyzer(max_chars=len(sample_resume_text))
+        result = analyzer.analyze(sample_resume_text + 'Python ' * 100000)
+
+        assert result['warnings'] and 'characters' in result['warnings'][0]
+        assert result['scores'] == analyzer.analyze(sample_resume_text)['scores']
+        assert 'warnings' not in analyzer.analyze(sample_resume_text)
+
+    def test_truncate_text(self):
+        """Truncation never splits a word when whitespace is near the limit."""
+        assert truncate_text('hello world again', 13) == 'hello world'
+        assert truncate_text('abcdefghij', 4) == 'abcd'
+        assert truncate_text('short', 100) == 'short'
+
+    def test_time_budget(self, sample_resume_text):
+        """An analysis over budget is abandoned with a clear error."""
+        with pytest.raises(AnalysisTimeoutError):
+            ResumeAnalyzer(time_budget=-1).analyze(sample_resume_text)
+
+    def test_match_score_linear(self, job_description_text):
+        """Keyword matching of adversarial blobs stays within budget."""
+        for unit in ADVERSARIAL_UNITS.values():
+            blob = unit * (BLOB_CHARS // len(unit))
+            assert _elapsed(calculate_match_score, blob, job_description_text) < 2.0
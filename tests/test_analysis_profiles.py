@@ -0,0 +1,93 @@
+"""
+Tests for analysis profiles and the stage dependency graph.
+"""
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend import profiling
+from backend.analysis_profiles import PROFILE_STAGES, STAGE_DEPENDENCIES, stages_for
+from backend.result_cache import AnalysisCache
+from backend.resume_analyzer import ResumeAnalyzer
+
+
+class TestStageGraph:
+    """Test suite for stages_for."""
+
+    def test_dependencies_run_first(self):
+        """Every stage comes after the stages it depends on."""
+        for stages in PROFILE_STAGES.values():
+            for index, name in enumerate(stages):
+                assert set(STAGE_DEPENDENCIES[name]) <= set(stages[:index])
+
+    def test_scores_skip_unneeded_stages(self):
+        """Scores need the extractors but not frequency, recommendations or features."""
+        stages = stages_for(['scores'])
+
+        assert {'sections', 'skills', 'contact', 'scoring'} <= set(stages)
+        assert not {'word_frequency', 'recommendations', 'features'} & set(stages)
+        assert stages_for(['contact_info']) == ('contact',)
+
+    def test_unknown_output(self):
+        """Unknown outputs are rejected."""
+        with pytest.raises(ValueError):
+            stages_for(['salary'])
+
+
+class TestAnalyzeProfiles:
+    """Test suite for ResumeAnalyzer.analyze(profile=...)."""
+
+    def test_scores_profile_matches_standard(self, sample_resume_text, minimal_resume_text):
+        """The scores profile returns exactly the standard scores."""
+        analyzer = ResumeAnalyzer(fuzzy=True)
+        for text in (sample_resume_text, minimal_resume_text, '   '):
+            assert analyzer.analyze(text, profile='scores') == {'scores': analyzer.analyze(text)['scores']}
+
+    def test_full_profile_includes_features(self, sample_resume_text):
+        """The full profile is the standard result plus the feature record."""
+        analyzer = ResumeAnalyzer()
+
+        full = analyzer.analyze(sample_resume_text, profile='full')
+
+        assert full == analyzer.analyze(sample_resume_text, include_features=True)
+        assert full['features'] is not None
+
+    def test_scores_profile_runs_fewer_stages(self, sample_resume_text):
+        """Stages outside the scores profile are not run."""
+        profiling.enable()
+        profiling.reset()
+        try:
+            ResumeAnalyzer().analyze(sample_resume_text, profile='scores')
+            stages = profiling.snapshot('analyze.')
+        finally:
+            profiling.enable(False)
+            profiling.reset()
+
+        assert 'analyze.scoring' in stages
+        assert 'analyze.recommendations' not in stages
+        assert 'analyze.result' not in stages
+
+    def test_scores_served_from_cache(self, sample_resume_text, monkeypatch):
+        """A cached full result answers a scores request; scores alone are not cached."""
+        analyzer = ResumeAnalyzer(cache=AnalysisCache())
+        assert analyzer.analyze(sample_resume_text, profile='scores')['scores']
+        assert len(analyzer.cache) == 0
+
+        expected = analyzer.analyze(sample_resume_text)['scores']
+        monkeypatch.setattr(analyzer, '_score_text', lambda *args: pytest.fail("cache hit analyzed again"))
+
+        assert analyzer.analyze(sample_resume_text, profile='scores') == {'scores': expected}
+
+    def test_truncation_warning_and_unknown_profile(self, sample_resume_text):
+        """Warnings are kept and unknown profiles rejected."""
+        analyzer = ResumeAnalyzer(max_chars=200)
+
+        assert analyzer.analyze(sample_resume_text, profile='scores')['warnings']
+        with pytest.raises(ValueError):
+            analyzer.analyze(sample_resume_text, profile='fast')
@@ -0,0 +1,128 @@
+"""
+Unit tests for compact analysis results.
+"""
+import copy
+import gc
+import json
+import pickle
+import sys
+import tracemalloc
+import weakref
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.analysis_result import AnalysisResult, SkillVocabulary
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.result_cache import AnalysisCache
+
+
+class TestSkillVocabulary:
+    """Test suite for SkillVocabulary."""
+
+    def test_bitsets_decode_sorted(self):
+        """Sets round-trip through bitsets in sorted order, sequences keep theirs."""
+        vocabulary = SkillVocabulary()
+        bits = vocabulary.encode_set(['Sql', 'Python', 'Docker'])
+
+        assert vocabulary.decode_set(bits) == ['Docker', 'Python', 'Sql']
+        assert vocabulary.decode_sequence(vocabulary.encode_sequence(['led', 'built'])) == ['led', 'built']
+        assert vocabulary.id_of('Python') == vocabulary.id_of('Python')
+        assert len(vocabulary) == 5
+
+    def test_scoped_to_taxonomy(self, sample_resume_text):
+        """A reloaded taxonomy starts a new vocabulary; the old one goes with its results."""
+        analyzer = ResumeAnalyzer()
+        before = analyzer.analyze_compact(sample_resume_text)
+        old = weakref.ref(analyzer.skill_index.vocabulary)
+        size = len(old())
+
+        analyzer.reload_taxonomy(matcher=analyzer.skill_index.matcher)
+        after = analyzer.analyze_compact(sample_resume_text)
+
+        assert analyzer.skill_index.vocabulary is not old()
+        assert len(old()) == size
+        assert after == before
+        del before
+        gc.collect()
+        assert old() is None
+
+
+class TestAnalysisResult:
+    """Test suite for AnalysisResult."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.analyzer = ResumeAnalyzer()
+
+    def test_mapping_matches_dictionary(self, sample_resume_text):
+        """The compact result reads exactly like the dictionary result."""
+        compact = self.analyzer.analyze_compact(sample_resume_text)
+        result = self.analyzer.analyze(sample_resume_text)
+
+        assert compact == result
+        assert list(compact) == list(result)
+        assert compact['skills']['technical'] == result['technical_skills']
+        assert compact.get('contact_info') == result['contact_info']
+        assert compact.get('missing', 'default') == 'default'
+        assert compact.overall_score == result['scores']['overall_score']
+
+    def test_features_and_empty_input(self, sample_resume_text):
+        """Features appear only when requested; empty input has no record."""
+        with_features = self.analyzer.analyze_compact(sample_resume_text, include_features=True)
+
+        assert with_features['features'] == self.analyzer.analyze(sample_resume_text, include_features=True)['features']
+        assert 'features' not in with_features.without_features()
+        assert self.analyzer.analyze('', include_features=True)['features'] is None
+        assert self.analyzer.analyze_compact('')['contact_info'] == {}
+
+    def test_compact_form_round_trip(self, sample_resume_text):
+        """to_compact survives JSON and pickling carries the same content."""
+        result = self.analyzer.analyze_compact(sample_resume_text, include_features=True)
+        restored = AnalysisResult.from_compact(json.loads(json.dumps(result.to_compact())))
+
+        assert restored == result
+        assert restored.features == result.features
+        assert pickle.loads(pickle.dumps(result)) == result
+        assert copy.deepcopy(result) is result
+
+    def test_rejects_other_versions(self, sample_resume_text):
+        """Compact data from another layout version is refused."""
+        data = self.analyzer.analyze_compact(sample_resume_text).to_compact()
+        data[0] = AnalysisResult.VERSION + 1
+
+        try:
+            AnalysisResult.from_compact(data)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+    def test_cached_results_match(self, sample_resume_text):
+        """Results served from the cache equal freshly computed ones."""
+        cached = ResumeAnalyzer(cache=AnalysisCache())
+        expected = self.analyzer.analyze(sample_resume_text, include_features=True)
+
+        assert cached.analyze(sample_resume_text) == self.analyzer.analyze(sample_resume_text)
+        assert cached.analyze(sample_resume_text, include_features=True) == expected
+        assert cached.analyze_compact(sample_resume_text) == self.analyzer.analyze_compact(sample_resume_text)
+
+    def test_smaller_than_dictionary(self, sample_resume_text, minimal_resume_text):
+        """Holding compact results takes much less memory than dictionaries."""
+        texts = [sample_resume_text + f"\nReference {i}" for i in range(50)] + [minimal_resume_text]
+        for text in texts:
+            self.analyzer.analyze_compact(text)
+
+        def held_bytes(analyze):
+            tracemalloc.start()
+            results = [analyze(text) for text in texts]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            return size, results
+
+        dict_size, _ = held_bytes(self.analyzer.analyze)
+        compact_size, _ = held_bytes(self.analyzer.analyze_compact)
+
+        assert compact_size * 2 < dict_size
@@ -30,6 +30,65 @@ def test_analyze_endpoint_exists():
     assert response.status_code in [422, 400]  # Expects file upload
 
 
+def test_profile_endpoint(monkeypatch):
+    """Test that stage timings are reported and can be reset, by admins only."""
+    from backend import profiling
+    from backend.config import config
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "")
+    assert client.get("/api/profile").status_code == 403
+    assert client.delete("/api/profile").status_code == 403
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+    assert client.get("/api/profile", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.delete("/api/profile").status_code == 403
+
+    admin = {"X-Admin-Token": "secret"}
+    profiling.enable()
+    try:
+        response = client.post("/api/analyze", files={"file": ("resume.txt", b"Python developer with SQL experience", "text/plain")})
+        assert response.status_code == 200
+
+        stages = client.get("/api/profile", headers=admin).json()["stages"]
+        assert stages["extract.txt"]["count"] >= 1
+        assert stages["analyze.skills"]["count"] >= 1
+
+        client.delete("/api/profile", headers=admin)
+        assert client.get("/api/profile", headers=admin).json()["stages"] == {}
+    finally:
+        profiling.enable(False)
+
+
+def test_reload_taxonomy_endpoint(monkeypatch):
+    """Test that taxonomy reloads require the admin token."""
+    from backend.config import config
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "")
+    assert client.post("/api/admin/reload-taxonomy").status_code == 403
+
+    monkeypatch.setattr(config, "ADMIN_TOKEN", "secret")
+    monkeypatch.setattr(config, "SKILL_TAXONOMY_PATH", "")
+    assert client.post("/api/admin/reload-taxonomy", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    response = client.post("/api/admin/reload-taxonomy", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert response.json()["taxonomy_version"]
+
+
+def test_analyze_profiles():
+    """Test that the scores profile returns scores only and unknown profiles are rejected."""
+    files = {"file": ("resume.txt", b"Python developer with SQL experience since 2019", "text/plain")}
+
+    standard = client.post("/api/analyze", files=files).json()["data"]
+    scores = client.post("/api/analyze", files=files, data={"profile": "scores"}).json()["data"]
+    assert scores == {"scores": standard["scores"]}
+
+    full = client.post("/api/analyze", files=files, data={"profile": "full"}).json()["data"]
+    assert full["features"]["word_count"] == standard["word_count"]
+
+    assert client.post("/api/analyze", files=files, data={"profile": "fast"}).status_code == 400
+
+
 def test_analysis_workflow():
     """Test the complete analysis workflow."""
     # Test the full user journey from upload to results
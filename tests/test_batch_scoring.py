@@ -0,0 +1,62 @@
+"""
+Unit tests for the vectorized batch scoring engine.
+"""
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.analysis_context import AnalysisContext
+from backend.batch_scoring import FEATURE_COLUMNS, feature_matrix, score_dicts, score_matrix
+from backend.config import ScoringConfig
+from backend.resume_analyzer import ResumeAnalyzer
+
+
+class TunedScoringConfig(ScoringConfig):
+    """Scoring configuration with non-default weights and thresholds."""
+    SCORE_WEIGHTS = {
+        'content_quality': 0.1,
+        'keyword_optimization': 0.3,
+        'ats_compatibility': 0.33,
+        'structure_score': 0.17,
+        'completeness': 0.1
+    }
+    SKILLS_SCORE_THRESHOLDS = {3: 40, 15: 100, 5: 55}
+    ESSENTIAL_SECTIONS = ['Experience', 'Projects']
+
+
+class TestBatchScoring:
+    """Test suite for score_matrix."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.analyzer = ResumeAnalyzer()
+
+    def _contexts(self, *texts):
+        return [AnalysisContext(self.analyzer, text) for text in texts]
+
+    def test_feature_matrix_shape(self, sample_resume_text, minimal_resume_text):
+        """One fixed-width row is produced per resume."""
+        matrix = feature_matrix(self._contexts(sample_resume_text, minimal_resume_text))
+
+        assert matrix.shape == (2, len(FEATURE_COLUMNS))
+
+    def test_matches_scalar_scores(self, sample_resume_text, minimal_resume_text):
+        """Vectorized scores are identical to ResumeAnalyzer._calculate_scores."""
+        contexts = self._contexts(sample_resume_text, minimal_resume_text, "Python developer", "x " * 950)
+
+        vectorized = score_dicts(score_matrix(feature_matrix(contexts)))
+
+        assert vectorized == [self.analyzer._calculate_scores(context) for context in contexts]
+
+    def test_matches_scalar_scores_with_tuned_config(self, sample_resume_text, minimal_resume_text):
+        """Changing the scoring configuration changes both paths the same way."""
+        contexts = self._contexts(sample_resume_text, minimal_resume_text, "Python developer")
+        self.analyzer.scoring_config = TunedScoringConfig
+
+        vectorized = score_dicts(score_matrix(feature_matrix(contexts), TunedScoringConfig))
+
+        assert vectorized == [self.analyzer._calculate_scores(context) for context in contexts]
@@ -0,0 +1,100 @@
+"""
+Unit tests for the benchmark corpus and runner.
+"""
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend.pdf_extractor import extract_text_from_docx, extract_text_from_pdf
+from benchmarks.corpus import WORDS_PER_PAGE, generate_job_description, generate_resume, render
+from benchmarks.run import main
+from benchmarks.suite import percentile, run_case, run_isolated
+
+
+class TestCorpus:
+    """Test suite for the corpus generator."""
+
+    def test_seeded(self):
+        """Equal seeds give equal documents, different seeds different ones."""
+        assert generate_resume(1, 2) == generate_resume(1, 2)
+        assert generate_resume(1, 2) != generate_resume(2, 2)
+        assert generate_job_description(5) == generate_job_description(5)
+
+    def test_sizes(self):
+        """Documents grow with the requested number of pages."""
+        for pages in (1, 5, 20):
+            words = len(generate_resume(3, pages).split())
+            assert pages * WORDS_PER_PAGE <= words < pages * WORDS_PER_PAGE + 150
+
+    def test_rendered_formats_extract_back(self):
+        """PDF and DOCX renderings extract to the same words."""
+        text = generate_resume(4, 3)
+        words = text.replace('•', '-').split()
+
+        assert extract_text_from_pdf(render(text, 'pdf')).split() == words
+        assert extract_text_from_docx(render(text, 'docx')).split() == text.split()
+
+
+class TestSuite:
+    """Test suite for the benchmark runner."""
+
+    def test_percentile(self):
+        """Percentiles use the nearest rank."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([], 50) == 0.0
+
+    def test_run_case(self):
+        """A case reports throughput, latency and memory."""
+        result = run_case('analyze', 0.5, min_iterations=3, min_seconds=0, warmup=0)
+
+        assert result['name'] == 'analyze[0.5p]'
+        assert result['iterations'] >= 3
+        assert result['ops_per_sec'] > 0
+        assert result['p50_ms'] <= result['p99_ms']
+
+    @pytest.mark.skipif(not hasattr(signal, 'SIGKILL'), reason="needs SIGKILL")
+    def test_isolated_case_killed(self):
+        """A case whose process is killed (as by the OOM killer) is reported, not waited on."""
+        def kill_children():
+            for child in multiprocessing.active_children():
+                os.kill(child.pid, signal.SIGKILL)
+
+        killer = threading.Timer(3.0, kill_children)
+        killer.start()
+        try:
+            result = run_isolated('analyze', 0.5, min_iterations=10 ** 9, min_seconds=600, warmup=0)
+        finally:
+            killer.cancel()
+
+        assert result['name'] == 'analyze[0.5p]'
+        assert 'without a result' in result['error']
+
+    def test_isolated_case_timeout(self):
+        """A case that runs past its timeout is stopped and reported as failed."""
+        result = run_isolated('analyze', 0.5, timeout=0.5, min_iterations=10 ** 9, min_seconds=600, warmup=0)
+
+        assert 'did not finish' in result['error']
+
+    def test_json_report(self, tmp_path, capsys):
+        """The command line writes a JSON report."""
+        output = tmp_path / 'report.json'
+        status = main(['--entry', 'match_score', '--pages', '0.5', '--min-iterations', '2',
+                       '--min-seconds', '0', '--no-isolate', '--output', str(output)])
+
+        report = json.loads(output.read_text())
+        assert status == 0
+        assert [result['name'] for result in report['results']] == ['match_score[0.5p]']
+        assert 'match_score[0.5p]' in capsys.readouterr().out
@@ -0,0 +1,163 @@
+"""
+Unit tests for the pluggable cache backends.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.cache_backends import (
+    FakeRedis, RedisCacheBackend, create_cache_backend, deserialize, serialize
+)
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.result_cache import AnalysisCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingRedis(FakeRedis):
+    """FakeRedis that counts round trips."""
+
+    def __init__(self):
+        super().__init__()
+        self.round_trips = 0
+
+    def mget(self, names):
+        self.round_trips += 1
+        return super().mget(names)
+
+    def pipeline(self, transaction=True):
+        pipe = super().pipeline(transaction)
+        execute = pipe.execute
+
+        def counted_execute():
+            self.round_trips += 1
+            return execute()
+
+        pipe.execute = counted_execute
+        return pipe
+
+
+class BrokenRedis:
+    """Client whose every call fails, like an unreachable server."""
+
+    def __getattr__(self, name):
+        def fail(*args, **kwargs):
+            raise ConnectionError("connection refused")
+        return fail
+
+
+class TestSerialization:
+    """Test suite for the cache entry encoding."""
+
+    def test_round_trip(self):
+        """Small and large values survive serialization."""
+        small = {'scores': {'overall_score': 80}, 'skills': ['Python']}
+        large = {'text': 'python developer ' * 500}
+
+        assert deserialize(serialize(small)) == small
+        assert deserialize(serialize(large)) == large
+
+    def test_large_values_are_compressed(self):
+        """Repetitive payloads are stored compressed."""
+        value = 'python developer ' * 500
+        assert len(serialize(value)) < len(value) // 10
+
+    def test_unknown_format_rejected(self):
+        """Data without a known format byte is rejected."""
+        with pytest.raises(ValueError):
+            deserialize(b'?garbage')
+
+
+class TestRedisCacheBackend:
+    """Test suite for RedisCacheBackend against the in-memory fake."""
+
+    def test_entries_shared_between_replicas(self):
+        """A value written by one backend is a hit for another on the same server."""
+        server = FakeRedis()
+        first = RedisCacheBackend(client=server)
+        second = RedisCacheBackend(client=server)
+
+        first.set('key', {'value': 1})
+
+        assert second.get('key') == {'value': 1}
+        assert second.stats()['hits'] == 1
+
+    def test_ttl_expiry(self):
+        """Entries expire after the configured TTL."""
+        clock = FakeClock()
+        cache = RedisCacheBackend(client=FakeRedis(clock=clock), ttl_seconds=5)
+        cache.set('key', 'text')
+
+        clock.now = 4
+        assert cache.get('key') == 'text'
+        clock.now = 5
+        assert cache.get('key') is None
+
+    def test_batch_operations_use_one_round_trip(self):
+        """get_many and set_many each cost a single round trip."""
+        server = CountingRedis()
+        cache = RedisCacheBackend(client=server)
+
+        cache.set_many({f'k{i}': i for i in range(10)})
+        values = cache.get_many([f'k{i}' for i in range(12)])
+
+        assert values == list(range(10)) + [None, None]
+        assert server.round_trips == 2
+
+    def test_namespaces_are_isolated(self):
+        """Clearing one namespace leaves the others untouched."""
+        server = FakeRedis()
+        analysis = RedisCacheBackend(client=server, namespace='analysis')
+        text = RedisCacheBackend(client=server, namespace='text')
+        analysis.set('key', 1)
+        text.set('key', 2)
+
+        analysis.clear()
+
+        assert analysis.get('key') is None
+        assert text.get('key') == 2
+
+    def test_server_errors_are_misses(self):
+        """An unreachable server degrades to cache misses."""
+        cache = RedisCacheBackend(client=BrokenRedis())
+        cache.set('key', 1)
+
+        assert cache.get('key') is None
+        assert cache.stats()['errors'] == 2
+
+
+class TestBackendSelection:
+    """Test suite for create_cache_backend and analyzer integration."""
+
+    def test_factory(self):
+        """The factory honours the requested backend."""
+        assert create_cache_backend(backend='none') is None
+        assert isinstance(create_cache_backend(backend='memory'), AnalysisCache)
+        assert isinstance(create_cache_backend(backend='fake'), RedisCacheBackend)
+
+    def test_analyzer_results_shared(self, sample_resume_text):
+        """An analysis on one replica is served from the shared cache on another."""
+        server = FakeRedis()
+        first = ResumeAnalyzer(cache=RedisCacheBackend(client=server))
+        second = ResumeAnalyzer(cache=RedisCacheBackend(client=server))
+
+        expected = first.analyze(sample_resume_text, include_features=True)
+        result = second.analyze(sample_resume_text, include_features=True)
+
+        assert result == expected
+        assert second.cache.stats()['hits'] == 1
+        assert second.analyze(sample_resume_text) == ResumeAnalyzer().analyze(sample_resume_text)
@@ -0,0 +1,129 @@
+"""
+Unit tests for fuzzy skill matching.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.config import skills_config
+from backend.fuzzy_matcher import FuzzySkillIndex, allowed_distance, osa_distance
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.skill_matcher import SkillMatcher
+from backend.tokenizer import TOKEN_PATTERN
+
+
+def _damage(word, rng):
+    """Apply up to two random edits to word."""
+    chars = list(word)
+    for _ in range(rng.randint(1, 2)):
+        index = rng.randrange(len(chars))
+        operation = rng.choice('dist')
+        if operation == 'd' and len(chars) > 1:
+            del chars[index]
+        elif operation == 'i':
+            chars.insert(index, rng.choice('abcdefghijklmnopqrstuvwxyz'))
+        elif operation == 's':
+            chars[index] = rng.choice('abcdefghijklmnopqrstuvwxyz')
+        elif index + 1 < len(chars):
+            chars[index], chars[index + 1] = chars[index + 1], chars[index]
+    return ''.join(chars)
+
+
+class TestOsaDistance:
+    """Test suite for the edit distance."""
+
+    def test_distances(self):
+        """Insertions, deletions, substitutions and transpositions cost one edit."""
+        assert osa_distance('python', 'python', 2) == 0
+        assert osa_distance('python', 'pyton', 2) == 1
+        assert osa_distance('python', 'pythno', 2) == 1
+        assert osa_distance('python', 'pithon', 2) == 1
+        assert osa_distance('kubernetes', 'kuberentse', 2) == 2
+
+    def test_bounded(self):
+        """Distances past the bound are reported as bound + 1."""
+        assert osa_distance('python', 'java', 1) == 2
+        assert osa_distance('communication', 'commission', 2) == 3
+
+
+class TestFuzzySkillIndex:
+    """Test suite for FuzzySkillIndex."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.index = FuzzySkillIndex.from_matcher(SkillMatcher.from_config(skills_config))
+
+    def _search(self, text):
+        return {match.skill: match for match in self.index.search(TOKEN_PATTERN.findall(text))}
+
+    def test_lookup_agrees_with_exhaustive_comparison(self):
+        """The deletion index finds exactly the keys a pairwise comparison would."""
+        rng = random.Random(7)
+        keys = list(self.index._keys)
+        for _ in range(2000):
+            candidate = _damage(rng.choice(keys), rng)
+            expected = {
+                (key, osa_distance(candidate, key, allowed_distance(key))) for key in keys
+                if osa_distance(candidate, key, allowed_distance(key)) <= allowed_distance(key)
+            }
+            assert set(self.index.lookup(candidate)) == expected
+
+    def test_split_words_are_rejoined(self):
+        """Tokens broken apart by extraction are matched with high confidence."""
+        found = self._search("deployed kubernete s clusters with pyth on")
+
+        assert found['kubernetes'].text == 'kubernete s'
+        assert found['kubernetes'].distance == 0
+        assert found['python'].confidence > 0.9
+
+    def test_misspellings_within_distance(self):
+        """Misspelled multi-word and long terms are matched."""
+        found = self._search("machine learnin and communicaton")
+
+        assert found['machine learning'].distance == 1
+        assert found['communication'].distance == 1
+
+    def test_short_terms_are_not_fuzzy(self):
+        """Short skills are left to exact matching."""
+        found = self._search("jav gp rst")
+
+        assert not found
+
+    def test_exact_matches_are_excluded(self):
+        """Skills already found exactly are not reported again."""
+        tokens = TOKEN_PATTERN.findall("kubernetes and kubernete s")
+
+        assert self.index.search(tokens, {'technical': ['kubernetes']}) == []
+
+
+class TestFuzzyAnalysis:
+    """Test suite for fuzzy mode in ResumeAnalyzer."""
+
+    def test_fuzzy_mode_recovers_skills(self):
+        """Confident fuzzy matches count as skills and every match is reported."""
+        text = "Engineer with experience in Kubernete s, Pyth on and Postgrsql. Strong communicaton."
+        exact = ResumeAnalyzer(fuzzy=False).analyze(text)
+        fuzzy = ResumeAnalyzer(fuzzy=True).analyze(text)
+
+        assert 'fuzzy_matches' not in exact
+        assert exact['technical_skills'] == []
+        assert fuzzy['technical_skills'] == ['Kubernetes', 'Postgresql', 'Python']
+        assert fuzzy['soft_skills'] == ['Communication']
+        assert {match['skill'] for match in fuzzy['fuzzy_matches']} >= {'kubernetes', 'python'}
+
+    def test_low_confidence_matches_are_not_counted(self):
+        """Matches below the confidence threshold are reported only."""
+        analyzer = ResumeAnalyzer(fuzzy=True, fuzzy_min_confidence=0.99)
+        result = analyzer.analyze("Engineer who wrote Kubernete s operators")
+
+        assert result['technical_skills'] == []
+        assert result['fuzzy_matches'][0]['skill'] == 'kubernetes'
+
+    def test_fuzzy_mode_changes_cache_key(self):
+        """Results of the two modes are cached separately."""
+        assert ResumeAnalyzer(fuzzy=True).cache_fingerprint() != ResumeAnalyzer(fuzzy=False).cache_fingerprint()
@@ -0,0 +1,103 @@
+"""
+Tests for incremental re-analysis of edited resume text.
+"""
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend.incremental_analysis import IncrementalAnalysis, split_paragraphs
+from backend.resume_analyzer import ResumeAnalyzer
+from benchmarks.corpus import generate_resume
+
+
+class TestSplitParagraphs:
+    """Test suite for split_paragraphs."""
+
+    def test_round_trip(self, sample_resume_text):
+        """Paragraphs join back into the text and end at whitespace."""
+        paragraphs = split_paragraphs(sample_resume_text)
+
+        assert ''.join(paragraphs) == sample_resume_text
+        assert len(paragraphs) > 1
+        assert all(paragraph[-1].isspace() for paragraph in paragraphs[:-1])
+
+    def test_no_blank_lines(self):
+        """Text without blank lines is one paragraph."""
+        assert split_paragraphs("one\ntwo") == ["one\ntwo"]
+        assert split_paragraphs("") == []
+
+
+class TestIncrementalAnalysis:
+    """Test suite for IncrementalAnalysis."""
+
+    @pytest.mark.parametrize('fuzzy', [False, True])
+    def test_edits_match_analyze(self, sample_resume_text, fuzzy):
+        """Every version gives the result analyze() gives."""
+        analyzer = ResumeAnalyzer(fuzzy=fuzzy)
+        incremental = IncrementalAnalysis(analyzer)
+        versions = [
+            sample_resume_text,
+            sample_resume_text.replace('Python', 'Pyton'),
+            sample_resume_text + "\n\nContact: jane@example.com\n",
+            "Skills: machine\n\nlearning, Docker\n\n" + sample_resume_text,
+            generate_resume(2, pages=2),
+        ]
+
+        for text in versions:
+            assert dict(incremental.analyze(text)) == dict(analyzer.analyze_compact(text))
+
+    def test_only_changed_paragraphs_extracted(self):
+        """An edit re-extracts the paragraphs it touches and nothing else."""
+        incremental = IncrementalAnalysis(ResumeAnalyzer())
+        paragraphs = split_paragraphs(generate_resume(3, pages=2))
+        incremental.analyze(''.join(paragraphs))
+        assert incremental.last_extracted == len(set(paragraphs))
+
+        paragraphs[2] = paragraphs[2].replace(' ', ' Kubernetes ', 1)
+        incremental.analyze(''.join(paragraphs))
+
+        assert incremental.last_extracted == 1
+        assert incremental.last_reused == len(paragraphs) - 1
+
+    def test_term_across_paragraphs(self):
+        """Terms that run across a paragraph break are found by the junction rescan."""
+        analyzer = ResumeAnalyzer(fuzzy=False)
+        incremental = IncrementalAnalysis(analyzer)
+        incremental.analyze("Skills: machine\n\nlearning")
+        text = "Skills: machine\n\nlearning\n\nand more"
+
+        result = incremental.analyze(text)
+
+        assert result['technical_skills'] == analyzer.analyze_compact(text)['technical_skills']
+
+    def test_truncation_and_empty_text(self, sample_resume_text):
+        """Limits and empty input behave as in analyze()."""
+        analyzer = ResumeAnalyzer(max_chars=300)
+        incremental = IncrementalAnalysis(analyzer)
+
+        assert dict(incremental.analyze(sample_resume_text)) == dict(analyzer.analyze_compact(sample_resume_text))
+        assert dict(incremental.analyze('  \n\n ')) == dict(analyzer.analyze_compact('  \n\n '))
+        # The text past a whitespace-only prefix still counts as input
+        short = ResumeAnalyzer(max_chars=1)
+        assert dict(IncrementalAnalysis(short).analyze('\n java python')) == dict(
+            short.analyze_compact('\n java python')
+        )
+        with pytest.raises(ValueError):
+            incremental.analyze(None)
+
+    def test_taxonomy_reload_discards_records(self, sample_resume_text):
+        """Records matched against a replaced taxonomy are not reused."""
+        analyzer = ResumeAnalyzer()
+        incremental = IncrementalAnalysis(analyzer)
+        incremental.analyze(sample_resume_text)
+
+        analyzer.reload_taxonomy(matcher=analyzer.matcher)
+        incremental.analyze(sample_resume_text)
+
+        assert incremental.last_reused == 0
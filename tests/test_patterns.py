@@ -0,0 +1,52 @@
+"""
+Tests for the compiled pattern registry.
+"""
+import random
+import re
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend import resume_analyzer
+from backend.patterns import CONTACT_DETECTORS, PATTERNS, contains_email, detect_contact
+
+
+class TestPatternRegistry:
+    """Test suite for backend.patterns."""
+
+    def test_patterns_compiled_once(self):
+        """Registry entries are compiled patterns shared with the modules that use them."""
+        from backend.section_segmenter import HEADING_WORD_PATTERN
+        from backend.tokenizer import TOKEN_PATTERN
+
+        assert all(isinstance(pattern, re.Pattern) for pattern in PATTERNS.values())
+        assert PATTERNS['token'] is TOKEN_PATTERN
+        assert PATTERNS['heading_word'] is HEADING_WORD_PATTERN
+        assert resume_analyzer.contains_email is contains_email
+
+    def test_detect_contact_matches_reference_regexes(self):
+        """Each contact signal agrees with the regex it is documented by."""
+        reference = {
+            'has_email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'),
+            'has_phone': re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),
+            'has_linkedin': re.compile(r'linkedin\.com', re.IGNORECASE),
+        }
+        rng = random.Random(23)
+        alphabet = 'aZ1.-@ _linkedcom5'
+        texts = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 30))) for _ in range(5000)]
+        texts += ['me@linkedin.com', 'a@5551234567.com', 'call 555.123.4567', 'LinkedIn.COM/in/x']
+
+        for text in texts:
+            expected = {signal: bool(pattern.search(text)) for signal, pattern in reference.items()}
+            assert detect_contact(text) == expected, repr(text)
+
+    def test_analyzer_uses_registry(self, sample_resume_text):
+        """The analyzer's contact check is the registry's."""
+        analyzer = resume_analyzer.ResumeAnalyzer()
+
+        assert analyzer._extract_contact_info(sample_resume_text) == detect_contact(sample_resume_text)
+        assert set(detect_contact('')) == set(CONTACT_DETECTORS)
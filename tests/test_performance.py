@@ -0,0 +1,60 @@
+"""
+Performance regression gate.
+
+Skipped unless pytest runs with --perf. Re-baseline after an intended
+performance change with: python -m benchmarks.gate --rebaseline
+"""
+import json
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from benchmarks import gate
+
+
+class TestCompare:
+    """Test suite for baseline comparison."""
+
+    def test_flags_regressions_past_threshold(self):
+        """Only cases slower than threshold x baseline regress."""
+        rows = gate.compare({'a': 3.0, 'b': 1.1, 'c': 5.0}, {'a': 1.0, 'b': 1.0}, threshold=2.0)
+
+        assert [(row['name'], row['regressed']) for row in rows] == [('a', True), ('b', False)]
+        assert rows[0]['ratio'] == 3.0
+
+    def test_baseline_round_trip(self, tmp_path):
+        """A written baseline loads back; other versions are refused."""
+        path = tmp_path / 'baseline.json'
+        measurement = {'calibration_ms': {'x': 1.0}, 'latencies_ms': {'x': 2.5}, 'cases': {'x': 2.5}}
+        gate.write_baseline(measurement, str(path))
+
+        assert gate.load_baseline(str(path))['cases'] == {'x': 2.5}
+
+        data = json.loads(path.read_text())
+        data['version'] = gate.BASELINE_VERSION + 1
+        path.write_text(json.dumps(data))
+        with pytest.raises(ValueError):
+            gate.load_baseline(str(path))
+
+    def test_committed_baseline_covers_tracked_cases(self):
+        """The committed baseline has an entry for every tracked case."""
+        baseline = gate.load_baseline()
+
+        for entry_point, pages in gate.TRACKED_CASES:
+            assert baseline['cases'][f"{entry_point}[{pages:g}p]"] > 0
+
+
+@pytest.mark.perf
+def test_no_performance_regression(request):
+    """Tracked benchmarks stay within the threshold of the committed baseline."""
+    threshold = request.config.getoption("--perf-threshold") or gate.DEFAULT_THRESHOLD
+    rows = gate.check(threshold)
+
+    regressions = [row for row in rows if row['regressed']]
+    assert not regressions, "\n" + gate.format_rows(rows, threshold)
@@ -0,0 +1,89 @@
+"""
+Unit tests for stage timing instrumentation.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend import profiling
+from backend.profiling import LatencyHistogram, bucket_index, bucket_upper_bound
+from backend.resume_analyzer import ResumeAnalyzer
+
+
+class TestLatencyHistogram:
+    """Test suite for the log-bucketed histogram."""
+
+    def test_buckets_are_contiguous(self):
+        """Every duration falls into the first bucket whose upper bound covers it."""
+        rng = random.Random(3)
+        for _ in range(5000):
+            nanoseconds = rng.randrange(10 ** rng.randrange(1, 12))
+            index = bucket_index(nanoseconds)
+            assert bucket_upper_bound(index) >= nanoseconds
+            assert index == 0 or bucket_upper_bound(index - 1) < nanoseconds
+
+    def test_percentiles_within_bucket_error(self):
+        """Percentiles are within 25% of the exact value."""
+        histogram = LatencyHistogram()
+        for nanoseconds in range(1000, 101000, 100):
+            histogram.record(nanoseconds)
+
+        assert histogram.count == 1000
+        assert histogram.min_ns == 1000 and histogram.max_ns == 100900
+        assert 50900 <= histogram.percentile(50) <= 50900 * 1.25
+        assert 99900 <= histogram.percentile(99) <= 100900
+
+
+class TestProfiling:
+    """Test suite for stage timing."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        profiling.reset()
+
+    def teardown_method(self):
+        """Cleanup after each test method."""
+        profiling.enable(False)
+        profiling.reset()
+
+    def test_disabled_records_nothing(self, sample_resume_text):
+        """With profiling off, stages are no-ops."""
+        profiling.enable(False)
+        ResumeAnalyzer().analyze(sample_resume_text)
+
+        assert profiling.snapshot() == {}
+
+    def test_analyze_stages(self, sample_resume_text):
+        """Every stage of analyze() is timed once per analysis."""
+        profiling.enable()
+        analyzer = ResumeAnalyzer()
+        analyzer.analyze(sample_resume_text)
+        analyzer.analyze(sample_resume_text + " ")
+
+        stages = profiling.snapshot('analyze.')
+        assert set(stages) == {
+            'analyze.total', 'analyze.clean', 'analyze.tokenize', 'analyze.sections',
+            'analyze.skills', 'analyze.contact', 'analyze.scoring',
+            'analyze.recommendations', 'analyze.result'
+        }
+        assert all(summary['count'] == 2 for summary in stages.values())
+        assert stages['analyze.total']['total_ms'] >= stages['analyze.skills']['total_ms']
+
+    def test_failing_stage_is_timed(self):
+        """Stages that raise are recorded and the exception propagates."""
+        profiling.enable()
+
+        @profiling.timed('test.fails')
+        def fails():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            fails()
+        assert profiling.snapshot()['test.fails']['count'] == 1
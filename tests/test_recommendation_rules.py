@@ -0,0 +1,84 @@
+"""
+Unit tests for the recommendation decision table.
+"""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.analysis_context import FeatureRecord
+from backend.batch_scoring import feature_matrix, score_dicts, score_matrix
+from backend.recommendation_rules import (
+    DEFAULT_TABLE, MAX_RECOMMENDATIONS, RECOMMENDATION_RULES, SECTION_NAMES, DecisionTable, Rule, feature_row
+)
+
+
+def random_record(rng: random.Random) -> FeatureRecord:
+    return FeatureRecord(
+        word_count=rng.choice([0, 50, 150, 250, 450, 700, 950, 1500]),
+        technical_skills=[f'skill{i}' for i in range(rng.randint(0, 12))],
+        soft_skills=[f'soft{i}' for i in range(rng.randint(0, 5))],
+        action_verb_count=rng.randint(0, 15),
+        quantified_count=rng.randint(0, 6),
+        sections=[name for name in SECTION_NAMES if rng.random() < 0.5],
+        has_email=rng.random() < 0.5,
+        has_phone=rng.random() < 0.5,
+        has_linkedin=rng.random() < 0.5,
+        has_dates=rng.random() < 0.5
+    )
+
+
+class TestDecisionTable:
+    """Test suite for DecisionTable."""
+
+    def test_shared_conditions_compile_to_one_predicate(self):
+        """Each distinct condition is evaluated once, however many rules use it."""
+        conditions = {condition for rule in RECOMMENDATION_RULES for condition in rule.when}
+
+        assert len(DEFAULT_TABLE.predicates) == len(conditions)
+
+    def test_rules_fire_in_order_up_to_limit(self):
+        """Fired rules are returned in rule order and capped."""
+        table = DecisionTable([
+            Rule('low', ['word_count < 100'], 'short'),
+            Rule('always', [], 'always'),
+            Rule('missing', ['missing_recommended_sections > 0'], 'add {missing_sections}'),
+        ], limit=2)
+        row = feature_row(random_record(random.Random(0)), {})
+        row.update(word_count=10, has_section_experience=0, has_section_education=1, has_section_skills=0)
+
+        assert table.evaluate(row) == ['short', 'always']
+        row['word_count'] = 500
+        assert table.evaluate(row) == ['always', 'add Experience, Skills']
+
+    def test_invalid_rules_rejected(self):
+        """Malformed conditions and unknown placeholders fail at compile time."""
+        with pytest.raises(ValueError):
+            DecisionTable([Rule('bad', ['word_count ~ 3'], 'x')])
+        with pytest.raises(ValueError):
+            DecisionTable([Rule('bad', ['word_count < 3'], 'missing {nothing}')])
+
+    def test_batch_matches_single(self):
+        """The vectorized table returns exactly what the scalar one does."""
+        rng = random.Random(7)
+        records = [random_record(rng) for _ in range(500)]
+        features = feature_matrix(records)
+        scores = score_matrix(features)
+
+        batch = DEFAULT_TABLE.evaluate_batch(features, scores)
+
+        for record, record_scores, recommendations in zip(records, score_dicts(scores), batch):
+            assert recommendations == DEFAULT_TABLE.evaluate(feature_row(record, record_scores))
+            assert 1 <= len(recommendations) <= MAX_RECOMMENDATIONS
+
+    def test_empty_batch(self):
+        """A batch without rows yields no recommendations."""
+        features = feature_matrix([])
+
+        assert DEFAULT_TABLE.evaluate_batch(features, score_matrix(features)) == []
@@ -0,0 +1,126 @@
+"""
+Unit tests for the analysis result cache.
+"""
+import sys
+import threading
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.config import ScoringConfig
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.result_cache import AnalysisCache, make_cache_key
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAnalysisCache:
+    """Test suite for AnalysisCache."""
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when the cache is full."""
+        cache = AnalysisCache(max_entries=2, ttl_seconds=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.stats()['evictions'] == 1
+
+    def test_ttl_expiry(self):
+        """Entries expire after the configured TTL."""
+        clock = FakeClock()
+        cache = AnalysisCache(max_entries=10, ttl_seconds=5, clock=clock)
+        cache.set('key', {'value': 1})
+
+        clock.now = 4
+        assert cache.get('key') == {'value': 1}
+        clock.now = 5
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_hit_and_miss_counters(self):
+        """Hits and misses are counted."""
+        cache = AnalysisCache(max_entries=10, ttl_seconds=60)
+        cache.get('missing')
+        cache.set('present', 1)
+        cache.get('present')
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_values_are_copied(self):
+        """Mutating a returned value does not change the cached entry."""
+        cache = AnalysisCache(max_entries=10, ttl_seconds=60)
+        cache.set('key', {'items': [1]})
+        cache.get('key')['items'].append(2)
+
+        assert cache.get('key') == {'items': [1]}
+
+    def test_thread_safety(self):
+        """Concurrent access keeps the cache bounded and the counters consistent."""
+        cache = AnalysisCache(max_entries=50, ttl_seconds=60)
+
+        def worker(offset):
+            for i in range(500):
+                cache.set(f'{offset}-{i % 80}', i)
+                cache.get(f'{offset}-{(i * 7) % 80}')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert stats['size'] <= 50
+        assert stats['hits'] + stats['misses'] == 2000
+
+
+class TestAnalyzerCaching:
+    """Test suite for the cache in front of ResumeAnalyzer.analyze."""
+
+    def test_repeat_analysis_is_a_hit(self, sample_resume_text):
+        """Re-submitting the same resume is served from the cache."""
+        analyzer = ResumeAnalyzer(cache=AnalysisCache(max_entries=10, ttl_seconds=60))
+
+        first = analyzer.analyze(sample_resume_text)
+        second = analyzer.analyze("  " + sample_resume_text.replace("\n", "\n\n"))
+
+        assert first == second
+        assert analyzer.cache.stats()['hits'] == 1
+        assert first == ResumeAnalyzer().analyze(sample_resume_text)
+
+    def test_features_served_from_cache(self, sample_resume_text):
+        """A cached result can answer requests with and without features."""
+        analyzer = ResumeAnalyzer(cache=AnalysisCache(max_entries=10, ttl_seconds=60))
+
+        assert 'features' not in analyzer.analyze(sample_resume_text)
+        assert analyzer.analyze(sample_resume_text, include_features=True)['features']
+
+    def test_key_depends_on_scoring_config(self, sample_resume_text):
+        """Changing the scoring configuration changes the cache key."""
+        class TunedConfig(ScoringConfig):
+            MISSING_PHONE_PENALTY = 40
+
+        analyzer = ResumeAnalyzer()
+        before = make_cache_key(sample_resume_text, analyzer.cache_fingerprint())
+        analyzer.scoring_config = TunedConfig
+
+        assert make_cache_key(sample_resume_text, analyzer.cache_fingerprint()) != before
@@ -109,4 +109,118 @@ class TestResumeAnalyzer:
         assert result["word_count"] > 50
         
         # Should provide recommendations
-        assert len(result["recommendations"]) > 0
\ No newline at end of file
+        assert len(result["recommendations"]) > 0
+
+class TestAnalysisContext:
+    """Test suite for the per-call analysis context."""
+    
+    def test_features_are_computed_once(self, sample_resume_text, monkeypatch):
+        """Scoring and recommendations reuse the features extracted by analyze()."""
+        analyzer = ResumeAnalyzer()
+        calls = []
+        original_scan = analyzer.matcher.scan
+        
+        def counting_scan(tokens):
+            calls.append(tokens)
+            return original_scan(tokens)
+        
+        monkeypatch.setattr(analyzer.matcher, 'scan', counting_scan)
+        analyzer.analyze(sample_resume_text)
+        
+        assert len(calls) == 1
+    
+    def test_context_memoizes_features(self, sample_resume_text):
+        """Derived features are cached on the context after first access."""
+        from backend.analysis_context import AnalysisContext
+        
+        context = AnalysisContext(ResumeAnalyzer(), sample_resume_text)
+        
+        assert context.word_count == len(context.clean_text.split())
+        assert context.skills is context.skills
+        assert context.sections is context.sections
+        assert context.has_dates
+
+
+class TestAnalyzeMany:
+    """Test suite for batch analysis."""
+    
+    def test_results_in_input_order(self, sample_resume_text, minimal_resume_text):
+        """Batch results line up with the inputs and match single analysis."""
+        analyzer = ResumeAnalyzer()
+        texts = [sample_resume_text, minimal_resume_text, "", sample_resume_text]
+        
+        results = analyzer.analyze_many(texts, workers=2)
+        
+        assert len(results) == len(texts)
+        for text, result in zip(texts, results):
+            expected = analyzer.analyze(text)
+            assert result['scores'] == expected['scores']
+            assert result['technical_skills'] == expected['technical_skills']
+    
+    def test_item_errors_do_not_abort_batch(self, sample_resume_text):
+        """Invalid items are reported in place while the rest still succeed."""
+        analyzer = ResumeAnalyzer()
+        
+        results = analyzer.analyze_many([sample_resume_text, None, sample_resume_text], workers=2)
+        
+        assert isinstance(results[1], ValueError)
+        assert results[0]['scores'] == results[2]['scores']
+    
+    def test_single_worker_runs_inline(self, sample_resume_text):
+        """A single worker analyzes in-process with the same error handling."""
+        analyzer = ResumeAnalyzer()
+        
+        results = analyzer.analyze_many([sample_resume_text, 42], workers=1)
+        
+        assert 'scores' in results[0]
+        assert isinstance(results[1], ValueError)
+
+
+class TestRescore:
+    """Test suite for re-scoring from stored feature records."""
+    
+    def test_rescore_matches_analyze(self, sample_resume_text, minimal_resume_text):
+        """Scores and recommendations can be rebuilt from the feature record alone."""
+        analyzer = ResumeAnalyzer()
+        for text in (sample_resume_text, minimal_resume_text, "Python developer"):
+            result = analyzer.analyze(text, include_features=True)
+            
+            rescored = analyzer.rescore(result['features'])
+            
+            assert rescored['scores'] == result['scores']
+            assert rescored['recommendations'] == result['recommendations']
+    
+    def test_feature_record_round_trip(self, sample_resume_text):
+        """Feature records survive a JSON round trip."""
+        import json
+        from backend.analysis_context import FeatureRecord
+        
+        features = ResumeAnalyzer().analyze(sample_resume_text, include_features=True)['features']
+        
+        assert FeatureRecord.from_dict(json.loads(json.dumps(features))).to_dict() == features
+    
+    def test_rescore_with_new_config(self, sample_resume_text):
+        """A different ScoringConfig changes the scores without re-analyzing text."""
+        from backend.config import ScoringConfig
+        
+        class StrictConfig(ScoringConfig):
+            MISSING_DATES_PENALTY = 50
+            ESSENTIAL_SECTIONS = ['Experience', 'Education', 'Skills', 'Certifications']
+        
+        analyzer = ResumeAnalyzer()
+        features = analyzer.analyze(sample_resume_text, include_features=True)['features']
+        
+        default = analyzer.rescore(features)['scores']
+        strict = analyzer.rescore(features, StrictConfig)['scores']
+        
+        assert strict['ats_compatibility'] < default['ats_compatibility']
+    
+    def test_rescore_many_matches_rescore(self, sample_resume_text, minimal_resume_text):
+        """Batch re-scoring returns the same results as one-by-one re-scoring."""
+        analyzer = ResumeAnalyzer()
+        records = [
+            analyzer.analyze(text, include_features=True)['features']
+            for text in (sample_resume_text, "", minimal_resume_text)
+        ]
+        
+        assert analyzer.rescore_many(records) == [analyzer.rescore(r) for r in records]
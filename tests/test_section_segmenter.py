@@ -0,0 +1,105 @@
+"""
+Unit tests for the section segmenter.
+"""
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.section_segmenter import HEADER_SECTION, classify_heading, segment_sections
+
+
+class TestClassifyHeading:
+    """Test suite for heading detection."""
+
+    def test_headings(self):
+        """Short, heading-styled lines naming a section are headings."""
+        assert classify_heading("EXPERIENCE") == 'Experience'
+        assert classify_heading("  Professional Experience:\n") == 'Experience'
+        assert classify_heading("TECHNICAL SKILLS") == 'Skills'
+        assert classify_heading("Education") == 'Education'
+        assert classify_heading("Honors & Awards") == 'Achievements'
+
+    def test_content_lines(self):
+        """Bullets, sentences and long lines are content, even if they mention a section."""
+        assert classify_heading("• Led work on the payments platform") is None
+        assert classify_heading("Strong work ethic.") is None
+        assert classify_heading("Bachelor of Science in Computer Science | University of Technology") is None
+        assert classify_heading("My career started at a small startup in Berlin") is None
+        assert classify_heading("") is None
+
+
+class TestSegmentSections:
+    """Test suite for segment_sections."""
+
+    def test_spans_cover_text(self, sample_resume_text):
+        """Spans are contiguous, ordered and cover the whole text."""
+        spans = segment_sections(sample_resume_text)
+
+        assert spans[0].start == 0
+        assert spans[-1].end == len(sample_resume_text)
+        for previous, current in zip(spans, spans[1:]):
+            assert previous.end == current.start
+
+    def test_sections_in_order(self, sample_resume_text):
+        """Headings are recognized in document order."""
+        sections = [section for section, _, _ in segment_sections(sample_resume_text)]
+
+        assert sections == [HEADER_SECTION, 'Summary', 'Experience', 'Education', 'Skills', 'Skills']
+
+    def test_span_offsets(self):
+        """Spans point at their heading and body in the original text."""
+        text = "Jane Roe\nSKILLS\nPython, SQL\nEXPERIENCE\nBuilt things\n"
+        header, skills, experience = segment_sections(text)
+
+        assert text[skills.start:skills.end] == "SKILLS\nPython, SQL\n"
+        assert skills.body(text) == "Python, SQL\n"
+        assert skills.heading == 'SKILLS'
+        assert experience.body(text) == "Built things\n"
+        assert header.body(text) == "Jane Roe\n"
+
+    def test_no_headings(self):
+        """Text without headings is a single header span; blank text has none."""
+        assert [tuple(span) for span in segment_sections("just some text")] == [(HEADER_SECTION, 0, 14)]
+        assert segment_sections("   \n") == []
+
+
+class TestSectionFeatures:
+    """Test suite for section-scoped feature extraction."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.analyzer = ResumeAnalyzer()
+
+    def test_skills_per_section(self, sample_resume_text):
+        """Skills used in Experience are told apart from skills listed under Skills."""
+        sections = {
+            features['heading']: features
+            for features in self.analyzer.analyze_sections(sample_resume_text)
+        }
+
+        assert 'Docker' in sections['EXPERIENCE']['technical_skills']
+        assert 'Django' not in sections['EXPERIENCE']['technical_skills']
+        assert 'Django' in sections['TECHNICAL SKILLS']['technical_skills']
+        assert sections['EXPERIENCE']['action_verbs'][:2] == ['developed', 'led']
+        assert sections['SOFT SKILLS']['soft_skills'] == ['Collaboration', 'Communication', 'Leadership', 'Problem Solving']
+
+    def test_only_requested_sections_are_scanned(self, sample_resume_text, monkeypatch):
+        """Detectors run on the requested spans only."""
+        scanned = []
+        original = self.analyzer.matcher.scan
+
+        def counting_scan(tokens):
+            scanned.append(''.join(tokens))
+            return original(tokens)
+
+        monkeypatch.setattr(self.analyzer.matcher, 'scan', counting_scan)
+        results = self.analyzer.analyze_sections(sample_resume_text, sections=['Experience'])
+
+        assert [features['section'] for features in results] == ['Experience']
+        assert len(scanned) == 1
+        assert 'django' not in scanned[0]
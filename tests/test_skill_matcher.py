@@ -0,0 +1,139 @@
+"""
+Unit tests for the compiled skill matcher.
+"""
+import json
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.config import skills_config
+from backend.skill_matcher import SkillMatcher, aliases_within, load_aliases
+from backend.skill_taxonomy import load_configured_aliases
+
+
+class TestSkillMatcher:
+    """Test suite for SkillMatcher."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.matcher = SkillMatcher.from_config(skills_config)
+
+    def test_finds_all_categories_in_one_scan(self):
+        """Technical skills, soft skills and action verbs come out of a single call."""
+        found = self.matcher.find("led a python team with strong communication and machine learning")
+
+        assert 'python' in found['technical']
+        assert 'machine learning' in found['technical']
+        assert 'communication' in found['soft']
+        assert found['action_verbs'] == ['led']
+
+    def test_word_boundaries(self):
+        """Terms inside longer words are not matched."""
+        found = self.matcher.find("javascripting gopher reduced")
+
+        assert 'javascript' not in found['technical']
+        assert 'go' not in found['technical']
+        assert found['action_verbs'] == ['reduced']
+
+    def test_matches_regex_semantics(self):
+        """Results agree with the per-term regex search the analyzer used before."""
+        terms = ['c++', 'c#', 'node.js', 'r', 'machine learning']
+        matcher = SkillMatcher({'technical': terms})
+        texts = [
+            "c++ and c# with node.js",
+            "c++11 r-lang node.jsx",
+            "machine  learning machine learning",
+            "r",
+        ]
+        for text in texts:
+            expected = {t for t in terms if re.search(rf'\b{re.escape(t)}\b', text)}
+            assert set(matcher.find(text)['technical']) == expected
+
+    def test_term_count(self):
+        """Every configured term is compiled into the matcher."""
+        expected = (
+            len(skills_config.TECHNICAL_SKILLS)
+            + len(skills_config.SOFT_SKILLS)
+            + len(skills_config.ACTION_VERBS)
+        )
+        assert len(self.matcher) == expected
+
+
+class TestSkillAliases:
+    """Test suite for alias resolution."""
+
+    def setup_method(self):
+        """Setup for each test method."""
+        self.matcher = SkillMatcher.from_config(skills_config, load_configured_aliases())
+
+    def test_aliases_resolve_to_canonical_terms(self):
+        """Variant spellings are reported under their canonical skill."""
+        found = self.matcher.find("deployed k8s clusters on google cloud with postgres, nodejs and sklearn")
+
+        assert found['technical'] == ['kubernetes', 'gcp', 'postgresql', 'node.js', 'scikit-learn']
+
+    def test_variants_are_counted_once(self):
+        """A skill written several ways is found once."""
+        found = self.matcher.find("gcp and google cloud platform, golang and go")
+
+        assert found['technical'] == ['gcp', 'go']
+
+    def test_aliases_keep_word_boundaries(self):
+        """Aliases follow the same boundary rules as terms."""
+        found = self.matcher.find("k8sx mlops html5")
+
+        assert found['technical'] == ['html']
+
+    def test_unknown_category_rejected(self):
+        """Aliases must target a configured category."""
+        with pytest.raises(ValueError):
+            SkillMatcher({'technical': ['python']}, {'tools': {'vim': ['vi']}})
+
+    def test_unknown_canonical_rejected(self):
+        """Aliases add spellings of configured skills, never new skills."""
+        with pytest.raises(ValueError):
+            SkillMatcher({'technical': ['python']}, {'technical': {'rust': ['rustlang']}})
+
+        # Every canonical term of the shipped alias index is a configured skill
+        configured = {
+            'technical': skills_config.TECHNICAL_SKILLS,
+            'soft': skills_config.SOFT_SKILLS,
+            'action_verbs': skills_config.ACTION_VERBS,
+        }
+        for category, canonical_terms in load_configured_aliases().items():
+            assert set(canonical_terms) <= configured[category]
+
+    def test_aliases_within(self):
+        """A shared alias index is narrowed to the skills a custom taxonomy has."""
+        categories = {'technical': ['python'], 'soft': [], 'action_verbs': []}
+        aliases = aliases_within(categories, load_configured_aliases())
+
+        assert aliases['technical'] == {'python': ['python3']}
+        assert SkillMatcher(categories, aliases).find('python3 and k8s')['technical'] == ['python']
+
+    def test_no_ambiguous_short_aliases(self):
+        """Units and other common abbreviations are not read as skills."""
+        found = self.matcher.find("mixed 500 ml of buffer; ml engineer")
+
+        assert 'machine learning' not in found['technical']
+
+    def test_load_aliases(self, tmp_path):
+        """Alias files are lower-cased and validated on load."""
+        path = tmp_path / 'aliases.json'
+        path.write_text(json.dumps({'aliases': {'technical': {'Kubernetes': ['K8s']}}}))
+        assert load_aliases(str(path)) == {'technical': {'kubernetes': ['k8s']}}
+
+        path.write_text(json.dumps({'aliases': {'technical': {'kubernetes': 'k8s'}}}))
+        with pytest.raises(ValueError):
+            load_aliases(str(path))
+
+    def test_fingerprint_tracks_aliases(self):
+        """Adding an alias changes the matcher fingerprint."""
+        assert self.matcher.fingerprint != SkillMatcher.from_config(skills_config).fingerprint
@@ -0,0 +1,207 @@
+"""
+Unit tests for the compiled skill taxonomy artifact.
+"""
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.config import skills_config
+from backend.result_cache import AnalysisCache
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.skill_matcher import SkillMatcher
+from backend.skill_taxonomy import (
+    MappedSkillMatcher, TaxonomyWatcher, load_configured_aliases, load_skill_matcher, load_taxonomy_file,
+    main, write_taxonomy
+)
+
+CATEGORIES = {
+    'technical': skills_config.TECHNICAL_SKILLS,
+    'soft': skills_config.SOFT_SKILLS,
+    'action_verbs': skills_config.ACTION_VERBS,
+}
+
+TEXTS = [
+    "python developer with c++ and c# experience, node.js apis",
+    "led machine learning and data analysis, problem solving and time management",
+    "go go-lang pythonic java/javascript aws,gcp;azure r & sql",
+    "k8s on google cloud with postgres and sklearn",
+    "",
+]
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    path = tmp_path / 'skills.bin'
+    write_taxonomy(CATEGORIES, str(path), version='test-1', aliases=load_configured_aliases())
+    return str(path)
+
+
+class TestMappedSkillMatcher:
+    """Test suite for MappedSkillMatcher."""
+
+    def test_matches_dict_matcher(self, artifact):
+        """The mapped matcher finds exactly what the in-memory trie finds."""
+        mapped = MappedSkillMatcher(artifact)
+        matcher = SkillMatcher(CATEGORIES, load_configured_aliases())
+
+        for text in TEXTS:
+            assert mapped.find(text) == matcher.find(text)
+        assert len(mapped) == len(matcher)
+
+    def test_metadata(self, artifact):
+        """Version label and checksum are read from the header."""
+        mapped = MappedSkillMatcher(artifact)
+
+        assert mapped.version == 'test-1'
+        assert mapped.categories == ('technical', 'soft', 'action_verbs')
+        assert mapped.verify()
+
+    def test_rejects_foreign_files(self, tmp_path, artifact):
+        """Files with a wrong magic, format version or size are rejected."""
+        data = Path(artifact).read_bytes()
+        cases = {
+            'magic.bin': b'XXXX' + data[4:],
+            'version.bin': data[:4] + b'\x63\x00' + data[6:],
+            'truncated.bin': data[:-3],
+        }
+        for name, content in cases.items():
+            path = tmp_path / name
+            path.write_bytes(content)
+            with pytest.raises(ValueError):
+                MappedSkillMatcher(str(path))
+
+    def test_pickle_remaps(self, artifact):
+        """Pickling sends the path, not the mapped data, to worker processes."""
+        mapped = MappedSkillMatcher(artifact)
+        clone = pickle.loads(pickle.dumps(mapped))
+
+        assert len(pickle.dumps(mapped)) < 200
+        assert clone.find(TEXTS[0]) == mapped.find(TEXTS[0])
+
+
+class TestLoading:
+    """Test suite for loading the configured taxonomy."""
+
+    def test_missing_artifact_falls_back(self, tmp_path):
+        """A missing artifact falls back to compiling SkillsConfig."""
+        assert isinstance(load_skill_matcher(str(tmp_path / 'missing.bin')), SkillMatcher)
+        assert isinstance(load_skill_matcher(''), SkillMatcher)
+
+    def test_analyzer_with_mapped_taxonomy(self, artifact, sample_resume_text):
+        """Analysis is unchanged when the taxonomy comes from the artifact."""
+        analyzer = ResumeAnalyzer(matcher=load_skill_matcher(artifact))
+
+        assert isinstance(analyzer.matcher, MappedSkillMatcher)
+        assert analyzer.analyze(sample_resume_text) == ResumeAnalyzer().analyze(sample_resume_text)
+
+    def test_build_command(self, tmp_path, capsys):
+        """The build command writes a loadable artifact."""
+        output = tmp_path / 'built.bin'
+
+        assert main(['build', '--output', str(output), '--version', '2024.1']) == 0
+        assert MappedSkillMatcher(str(output)).version == '2024.1'
+        assert 'sha256' in capsys.readouterr().out
+
+
+class TestHotReload:
+    """Test suite for swapping the taxonomy of a running analyzer."""
+
+    def write_source(self, path, technical):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'technical': technical, 'soft': ['teamwork'], 'action_verbs': ['led']}, f)
+
+    def test_load_json_source(self, tmp_path):
+        """A JSON source file is compiled; one without the required categories is rejected."""
+        source = tmp_path / 'skills.json'
+        self.write_source(source, ['python'])
+        assert load_taxonomy_file(str(source)).find('python and rust')['technical'] == ['python']
+        # Only the aliases of skills the source has are applied
+        found = load_taxonomy_file(str(source)).find('python3 on k8s, team player')
+        assert found['technical'] == ['python']
+        assert found['soft'] == ['teamwork']
+
+        source.write_text(json.dumps({'technical': ['python']}))
+        with pytest.raises(ValueError):
+            load_taxonomy_file(str(source))
+
+    def test_reload_swaps_taxonomy_and_invalidates_cache(self, tmp_path):
+        """After a reload, new analyses and cache keys use the new taxonomy."""
+        source = tmp_path / 'skills.json'
+        self.write_source(source, ['python'])
+        analyzer = ResumeAnalyzer(cache=AnalysisCache(), matcher=load_taxonomy_file(str(source)))
+        text = "Led a team writing Python and Rust services"
+        fingerprint = analyzer.cache_fingerprint()
+        assert analyzer.analyze(text)['technical_skills'] == ['Python']
+
+        self.write_source(source, ['python', 'rust'])
+        version = analyzer.reload_taxonomy(str(source))
+
+        assert version == analyzer.taxonomy_version
+        assert analyzer.cache_fingerprint() != fingerprint
+        assert analyzer.analyze(text)['technical_skills'] == ['Python', 'Rust']
+
+    def test_in_flight_analysis_keeps_its_taxonomy(self, tmp_path, sample_resume_text):
+        """An analysis that started before a reload finishes on the old taxonomy."""
+        analyzer = ResumeAnalyzer()
+        expected = analyzer.analyze(sample_resume_text)['technical_skills']
+        source = tmp_path / 'skills.json'
+        self.write_source(source, ['cobol'])
+        original_format = analyzer._format_skills
+
+        def reload_midway(*args):
+            # Runs between skill matching and result assembly
+            analyzer.reload_taxonomy(str(source))
+            return original_format(*args)
+
+        analyzer._format_skills = reload_midway
+        assert analyzer.analyze(sample_resume_text)['technical_skills'] == expected
+        del analyzer._format_skills
+        assert analyzer.analyze(sample_resume_text)['technical_skills'] != expected
+
+    def test_failed_reload_keeps_taxonomy(self, tmp_path):
+        """An invalid file raises and leaves the current taxonomy in place."""
+        analyzer = ResumeAnalyzer()
+        index = analyzer.skill_index
+        broken = tmp_path / 'broken.json'
+        broken.write_text('{not json')
+
+        with pytest.raises(ValueError):
+            analyzer.reload_taxonomy(str(broken))
+        assert analyzer.skill_index is index
+
+    def test_watcher_reloads_on_change(self, artifact):
+        """The watcher reloads once per change of the file."""
+        reloads = []
+        watcher = TaxonomyWatcher(artifact, reloads.append, interval=60)
+        assert not watcher.check()
+
+        write_taxonomy(CATEGORIES, artifact, version='test-2')
+        # Same size, and possibly the same inode and timestamp on a coarse clock
+        os.utime(artifact, ns=(0, 0))
+        assert watcher.check()
+        assert not watcher.check()
+        assert reloads == [artifact]
+
+    def test_watcher_thread(self, artifact):
+        """A started watcher reloads an analyzer in the background."""
+        analyzer = ResumeAnalyzer(matcher=load_skill_matcher(artifact))
+        watcher = TaxonomyWatcher(artifact, analyzer.reload_taxonomy, interval=0.01).start()
+        try:
+            write_taxonomy(CATEGORIES, artifact, version='test-2')
+            os.utime(artifact, ns=(0, 0))
+            for _ in range(500):
+                if analyzer.taxonomy_version == 'test-2':
+                    break
+                watcher._stopped.wait(0.01)
+        finally:
+            watcher.stop()
+        assert analyzer.taxonomy_version == 'test-2'
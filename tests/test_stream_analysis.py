@@ -0,0 +1,143 @@
+"""
+Tests for streaming analysis: results over chunked input equal analyze().
+"""
+import random
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend.pdf_extractor import extract_text_from_pdf, iter_pdf_pages
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.stream_analysis import StreamingAnalysis
+from benchmarks.corpus import generate_resume, render_pdf
+
+
+def random_chunks(text: str, rng: random.Random, max_size: int = 80):
+    position = 0
+    while position < len(text):
+        size = rng.randint(0, max_size)
+        yield text[position:position + size]
+        position += size
+
+
+def final_result(analyzer: ResumeAnalyzer, chunks):
+    result = None
+    for result in analyzer.analyze_stream(chunks):
+        pass
+    return result
+
+
+class TestStreamingAnalysis:
+    """Test suite for ResumeAnalyzer.analyze_stream."""
+
+    @pytest.mark.parametrize('fuzzy', [False, True])
+    def test_random_chunking_matches_analyze(self, sample_resume_text, fuzzy):
+        """However the text is chunked, the final result equals analyze()."""
+        analyzer = ResumeAnalyzer(fuzzy=fuzzy)
+        rng = random.Random(11)
+        texts = [sample_resume_text] + [generate_resume(seed) for seed in range(5)]
+
+        for text in texts:
+            expected = analyzer.analyze_compact(text)
+            for _ in range(3):
+                assert dict(final_result(analyzer, random_chunks(text, rng))) == dict(expected)
+
+    def test_single_character_chunks(self, minimal_resume_text):
+        """Chunks may split every word and every skill term."""
+        analyzer = ResumeAnalyzer()
+
+        assert dict(final_result(analyzer, iter(minimal_resume_text))) == dict(
+            analyzer.analyze_compact(minimal_resume_text)
+        )
+
+    def test_term_split_across_chunks(self):
+        """A multi-word skill split between chunks is still found."""
+        analyzer = ResumeAnalyzer(fuzzy=False)
+        text = "Skills: machine learning and Python"
+        expected = analyzer.analyze_compact(text)
+
+        result = final_result(analyzer, ["Skills: machine", " learn", "ing and Python"])
+
+        assert 'Machine Learning' in expected['technical_skills']
+        assert result['technical_skills'] == expected['technical_skills']
+
+    def test_partial_results_per_chunk(self, sample_resume_text):
+        """One partial result is yielded per chunk, then the final one."""
+        analyzer = ResumeAnalyzer()
+        chunks = sample_resume_text.split('\n\n')
+
+        results = list(analyzer.analyze_stream(chunks))
+
+        assert len(results) == len(chunks) + 1
+        assert results[-1]['word_count'] >= results[0]['word_count']
+
+    def test_empty_stream(self):
+        """A stream without text gives the empty result."""
+        analyzer = ResumeAnalyzer()
+
+        assert dict(final_result(analyzer, [])) == dict(analyzer.analyze_compact(''))
+        assert dict(final_result(analyzer, ['', '  \n'])) == dict(analyzer.analyze_compact('  \n'))
+
+    def test_truncation(self, sample_resume_text):
+        """Streams longer than max_chars are cut exactly like analyze() cuts them."""
+        analyzer = ResumeAnalyzer(max_chars=300)
+        expected = analyzer.analyze_compact(sample_resume_text)
+
+        result = final_result(analyzer, random_chunks(sample_resume_text, random.Random(3)))
+
+        assert expected['warnings']
+        assert dict(result) == dict(expected)
+
+    @pytest.mark.parametrize('max_chars', [1, 12, 30, 75])
+    def test_truncation_random_chunking(self, sample_resume_text, max_chars):
+        """The cut matches analyze() even when the last break before it was settled earlier."""
+        analyzer = ResumeAnalyzer(max_chars=max_chars, fuzzy=False)
+        rng = random.Random(max_chars)
+        texts = [
+            sample_resume_text,
+            '\n     \t cd \n\n java\t\n\n  cdpython ab    ',
+            ''.join(rng.choice(['java', 'cd', 'python', ' ', '\n', '\t', 'ab']) for _ in range(40)),
+        ]
+        for text in texts:
+            expected = analyzer.analyze_compact(text)
+            for _ in range(60):
+                result = final_result(analyzer, random_chunks(text, rng, max_size=12))
+                assert dict(result) == dict(expected)
+
+        chunks = ['\n     \t cd \n\n java\t\n\n  cdpyth', 'on ab    ']
+        result = final_result(ResumeAnalyzer(max_chars=30), chunks)
+        assert result['word_count'] == 2
+        assert result['word_frequency'] == {'java': 1}
+
+    def test_finished_stream_rejects_input(self):
+        """Feeding a finished stream or a non-string chunk is an error."""
+        stream = StreamingAnalysis(ResumeAnalyzer())
+        with pytest.raises(ValueError):
+            stream.feed(b'bytes')
+        stream.finish()
+        with pytest.raises(ValueError):
+            stream.feed('more')
+
+
+class TestPdfPages:
+    """Test suite for pdf_extractor.iter_pdf_pages."""
+
+    def test_pages_join_to_extracted_text(self):
+        """Joined pages equal the text extract_text_from_pdf returns."""
+        data = render_pdf(generate_resume(4, pages=3))
+
+        pages = list(iter_pdf_pages(data))
+
+        assert len(pages) > 1
+        assert ''.join(pages).strip() == extract_text_from_pdf(data)
+
+    def test_invalid_pdf(self):
+        """Invalid data raises ValueError before any page is yielded."""
+        with pytest.raises(ValueError):
+            next(iter_pdf_pages(b'not a pdf'))
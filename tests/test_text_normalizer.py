@@ -0,0 +1,55 @@
+"""
+Unit tests for the text normalization module.
+"""
+import re
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.text_normalizer import normalize_match_text, normalize_resume_text
+
+SAMPLES = [
+    "",
+    "   ",
+    "  Hello  World!!!  @#$%  ",
+    "John.Doe@Email.com | (555) 123-4567\n\n\tC++ / C# & Node.JS: 40%+",
+    "Naïve café résumé • Ünïcödé — ΟΔΟΣ İstanbul K  x\x1cy",
+    "ﬁnance ² ٣ _under_score_",
+]
+
+
+def _regex_resume(text):
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'[^\w\s.,@()\-+#&/:]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip().lower()
+
+
+def _regex_match(text):
+    text = text.lower()
+    text = re.sub(r'[^a-z0-9\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def test_resume_normalization_matches_regex_chain():
+    """Resume normalization is identical to the former regex substitutions."""
+    for text in SAMPLES:
+        assert normalize_resume_text(text) == _regex_resume(text)
+
+
+def test_match_normalization_matches_regex_chain():
+    """Keyword normalization is identical to the former regex substitutions."""
+    for text in SAMPLES:
+        assert normalize_match_text(text) == _regex_match(text)
+
+
+def test_every_character_class():
+    """Each code point in the Basic Multilingual Plane is handled like the regex does."""
+    text = ''.join(chr(code) for code in range(0xD800)) + ''.join(chr(code) for code in range(0xE000, 0x10000))
+    assert normalize_resume_text(text) == _regex_resume(text)
+    assert normalize_match_text(text) == _regex_match(text)
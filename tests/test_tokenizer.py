@@ -0,0 +1,60 @@
+"""
+Unit tests for the tokenizer stage.
+"""
+import re
+import sys
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from backend.tokenizer import SECTION_KEYWORDS, TokenStream, scan_tokens
+
+
+class TestTokenStream:
+    """Test suite for TokenStream."""
+
+    def test_tokens_cover_text(self):
+        """Tokens and offsets reconstruct the original text."""
+        stream = TokenStream("led 5+ teams, node.js & c++")
+
+        assert ''.join(stream.tokens) == stream.text
+        for offset, token in zip(stream.offsets, stream.tokens):
+            assert stream.text[offset:offset + len(token)] == token
+
+    def test_word_count(self):
+        """Word count matches str.split on cleaned text."""
+        for text in ("", "python", "python developer, 2019 - 2021"):
+            assert TokenStream(text).word_count == len(text.split())
+
+
+class TestScanTokens:
+    """Test suite for the single-pass token detectors."""
+
+    def test_matches_regex_detectors(self):
+        """Every detector agrees with the regex it replaces."""
+        texts = [
+            "increased revenue 40% and grew team 5+ people since 2019",
+            "unincreased reduced improvedreduced 12+ 3%% 20199 x2020",
+            "work experience, university degree, technical skills - about me",
+            "networking homework 1999_ 2021",
+        ]
+        for text in texts:
+            features = scan_tokens(TokenStream(text))
+
+            assert features.quantified_count == len(
+                re.findall(r'\d+%|\d+\+|increased|improved|reduced', text)
+            )
+            assert features.has_dates == bool(re.search(r'\b(19|20)\d{2}\b', text))
+            assert features.sections == [
+                section for section, keywords in SECTION_KEYWORDS.items()
+                if re.search(r'\b(' + '|'.join(keywords) + r')\b', text)
+            ]
+
+    def test_word_counts_skip_stopwords_and_short_words(self):
+        """Only alphabetic words longer than three letters are counted."""
+        features = scan_tokens(TokenStream("python python the resume api data2 django"))
+
+        assert features.word_counts == {'python': 2, 'django': 1}
@@ -0,0 +1,119 @@
+"""
+Tests for the word frequency stage: top-k selection, sketch counting and corpus counts.
+"""
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Ensure project root on sys.path for imports
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import pytest
+
+from backend.incremental_analysis import IncrementalAnalysis
+from backend.resume_analyzer import ResumeAnalyzer
+from backend.tokenizer import TokenStream, frequency_words, scan_tokens
+from backend.word_frequency import SketchCounter, WordCounter, WordFrequency, top_k
+from benchmarks.corpus import generate_resume
+
+
+class TestTopK:
+    """Test suite for top_k."""
+
+    def test_matches_most_common(self):
+        """Selection and tie order equal Counter.most_common."""
+        counts = {'alpha': 3, 'beta': 5, 'gamma': 3, 'delta': 1, 'epsilon': 5, 'zeta': 3}
+        for k in range(8):
+            assert list(top_k(counts, k).items()) == Counter(counts).most_common(k)
+
+    def test_frequency_words_match_token_pass(self, sample_resume_text):
+        """frequency_words counts the same words as scan_tokens."""
+        stream = TokenStream(sample_resume_text.lower())
+
+        assert Counter(frequency_words(stream.tokens)) == scan_tokens(stream).word_counts
+
+
+class TestAnalyzerWordFrequency:
+    """Test suite for word frequency in analysis results."""
+
+    def test_default_top_ten(self, sample_resume_text):
+        """The default result keeps the ten most frequent words."""
+        analyzer = ResumeAnalyzer()
+        stream = TokenStream(analyzer._clean_text(sample_resume_text))
+        expected = dict(Counter(scan_tokens(stream).word_counts).most_common(10))
+
+        assert analyzer.analyze(sample_resume_text)['word_frequency'] == expected
+
+    def test_configurable_top_k(self, sample_resume_text):
+        """top_k sets the number of reported words and is part of the cache key."""
+        analyzer = ResumeAnalyzer(frequency=WordFrequency(top_k=3))
+        default = ResumeAnalyzer()
+
+        result = analyzer.analyze(sample_resume_text)['word_frequency']
+        assert list(result.items()) == list(default.analyze(sample_resume_text)['word_frequency'].items())[:3]
+        assert analyzer.cache_fingerprint() != default.cache_fingerprint()
+
+    def test_sketch_estimates(self, sample_resume_text):
+        """Sketch counts never undercount and agree with exact counts on a wide sketch."""
+        exact = ResumeAnalyzer().analyze(sample_resume_text)['word_frequency']
+        sketched = ResumeAnalyzer(frequency=WordFrequency(sketch=True)).analyze(sample_resume_text)
+
+        assert sketched['word_frequency'] == exact
+
+        narrow = ResumeAnalyzer(frequency=WordFrequency(sketch=True, sketch_width=8, sketch_depth=2))
+        stream = TokenStream(narrow._clean_text(sample_resume_text))
+        counts = scan_tokens(stream).word_counts
+        for word, count in narrow.analyze(sample_resume_text)['word_frequency'].items():
+            assert count >= counts[word]
+
+    @pytest.mark.parametrize('sketch', [False, True])
+    def test_streaming_and_incremental_match(self, sample_resume_text, sketch):
+        """Streaming and incremental analysis report the same words as analyze()."""
+        analyzer = ResumeAnalyzer(frequency=WordFrequency(sketch=sketch))
+        expected = analyzer.analyze(sample_resume_text)['word_frequency']
+        chunks = [sample_resume_text[start:start + 37] for start in range(0, len(sample_resume_text), 37)]
+
+        *_, streamed = analyzer.analyze_stream(iter(chunks))
+
+        assert streamed.word_frequency == expected
+        assert IncrementalAnalysis(analyzer).analyze(sample_resume_text).word_frequency == expected
+
+
+class TestCounters:
+    """Test suite for mergeable word counters and corpus counts."""
+
+    @pytest.mark.parametrize('sketch', [False, True])
+    def test_batches_merge_to_one_pass(self, sketch):
+        """Counting a corpus in batches, or merging batch counters, equals one pass."""
+        analyzer = ResumeAnalyzer(frequency=WordFrequency(sketch=sketch))
+        texts = [generate_resume(seed) for seed in range(6)]
+
+        whole = analyzer.count_corpus_words(texts)
+        resumed = analyzer.count_corpus_words(texts[3:], analyzer.count_corpus_words(texts[:3]))
+        merged = analyzer.count_corpus_words(texts[:3])
+        merged.merge(analyzer.count_corpus_words(texts[3:]))
+
+        assert resumed.top(10) == whole.top(10)
+        assert merged.top(10) == whole.top(10)
+        assert len(whole.top(10)) == 10
+
+    def test_corpus_counts_exact(self):
+        """Exact corpus counts are the sums of per-resume counts."""
+        analyzer = ResumeAnalyzer()
+        texts = [generate_resume(seed) for seed in range(3)]
+        expected = Counter()
+        for text in texts:
+            expected.update(scan_tokens(TokenStream(analyzer._clean_text(text))).word_counts)
+
+        assert analyzer.count_corpus_words(texts).counts == expected
+
+    def test_merge_rejects_mismatch(self):
+        """Counters of a different kind or size cannot be merged."""
+        with pytest.raises(ValueError):
+            SketchCounter(64, 2).merge(SketchCounter(32, 2))
+        with pytest.raises(ValueError):
+            WordCounter().merge(SketchCounter())
+        with pytest.raises(ValueError):
+            ResumeAnalyzer().count_corpus_words([None])